@@ -47,6 +47,23 @@ def serialise_handler(args: Namespace) -> None:
             description=args.description,
             license=args.license,
             num_workers=args.num_workers,
+            validation_sample=args.validation_sample,
+            schema_dir=args.schema_dir,
+            offline=args.offline,
+            write_workers=args.write_workers,
+            format=args.format,
+            compression=args.compression,
+            api_batch_size=args.api_batch_size,
+            http2=args.http2,
+            gzip_requests=args.gzip_requests,
+            concurrency=args.concurrency,
+            max_retries=args.max_retries,
+            failed_items=args.failed_items,
+            retry_failed=args.retry_failed,
+            sync=args.sync,
+            manifest=args.manifest,
+            delete=args.delete,
+            mode=args.mode,
         )
     except ValidationError as e:
         logger.info(
@@ -114,6 +131,126 @@ def add_serialise_sub_command(sub_parser: _SubParsersAction) -> None:
         default=1,
         help="Number of threads to use for serialisation. If 1, serialisation will be done in a single thread.",
     )
+    serialiser_metadata.add_argument(
+        "--write_workers",
+        type=int,
+        required=False,
+        default=None,
+        help="Number of concurrent file writes when serialising to a local destination. Defaults to min(32, cpu count + 4).",
+    )
+
+    serialiser_metadata.add_argument(
+        "--format",
+        type=str,
+        choices=["json", "ndjson", "geoparquet"],
+        default="json",
+        help="Format of a local destination. json writes one file per item. ndjson writes the collection and a single items.ndjson file with one item per line, suitable for bulk loading. geoparquet writes the collection and a single stac-geoparquet items.parquet file for analytics, and requires the pyarrow package.",
+    )
+    serialiser_metadata.add_argument(
+        "--compression",
+        type=str,
+        choices=["gzip", "zstd"],
+        required=False,
+        default=None,
+        help="Compression of the ndjson items file (zstd requires the zstandard package) or codec of the geoparquet items file.",
+    )
+    serialiser_metadata.add_argument(
+        "--mode",
+        type=str,
+        choices=["overwrite", "append", "update"],
+        default="overwrite",
+        help="How an existing json collection at dst is written. overwrite regenerates every item. append only generates items whose id is not in the collection. update also regenerates items whose config changed. append and update only rewrite the generated items and the collection document.",
+    )
+
+    # STAC API metadata
+    api_metadata = parser.add_argument_group("STAC API metadata")
+    api_metadata.add_argument(
+        "--api_batch_size",
+        type=int,
+        required=False,
+        default=500,
+        help="Number of items per request when the STAC API destination provides the bulk items transaction endpoint.",
+    )
+    api_metadata.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use HTTP/2 when pushing to a STAC API. Requires the h2 package.",
+    )
+    api_metadata.add_argument(
+        "--gzip_requests",
+        action="store_true",
+        help="Gzip compress request bodies when pushing to a STAC API. The server must accept gzip encoded requests.",
+    )
+    api_metadata.add_argument(
+        "--concurrency",
+        type=int,
+        required=False,
+        default=8,
+        help="Maximum number of concurrent item requests to the STAC API.",
+    )
+    api_metadata.add_argument(
+        "--max_retries",
+        type=int,
+        required=False,
+        default=5,
+        help="Number of retries of requests answered with 429 or 5xx, with jittered exponential backoff respecting Retry-After.",
+    )
+    api_metadata.add_argument(
+        "--failed_items",
+        type=str,
+        required=False,
+        default=None,
+        help="Path of the json summary of items that could not be pushed to the STAC API.",
+    )
+    api_metadata.add_argument(
+        "--retry_failed",
+        type=str,
+        required=False,
+        default=None,
+        help="Path of a summary written with --failed_items. Only its failed items are pushed.",
+    )
+    api_metadata.add_argument(
+        "--sync",
+        type=str,
+        choices=["manifest", "remote"],
+        required=False,
+        default=None,
+        help="Only push new and changed items, compared by content hash with the hashes of the last push kept in a local manifest (manifest) or with the items read back from the STAC API (remote).",
+    )
+    api_metadata.add_argument(
+        "--manifest",
+        type=str,
+        required=False,
+        default=None,
+        help="Manifest file of --sync manifest. Defaults to a file per STAC API and collection under the cache directory.",
+    )
+    api_metadata.add_argument(
+        "--delete",
+        action="store_true",
+        help="With --sync, delete the items of the STAC API collection that are no longer generated.",
+    )
+
+    # Validation metadata
+    validation_metadata = parser.add_argument_group("Validation metadata")
+    validation_metadata.add_argument(
+        "--validation_sample",
+        type=float,
+        required=False,
+        default=1.0,
+        help="Fraction of items validated, between 0 and 1. Items with a structure not seen before are always validated.",
+    )
+    validation_metadata.add_argument(
+        "--schema_dir",
+        type=str,
+        required=False,
+        default=None,
+        help="Directory of cached STAC extension schemas. Defaults to STAC_GENERATOR_SCHEMA_DIR or ~/.cache/stac_generator/schemas.",
+    )
+    validation_metadata.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download schemas. Schemas missing from the schema directory are skipped with a warning.",
+    )
     parser.set_defaults(func=serialise_handler)
 
 
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
     from stac_pydantic.shared import Provider
 
+    from stac_generator.core.base.schema import COMPRESSION, OUTPUT_FORMAT, SYNC_MODE, WRITE_MODE
+
 
 def serialise_handler(
     id: str,
@@ -17,11 +19,34 @@ def serialise_handler(
     license: str | None = None,
     providers: list[Provider] | None = None,
     num_workers: int = 1,
+    validation_sample: float = 1.0,
+    schema_dir: str | None = None,
+    offline: bool = False,
+    write_workers: int | None = None,
+    format: OUTPUT_FORMAT = "json",
+    compression: COMPRESSION | None = None,
+    api_batch_size: int = 500,
+    http2: bool = False,
+    gzip_requests: bool = False,
+    concurrency: int = 8,
+    max_retries: int = 5,
+    failed_items: str | None = None,
+    retry_failed: str | None = None,
+    sync: SYNC_MODE | None = None,
+    manifest: str | None = None,
+    delete: bool = False,
+    mode: WRITE_MODE = "overwrite",
 ) -> None:
     from concurrent.futures import ProcessPoolExecutor
 
+    from stac_generator.core.base.api import read_failed_ids
     from stac_generator.core.base.generator import StacSerialiser
-    from stac_generator.core.base.schema import StacCollectionConfig
+    from stac_generator.core.base.schema import (
+        ApiConfig,
+        StacCollectionConfig,
+        ValidationConfig,
+        WriterConfig,
+    )
     from stac_generator.factory import StacGeneratorFactory
 
     collection_config = StacCollectionConfig(
@@ -31,6 +56,22 @@ def serialise_handler(
         license=license,
         providers=providers,
     )
+    validation = ValidationConfig(sample=validation_sample, schema_dir=schema_dir, offline=offline)
+    writer = WriterConfig(
+        max_workers=write_workers, format=format, compression=compression, mode=mode
+    )
+    api = ApiConfig(
+        batch_size=api_batch_size,
+        http2=http2,
+        gzip=gzip_requests,
+        concurrency=concurrency,
+        max_retries=max_retries,
+        failed_path=failed_items,
+        item_ids=read_failed_ids(retry_failed) if retry_failed else None,
+        sync=sync,
+        manifest_path=manifest,
+        delete=delete,
+    )
 
     # Generate
     if num_workers == 1:
@@ -38,9 +79,10 @@ def serialise_handler(
         generator = StacGeneratorFactory.get_collection_generator(
             source_configs=src,
             collection_config=collection_config,
+            validation=validation,
         )
         # Save
-        serialiser = StacSerialiser(generator, dst)
+        serialiser = StacSerialiser(generator, dst, writer=writer, api=api)
         serialiser()
     elif num_workers > 1:
         with ProcessPoolExecutor(max_workers=num_workers) as executor:
@@ -48,8 +90,9 @@ def serialise_handler(
                 source_configs=src,
                 collection_config=collection_config,
                 pool=executor,
+                validation=validation,
             )
-            serialiser = StacSerialiser(generator, dst)
+            serialiser = StacSerialiser(generator, dst, writer=writer, api=api)
             serialiser()
     else:
         raise ValueError(f"Invalid number of threads: {num_workers}. Must be greater than 0.")
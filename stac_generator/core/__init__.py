@@ -1,17 +1,34 @@
 from stac_generator.core.base import (
+    ApiConfig,
+    AsyncStacApiClient,
+    CatalogWriter,
     CollectionGenerator,
+    CollectionIndex,
     ItemGenerator,
+    ItemRecord,
     SourceConfig,
     StacCollectionConfig,
     StacSerialiser,
+    StacValidator,
+    ValidationConfig,
+    WriterConfig,
 )
+from stac_generator.core.datacube import DatacubeConfig, DatacubeGenerator, DatacubeOwnConfig
 from stac_generator.core.point import PointConfig, PointGenerator, PointOwnConfig
 from stac_generator.core.raster import RasterConfig, RasterGenerator, RasterOwnConfig
 from stac_generator.core.vector import VectorConfig, VectorGenerator, VectorOwnConfig
 
 __all__ = (
+    "ApiConfig",
+    "AsyncStacApiClient",
+    "CatalogWriter",
     "CollectionGenerator",
+    "CollectionIndex",
+    "DatacubeConfig",
+    "DatacubeGenerator",
+    "DatacubeOwnConfig",
     "ItemGenerator",
+    "ItemRecord",
     "PointConfig",
     "PointGenerator",
     "PointOwnConfig",
@@ -21,7 +38,10 @@ __all__ = (
     "SourceConfig",
     "StacCollectionConfig",
     "StacSerialiser",
+    "StacValidator",
+    "ValidationConfig",
     "VectorConfig",
     "VectorGenerator",
     "VectorOwnConfig",
+    "WriterConfig",
 )
@@ -1,10 +1,29 @@
+from stac_generator.core.base.api import AsyncStacApiClient
 from stac_generator.core.base.generator import CollectionGenerator, ItemGenerator, StacSerialiser
-from stac_generator.core.base.schema import SourceConfig, StacCollectionConfig
+from stac_generator.core.base.index import CollectionIndex
+from stac_generator.core.base.record import ItemRecord
+from stac_generator.core.base.schema import (
+    ApiConfig,
+    SourceConfig,
+    StacCollectionConfig,
+    ValidationConfig,
+    WriterConfig,
+)
+from stac_generator.core.base.validation import StacValidator
+from stac_generator.core.base.writer import CatalogWriter
 
 __all__ = (
+    "ApiConfig",
+    "AsyncStacApiClient",
+    "CatalogWriter",
     "CollectionGenerator",
+    "CollectionIndex",
     "ItemGenerator",
+    "ItemRecord",
     "SourceConfig",
     "StacCollectionConfig",
     "StacSerialiser",
+    "StacValidator",
+    "ValidationConfig",
+    "WriterConfig",
 )
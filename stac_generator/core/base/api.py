@@ -0,0 +1,611 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as pydatetime
+import email.utils
+import gzip
+import importlib.util
+import json
+import logging
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from stac_generator.core.base.schema import ApiConfig
+from stac_generator.core.base.sync import SyncManifest, default_manifest_path, item_hash
+from stac_generator.core.base.utils import parse_href
+from stac_generator.exceptions import StacApiException, StacConfigException
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Container, Iterable, Iterator
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+BULK_ITEMS_PATH = "/bulk_items"
+"""Path suffix of the Transactions extension's bulk items endpoint"""
+
+
+def gzip_request(request: httpx.Request) -> httpx.Request:
+    """Copy of a request with a gzip compressed body. Requests without a body or already encoded are returned as is"""
+    body = request.read()
+    if not body or "Content-Encoding" in request.headers:
+        return request
+    headers = httpx.Headers(request.headers)
+    headers["Content-Encoding"] = "gzip"
+    headers.pop("Content-Length", None)
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=headers,
+        content=gzip.compress(body),
+        extensions=request.extensions,
+    )
+
+
+class AsyncGzipRequestTransport(httpx.AsyncBaseTransport):
+    """Transport that gzip compresses request bodies before handing requests to a wrapped transport"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Constructor
+
+        Args:
+            transport (httpx.AsyncBaseTransport): transport sending the compressed requests
+        """
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Compress the body of a request and send it"""
+        return await self.transport.handle_async_request(gzip_request(request))
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport"""
+        await self.transport.aclose()
+
+
+def check_http2(config: ApiConfig) -> None:
+    """Raise if HTTP/2 is requested without the h2 package"""
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        raise StacConfigException(
+            "HTTP/2 requires the h2 package. Install it with `pip install httpx[http2]`."
+        )
+
+
+def service_desc_href(landing: dict[str, Any]) -> str | None:
+    """Href of the OpenAPI document linked from a landing page"""
+    return next(
+        (link["href"] for link in landing.get("links", []) if link.get("rel") == "service-desc"),
+        None,
+    )
+
+
+def conforms_to_bulk_items(landing: dict[str, Any]) -> bool:
+    """Whether a landing page lists a conformance class of bulk transactions"""
+    return any("bulk" in conformance for conformance in landing.get("conformsTo", []))
+
+
+def has_bulk_items_path(openapi: dict[str, Any]) -> bool:
+    """Whether an OpenAPI document describes the bulk items endpoint"""
+    return any(path.rstrip("/").endswith(BULK_ITEMS_PATH) for path in openapi.get("paths", {}))
+
+
+def bulk_items_body(batch: list[dict[str, Any]]) -> dict[str, Any]:
+    """Body of a bulk items request upserting a batch of items"""
+    return {"items": {item["id"]: item for item in batch}, "method": "upsert"}
+
+
+def is_retryable(response: httpx.Response) -> bool:
+    """Whether a response is worth retrying: rate limited or server error"""
+    return (
+        response.status_code == httpx.codes.TOO_MANY_REQUESTS
+        or response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+    )
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Delay in seconds requested by the `Retry-After` header of a response, given in seconds or as an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=pydatetime.UTC)
+    return max(0.0, (date - pydatetime.datetime.now(pydatetime.UTC)).total_seconds())
+
+
+def backoff_delay(attempt: int, config: ApiConfig, response: httpx.Response | None = None) -> float:
+    """Delay before retrying a request, using exponential backoff with full jitter.
+
+    Args:
+        attempt (int): number of attempts already failed, minus one
+        config (ApiConfig): api config providing the base and maximum delays
+        response (httpx.Response | None, optional): failed response. Defaults to None for transport errors.
+
+    Returns:
+        float: delay in seconds. At least the delay requested by the response's `Retry-After` header.
+    """
+    delay = random.uniform(0, min(config.max_backoff, config.backoff * 2**attempt))
+    requested = retry_after(response) if response is not None else None
+    return delay if requested is None else max(delay, requested)
+
+
+def batched(items: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Group items into lists of at most size items"""
+    batch: list[dict[str, Any]] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@dataclass
+class UploadSummary:
+    """Outcome of pushing the items of a collection to a STAC API"""
+
+    url: str
+    """STAC API landing page url"""
+    collection_id: str
+    """Collection id"""
+    sent: int = 0
+    """Number of items written"""
+    unchanged: int = 0
+    """Number of items skipped when syncing, since the API already holds them"""
+    deleted: int = 0
+    """Number of items deleted when syncing, since they are no longer generated"""
+    failed: dict[str, str] = field(default_factory=dict)
+    """Error of every item that could not be written or deleted, keyed by item id"""
+
+    def write(self, path: str | Path) -> None:
+        """Write the summary as json. The failed ids can be re-pushed with `ApiConfig.item_ids`"""
+        with Path(path).open("w") as file:
+            json.dump(
+                {
+                    "url": self.url,
+                    "collection": self.collection_id,
+                    "sent": self.sent,
+                    "unchanged": self.unchanged,
+                    "deleted": self.deleted,
+                    "failed": [
+                        {"id": item_id, "error": error} for item_id, error in self.failed.items()
+                    ],
+                },
+                file,
+                indent=2,
+            )
+
+
+def read_failed_ids(path: str | Path) -> list[str]:
+    """Ids of the failed items of a summary written by `UploadSummary.write`"""
+    with Path(path).open() as file:
+        return [failure["id"] for failure in json.load(file)["failed"]]
+
+
+class AsyncStacApiClient:
+    """Asynchronous client pushing collections and items to a STAC API implementing the Transactions extension.
+
+    Requests share one pooled `httpx.AsyncClient` allowing `ApiConfig.concurrency` connections. Requests answered with
+    429 or 5xx, or failing with a transport error, are retried with jittered exponential backoff respecting
+    `Retry-After`.
+    """
+
+    def __init__(
+        self, url: str, config: ApiConfig | None = None, client: httpx.AsyncClient | None = None
+    ) -> None:
+        """Constructor
+
+        Args:
+            url (str): STAC API landing page url
+            config (ApiConfig | None, optional): api config. Defaults to None, which uses default `ApiConfig` values.
+            client (httpx.AsyncClient | None, optional): client sending the requests. Defaults to a new pooled client described by config.
+
+        Raises:
+            StacConfigException: if HTTP/2 is requested and the h2 package is not installed
+        """
+        self.url = url
+        self.config = config if config is not None else ApiConfig()
+        if client is None:
+            check_http2(self.config)
+            limits = httpx.Limits(
+                max_connections=self.config.concurrency,
+                max_keepalive_connections=self.config.concurrency,
+            )
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+                http2=self.config.http2, limits=limits
+            )
+            if self.config.gzip:
+                transport = AsyncGzipRequestTransport(transport)
+            client = httpx.AsyncClient(
+                transport=transport, timeout=self.config.timeout, follow_redirects=True
+            )
+        self.client = client
+
+    async def __aenter__(self) -> AsyncStacApiClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections"""
+        await self.client.aclose()
+
+    async def request(
+        self, method: str, url: str, json: Any = None, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        """Send a request, retrying rate limited, server error and transport error responses.
+
+        Args:
+            method (str): request method
+            url (str): request url
+            json (Any, optional): json body. Defaults to None.
+            params (dict[str, Any] | None, optional): query parameters. Defaults to None.
+
+        Raises:
+            httpx.TransportError: if the last attempt fails with a transport error
+
+        Returns:
+            httpx.Response: first response not worth retrying, or the last response once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, json=json, params=params)
+            except httpx.TransportError as e:
+                if attempt >= self.config.max_retries:
+                    raise
+                delay = backoff_delay(attempt, self.config)
+                logger.debug(f"{method} {url} failed with {e!r}. Retrying in {delay:.2f}s")
+            else:
+                if not is_retryable(response) or attempt >= self.config.max_retries:
+                    return response
+                delay = backoff_delay(attempt, self.config, response)
+                logger.debug(
+                    f"{method} {url} answered {response.status_code}. Retrying in {delay:.2f}s"
+                )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def upsert(self, url: str, id: str, json: dict[str, Any]) -> None:
+        """POST a json object, then PUT it if it already exists.
+
+        Raises:
+            httpx.HTTPStatusError: if the final response is an error
+        """
+        response = await self.request("POST", url, json)
+        if response.status_code == httpx.codes.CONFLICT:
+            response = await self.request("PUT", f"{url}/{id}", json)
+        response.raise_for_status()
+
+    async def replace(self, url: str, id: str, json: dict[str, Any]) -> None:
+        """PUT a json object expected to exist, then POST it if it does not.
+
+        Raises:
+            httpx.HTTPStatusError: if the final response is an error
+        """
+        response = await self.request("PUT", f"{url}/{id}", json)
+        if response.status_code == httpx.codes.NOT_FOUND:
+            response = await self.request("POST", url, json)
+        response.raise_for_status()
+
+    async def delete(self, url: str) -> None:
+        """DELETE an object. Objects already missing are not an error
+
+        Raises:
+            httpx.HTTPStatusError: if the response is an error other than 404
+        """
+        response = await self.request("DELETE", url)
+        if response.status_code != httpx.codes.NOT_FOUND:
+            response.raise_for_status()
+
+    async def supports_bulk_items(self) -> bool:
+        """Whether the API provides the bulk items endpoint.
+
+        The endpoint is detected from a conformance class of the landing page mentioning bulk transactions, or from
+        the paths of the OpenAPI document linked as `service-desc`. `ApiConfig.bulk` overrides the detection.
+
+        Returns:
+            bool: whether items can be sent in bulk
+        """
+        if self.config.bulk is not None:
+            return self.config.bulk
+        try:
+            response = await self.request("GET", self.url)
+            response.raise_for_status()
+            landing = response.json()
+            if conforms_to_bulk_items(landing):
+                return True
+            service_desc = service_desc_href(landing)
+            if service_desc is None:
+                return False
+            response = await self.request("GET", service_desc)
+            response.raise_for_status()
+            return has_bulk_items_path(response.json())
+        except (httpx.HTTPError, ValueError, AttributeError) as e:
+            logger.debug(f"Unable to detect bulk items endpoint of {self.url}: {e}")
+            return False
+
+    async def write_collection(self, collection: dict[str, Any]) -> None:
+        """Create or update a collection.
+
+        Args:
+            collection (dict[str, Any]): STAC Collection as a dictionary
+        """
+        await self.upsert(parse_href(self.url, "collections"), collection["id"], collection)
+
+    async def _gather(
+        self,
+        batches: Iterator[list[dict[str, Any]]],
+        send: Callable[[list[dict[str, Any]]], Awaitable[None]],
+    ) -> tuple[int, dict[str, str]]:
+        """Send batches with up to `ApiConfig.concurrency` requests in flight.
+
+        Returns:
+            tuple[int, dict[str, str]]: number of items sent and error of every failed item
+        """
+        sent = 0
+        failed: dict[str, str] = {}
+
+        async def worker() -> None:
+            nonlocal sent
+            # Workers share the batch iterator, so items are only materialised as requests are sent
+            for batch in batches:
+                try:
+                    await send(batch)
+                except httpx.HTTPError as e:
+                    logger.warning(f"Request for {len(batch)} items failed: {e}")
+                    failed.update((item["id"], str(e)) for item in batch)
+                else:
+                    sent += len(batch)
+
+        await asyncio.gather(*(worker() for _ in range(self.config.concurrency)))
+        return sent, failed
+
+    async def write_items(
+        self,
+        collection_id: str,
+        items: Iterable[dict[str, Any]],
+        existing: Container[str] = (),
+    ) -> UploadSummary:
+        """Create or update the items of a collection with up to `ApiConfig.concurrency` requests in flight.
+
+        Items are sent in batches through the bulk items endpoint if available, otherwise one by one. Items whose
+        request still fails after retries are recorded in the summary instead of interrupting the upload.
+
+        Args:
+            collection_id (str): collection id
+            items (Iterable[dict[str, Any]]): STAC Items as dictionaries
+            existing (Container[str], optional): ids of items known to exist, which are replaced with a single PUT
+            instead of a POST followed by a PUT. Defaults to no items.
+
+        Returns:
+            UploadSummary: number of items written and errors of the failed items
+        """
+        if await self.supports_bulk_items():
+            url = parse_href(self.url, f"collections/{collection_id}/bulk_items")
+
+            async def send(batch: list[dict[str, Any]]) -> None:
+                logger.debug(f"Sending {len(batch)} items to {url}")
+                response = await self.request("POST", url, bulk_items_body(batch))
+                response.raise_for_status()
+
+            batches = batched(items, self.config.batch_size)
+        else:
+            url = parse_href(self.url, f"collections/{collection_id}/items")
+
+            async def send(batch: list[dict[str, Any]]) -> None:
+                item = batch[0]
+                if item["id"] in existing:
+                    await self.replace(url, item["id"], item)
+                else:
+                    await self.upsert(url, item["id"], item)
+
+            batches = batched(items, 1)
+        sent, failed = await self._gather(batches, send)
+        return UploadSummary(self.url, collection_id, sent=sent, failed=failed)
+
+    async def delete_items(self, collection_id: str, ids: Iterable[str]) -> UploadSummary:
+        """Delete items of a collection with up to `ApiConfig.concurrency` requests in flight.
+
+        Args:
+            collection_id (str): collection id
+            ids (Iterable[str]): ids of the deleted items
+
+        Returns:
+            UploadSummary: number of items deleted and errors of the failed items
+        """
+        url = parse_href(self.url, f"collections/{collection_id}/items")
+
+        async def send(batch: list[dict[str, Any]]) -> None:
+            await self.delete(f"{url}/{batch[0]['id']}")
+
+        deleted, failed = await self._gather(batched(({"id": item_id} for item_id in ids), 1), send)
+        return UploadSummary(self.url, collection_id, deleted=deleted, failed=failed)
+
+    async def read_collection_hash(self, collection_id: str) -> str | None:
+        """Content hash of a collection of the API. None if the collection does not exist"""
+        response = await self.request("GET", parse_href(self.url, f"collections/{collection_id}"))
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return None
+        response.raise_for_status()
+        return item_hash(response.json())
+
+    async def read_item_hashes(self, collection_id: str) -> dict[str, str]:
+        """Content hashes of the items of a collection of the API, keyed by item id.
+
+        Pages of `ApiConfig.page_size` items are read by following the `next` links of the item collection. As `next`
+        links are opaque tokens of the API, pages are read one after the other.
+
+        Args:
+            collection_id (str): collection id
+
+        Returns:
+            dict[str, str]: hash of every item. Empty if the collection does not exist
+        """
+        hashes: dict[str, str] = {}
+        method, url, body = "GET", parse_href(self.url, f"collections/{collection_id}/items"), None
+        params: dict[str, Any] | None = {"limit": self.config.page_size}
+        while True:
+            response = await self.request(method, url, body, params)
+            if response.status_code == httpx.codes.NOT_FOUND and not hashes:
+                return hashes
+            response.raise_for_status()
+            page = response.json()
+            features = page.get("features", [])
+            hashes.update((feature["id"], item_hash(feature)) for feature in features)
+            link = next((link for link in page.get("links", []) if link.get("rel") == "next"), None)
+            if link is None or not features:
+                return hashes
+            method, url, body = link.get("method", "GET"), link["href"], link.get("body")
+            # The next link carries the query of the following page
+            params = None
+
+
+async def apush_collection(
+    url: str,
+    collection: dict[str, Any],
+    items: Iterable[dict[str, Any]],
+    config: ApiConfig | None = None,
+) -> UploadSummary:
+    """Push a collection, then its items, to a STAC API.
+
+    Args:
+        url (str): STAC API landing page url
+        collection (dict[str, Any]): STAC Collection as a dictionary
+        items (Iterable[dict[str, Any]]): STAC Items as dictionaries
+        config (ApiConfig | None, optional): api config. Defaults to None, which uses default `ApiConfig` values.
+
+    Returns:
+        UploadSummary: number of items written and errors of the failed items
+    """
+    async with AsyncStacApiClient(url, config) as client:
+        await client.write_collection(collection)
+        return await client.write_items(collection["id"], items)
+
+
+async def async_sync_collection(
+    url: str,
+    collection: dict[str, Any],
+    items: Iterable[dict[str, Any]],
+    config: ApiConfig,
+) -> UploadSummary:
+    """Push the collection and the items that differ from the API's, as found by `ApiConfig.sync`.
+
+    Generated objects are compared by `item_hash` with the hashes of the last push (`manifest`) or of the objects read
+    back from the API (`remote`). The collection is only sent if changed. New items are created, changed items are
+    replaced, and items the API holds but that are no longer generated are deleted if `ApiConfig.delete` is set. The
+    manifest is updated with the hashes of the items the API holds once the push is done.
+
+    Args:
+        url (str): STAC API landing page url
+        collection (dict[str, Any]): STAC Collection as a dictionary
+        items (Iterable[dict[str, Any]]): STAC Items as dictionaries
+        config (ApiConfig): api config
+
+    Returns:
+        UploadSummary: number of items written, unchanged and deleted, and errors of the failed items
+    """
+    collection_id = collection["id"]
+    manifest_path = config.manifest_path or default_manifest_path(url, collection_id)
+    async with AsyncStacApiClient(url, config) as client:
+        if config.sync == "remote":
+            known = SyncManifest(
+                await client.read_collection_hash(collection_id),
+                await client.read_item_hashes(collection_id),
+            )
+        else:
+            known = SyncManifest.read(manifest_path)
+        current = SyncManifest(item_hash(collection), dict(known.items))
+        if current.collection != known.collection:
+            await client.write_collection(collection)
+        generated: set[str] = set()
+        unchanged = 0
+
+        def changed() -> Iterator[dict[str, Any]]:
+            nonlocal unchanged
+            for item in items:
+                digest = item_hash(item)
+                generated.add(item["id"])
+                current.items[item["id"]] = digest
+                if known.items.get(item["id"]) == digest:
+                    unchanged += 1
+                else:
+                    yield item
+
+        summary = await client.write_items(collection_id, changed(), existing=known.items)
+        summary.unchanged = unchanged
+        if config.delete and config.item_ids is None:
+            removed = [item_id for item_id in known.items if item_id not in generated]
+            deletion = await client.delete_items(collection_id, removed)
+            for item_id in set(removed) - deletion.failed.keys():
+                current.items.pop(item_id)
+            summary.deleted = deletion.deleted
+            summary.failed.update(deletion.failed)
+        # Items that failed are left as the API last held them, so the next sync retries them
+        for item_id in summary.failed:
+            if item_id in known.items:
+                current.items[item_id] = known.items[item_id]
+            else:
+                current.items.pop(item_id, None)
+    if config.sync == "manifest":
+        current.write(manifest_path)
+    return summary
+
+
+def push_collection(
+    url: str,
+    collection: dict[str, Any],
+    items: Iterable[dict[str, Any]],
+    config: ApiConfig | None = None,
+) -> UploadSummary:
+    """Push a collection, then its items, to a STAC API and report failed items.
+
+    Items listed by `ApiConfig.item_ids` are the only ones pushed if provided. With `ApiConfig.sync`, only the items
+    that differ from the API's are sent. The summary of failed items is written to `ApiConfig.failed_path` if provided.
+
+    Args:
+        url (str): STAC API landing page url
+        collection (dict[str, Any]): STAC Collection as a dictionary
+        items (Iterable[dict[str, Any]]): STAC Items as dictionaries
+        config (ApiConfig | None, optional): api config. Defaults to None, which uses default `ApiConfig` values.
+
+    Raises:
+        StacApiException: if some items could not be pushed
+
+    Returns:
+        UploadSummary: number of items written
+    """
+    config = config if config is not None else ApiConfig()
+    if config.item_ids is not None:
+        item_ids = set(config.item_ids)
+        items = (item for item in items if item["id"] in item_ids)
+    if config.sync is not None:
+        summary = asyncio.run(async_sync_collection(url, collection, items, config))
+    else:
+        summary = asyncio.run(apush_collection(url, collection, items, config))
+    if summary.failed:
+        message = f"{len(summary.failed)} items of collection {summary.collection_id} could not be pushed to {url}."
+        if config.failed_path is not None:
+            summary.write(config.failed_path)
+            message += f" Failed ids written to {config.failed_path}."
+        else:
+            message += f" Failed ids: {', '.join(summary.failed)}."
+        raise StacApiException(message)
+    return summary
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import urllib.parse
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from stac_generator.core.base.utils import cookie_header, is_remote
+from stac_generator.exceptions import SourceAssetException
+
+if TYPE_CHECKING:
+    from stac_generator.core.base.schema import SourceConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "STAC_GENERATOR_CACHE_DIR"
+"""Environment variable overriding the asset cache directory"""
+CACHE_SIZE_ENV = "STAC_GENERATOR_CACHE_SIZE"
+"""Environment variable overriding the asset cache size limit in bytes"""
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "stac_generator"
+"""Default asset cache directory"""
+DEFAULT_CACHE_SIZE = 2 * 1024**3
+"""Default asset cache size limit in bytes (2 GiB)"""
+CHUNK_SIZE = 1024**2
+"""Streaming download chunk size in bytes"""
+
+
+class AssetCache:
+    """Content-addressed on-disk cache of downloaded assets.
+
+    Downloaded bodies are stored once under `blobs/` keyed by their sha256 digest. Each request is recorded
+    under `refs/` with the digest of its response and the `ETag`/`Last-Modified` validators used for
+    revalidating the entry. Writes are atomic renames, so the cache can be shared by workers and across runs.
+    Blobs are evicted in least recently used order once the cache exceeds `max_size`.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Constructor
+
+        Args:
+            directory (str | Path): cache root directory
+            max_size (int, optional): cache size limit in bytes. Defaults to DEFAULT_CACHE_SIZE.
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.blobs = self.directory / "blobs"
+        self.refs = self.directory / "refs"
+        self.tmp = self.directory / "tmp"
+        for path in (self.blobs, self.refs, self.tmp):
+            path.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> AssetCache:
+        """Build the cache from `STAC_GENERATOR_CACHE_DIR` and `STAC_GENERATOR_CACHE_SIZE`"""
+        return cls(
+            os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR),
+            int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE)),
+        )
+
+    def _ref_path(self, key: str) -> Path:
+        return self.refs / f"{key}.json"
+
+    def lookup(self, key: str) -> tuple[Path, dict[str, Any]] | None:
+        """Cached blob and ref metadata for a request key. None if absent or evicted"""
+        try:
+            ref = json.loads(self._ref_path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        blob = self.blobs / ref["blob"]
+        if not blob.exists():
+            self._ref_path(key).unlink(missing_ok=True)
+            return None
+        return blob, ref
+
+    def touch(self, blob: Path) -> None:
+        """Mark blob as recently used"""
+        # The blob may have been evicted by another worker
+        with contextlib.suppress(OSError):
+            os.utime(blob)
+
+    def store(
+        self, key: str, tmp_file: Path, digest: str, suffix: str, ref: dict[str, Any]
+    ) -> Path:
+        """Move a downloaded file into the cache and record the request that produced it
+
+        Args:
+            key (str): request key
+            tmp_file (Path): downloaded file, located in the cache's `tmp` directory
+            digest (str): sha256 digest of the file content
+            suffix (str): file suffix preserved on the blob so that GDAL can identify the format
+            ref (dict[str, Any]): response validators
+
+        Returns:
+            Path: cached blob
+        """
+        blob = self.blobs / f"{digest}{suffix}"
+        if blob.exists():
+            tmp_file.unlink(missing_ok=True)
+            self.touch(blob)
+        else:
+            tmp_file.replace(blob)
+        ref = {**ref, "blob": blob.name}
+        tmp_ref = self.tmp / f"{key}.{os.getpid()}.{threading.get_ident()}.json"
+        tmp_ref.write_text(json.dumps(ref))
+        tmp_ref.replace(self._ref_path(key))
+        self.evict(keep=blob)
+        return blob
+
+    def size(self) -> int:
+        """Total size of cached blobs in bytes"""
+        return sum(path.stat().st_size for path in self.blobs.iterdir())
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Remove least recently used blobs until the cache fits within `max_size`.
+
+        Args:
+            keep (Path | None, optional): blob that must not be evicted. Defaults to None.
+        """
+        entries = []
+        for path in self.blobs.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:  # pragma: no cover - evicted by another worker
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            logger.debug(f"Evicting cached asset: {path.name}")
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class AssetFetcher:
+    """Downloads remote assets with a pooled HTTP client into an `AssetCache`.
+
+    Requests are replayed from the config's `method`, `params`, `headers`, `cookies`, `content`, `data` and
+    `json_body` fields. Cached responses are revalidated with `If-None-Match`/`If-Modified-Since`, so an asset is
+    downloaded once and repeat runs only issue conditional requests.
+    """
+
+    def __init__(self, cache: AssetCache | None = None, client: httpx.Client | None = None) -> None:
+        """Constructor
+
+        Args:
+            cache (AssetCache | None, optional): asset cache. Defaults to the cache described by environment variables.
+            client (httpx.Client | None, optional): client sending the requests. Defaults to a new pooled client.
+        """
+        self.cache = cache if cache is not None else AssetCache.from_env()
+        self.client = client if client is not None else httpx.Client(follow_redirects=True)
+
+    @staticmethod
+    def request_kwargs(config: SourceConfig) -> dict[str, Any]:
+        """HTTP request described by a source config"""
+        return {
+            "method": config.method or "GET",
+            "params": config.params,
+            "headers": config.headers,
+            "cookies": config.cookies,
+            "content": config.content,
+            "data": config.data,
+            "json": config.json_body,
+        }
+
+    def _build_request(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Any = None,
+        cookies: Any = None,
+        **kwargs: Any,
+    ) -> tuple[httpx.Request, str, dict[str, Any] | None]:
+        headers = httpx.Headers(headers)
+        if cookies:
+            headers["Cookie"] = cookie_header(cookies)
+        request = self.client.build_request(method, url, headers=headers, **kwargs)
+        # Key on the request as configured - client default headers do not take part
+        hasher = hashlib.sha256()
+        hasher.update(request.method.encode())
+        hasher.update(str(request.url).encode())
+        for name, value in sorted(headers.multi_items()):
+            hasher.update(f"{name}:{value}".encode())
+        hasher.update(request.read())
+        key = hasher.hexdigest()
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            _, ref = cached
+            if ref.get("etag"):
+                request.headers["If-None-Match"] = ref["etag"]
+            if ref.get("last_modified"):
+                request.headers["If-Modified-Since"] = ref["last_modified"]
+        return request, key, cached[1] if cached is not None else None
+
+    @staticmethod
+    def _validators(response: httpx.Response) -> dict[str, Any]:
+        return {
+            "url": str(response.request.url.copy_with(query=None)),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    @staticmethod
+    def _suffix(url: str, extension: str | None) -> str:
+        if extension:
+            return f".{extension.lstrip('.')}"
+        return Path(urllib.parse.urlsplit(url).path).suffix
+
+    def _cached(self, key: str) -> Path:
+        cached = self.cache.lookup(key)
+        if cached is None:  # pragma: no cover - evicted between revalidation and use
+            raise SourceAssetException(f"Cached asset evicted during revalidation: {key}")
+        self.cache.touch(cached[0])
+        return cached[0]
+
+    def _fallback(self, url: str, key: str, error: httpx.HTTPError) -> Path:
+        cached = self.cache.lookup(key)
+        if isinstance(error, httpx.TransportError) and cached is not None:
+            logger.warning(f"Unable to revalidate {url}, using cached asset. {error}")
+            return cached[0]
+        raise SourceAssetException(f"Unable to fetch asset: {url}. " + str(error)) from None
+
+    def _download(self, response: httpx.Response) -> tuple[Path, str]:
+        """Stream the response body to a file in the cache's `tmp` directory. The file is removed if the download fails"""
+        hasher = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=self.cache.tmp, delete=False) as file:
+            tmp_file = Path(file.name)
+            try:
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    file.write(chunk)
+            except BaseException:
+                file.close()
+                tmp_file.unlink(missing_ok=True)
+                raise
+        return tmp_file, hasher.hexdigest()
+
+    def fetch(self, url: str, extension: str | None = None, **kwargs: Any) -> Path:
+        """Download url into the cache, or revalidate a cached copy.
+
+        Args:
+            url (str): asset url
+            extension (str | None, optional): file extension of the cached copy. Defaults to the url's suffix.
+            **kwargs (Any): request fields - method, params, headers, cookies, content, data, json
+
+        Raises:
+            SourceAssetException: if the asset cannot be fetched
+
+        Returns:
+            Path: local path to the cached asset
+        """
+        request, key, ref = self._build_request(url, **kwargs)
+        try:
+            response = self.client.send(request, stream=True)
+            try:
+                if response.status_code == httpx.codes.NOT_MODIFIED and ref is not None:
+                    logger.debug(f"Cached asset is up to date: {url}")
+                    return self._cached(key)
+                response.raise_for_status()
+                logger.debug(f"Downloading asset: {url}")
+                tmp_file, digest = self._download(response)
+            finally:
+                response.close()
+        except httpx.HTTPError as e:
+            return self._fallback(url, key, e)
+        return self.cache.store(
+            key,
+            tmp_file,
+            digest,
+            self._suffix(url, extension),
+            self._validators(response),
+        )
+
+    def fetch_config(self, config: SourceConfig) -> Path:
+        """Fetch the asset described by a source config"""
+        return self.fetch(config.location, config.extension, **self.request_kwargs(config))
+
+
+_FETCHERS: dict[int, AssetFetcher] = {}
+_FETCHERS_LOCK = threading.Lock()
+
+
+def get_fetcher() -> AssetFetcher:
+    """Process wide fetcher. Connection pools are not shared with forked worker processes"""
+    pid = os.getpid()
+    with _FETCHERS_LOCK:
+        if pid not in _FETCHERS:
+            _FETCHERS.clear()
+            _FETCHERS[pid] = AssetFetcher()
+        return _FETCHERS[pid]
+
+
+def fetch_asset(location: str, **kwargs: Any) -> str:
+    """Local path to an asset. Remote assets are downloaded through the process wide fetcher.
+
+    Args:
+        location (str): asset location
+        **kwargs (Any): request fields passed to `AssetFetcher.fetch`
+
+    Returns:
+        str: local path
+    """
+    if not is_remote(location):
+        return location
+    return str(get_fetcher().fetch(location, **kwargs))
+
+
+def fetch_source(config: SourceConfig) -> str:
+    """Local path to the asset described by a source config. Remote assets are downloaded using the config's HTTP fields"""
+    if not is_remote(config.location):
+        return config.location
+    return str(get_fetcher().fetch_config(config))
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import abc
 import datetime as pydatetime
+import functools
 import json
 import logging
+import posixpath
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, cast
 
@@ -11,10 +14,10 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pystac
+import shapely
 from pyproj import CRS
 from pystac.collection import Extent
-from pystac.extensions.projection import ItemProjectionExtension
-from pystac.utils import datetime_to_str
+from pystac.utils import datetime_to_str, make_absolute_href
 from shapely import (
     Geometry,
     LineString,
@@ -24,23 +27,44 @@ from shapely import (
     Point,
     Polygon,
     box,
-    to_geojson,
 )
 from shapely.geometry import shape
 
+from stac_generator.core.base.api import push_collection
+from stac_generator.core.base.fetch import fetch_source
+from stac_generator.core.base.record import (
+    PROJECTION_SCHEMA,
+    ItemDocuments,
+    ItemPayload,
+    ItemRecord,
+    geometry_dict,
+    projection_fields,
+)
 from stac_generator.core.base.schema import (
+    ApiConfig,
+    FootprintConfig,
     SourceConfig,
     StacCollectionConfig,
     T,
+    ValidationConfig,
+    WriterConfig,
 )
 from stac_generator.core.base.utils import (
-    force_write_to_stac_api,
+    ReadPlan,
+    ReadRequest,
+    get_crs_info,
     get_timezone,
     href_is_stac_api_endpoint,
+    is_remote,
     is_string_convertible,
     localise_timezone,
-    parse_href,
+    merge_bounds,
+    reproject_bounds,
+    shared_reads,
+    simplify_to_budget,
 )
+from stac_generator.core.base.validation import get_validator, validate_items
+from stac_generator.core.base.writer import CatalogWriter, ItemIndex, item_href
 from stac_generator.exceptions import StacConfigException
 
 if TYPE_CHECKING:
@@ -50,9 +74,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+POLYGON_TYPE_IDS = (3, 6)
+"""Shapely type ids of Polygon and MultiPolygon"""
+
+
+def run_generator_group(
+    generators: Sequence[ItemGenerator],
+    validation: ValidationConfig | None = None,
+    run_id: str = "",
+) -> list[ItemPayload]:
+    """Generate items from a group of generators, sharing reads of the assets they have in common.
+    Items are validated as they are produced if a validation config is provided.
 
-def run_generator(generator: ItemGenerator) -> pystac.Item:
-    return generator.generate()
+    Items are returned as compact `ItemPayload`s, which are cheap to send from a worker process to the parent.
+    """
+    plan = ReadPlan(request for generator in generators for request in generator.read_requests())
+    with shared_reads(plan):
+        documents = [generator.generate_record().to_dict() for generator in generators]
+    if validation is not None and validation.enabled:
+        count = validate_items(documents, validation, run_id)
+        logger.debug(f"Validated {count} of {len(documents)} generated items")
+    return [ItemPayload.from_dict(document) for document in documents]
 
 
 class CollectionGenerator:
@@ -63,6 +105,7 @@ class CollectionGenerator:
         collection_config: StacCollectionConfig,
         generators: Sequence[ItemGenerator[T]],
         pool: Executor | None = None,
+        validation: ValidationConfig | None = None,
     ) -> None:
         """Constructor
 
@@ -70,10 +113,12 @@ class CollectionGenerator:
             collection_config (StacCollectionConfig): collection metadata as a `StacCollectionConfig` object.
             generators (Sequence[ItemGenerator[T]]): sequence of `ItemGenerator` objects.
             pool (Executor | None, optional): Executor pool for parallel processing. Defaults to None.
+            validation (ValidationConfig | None, optional): validation of the items by the workers producing them. Defaults to None, in which case items are not validated.
         """
         self.collection_config = collection_config
         self.generators = generators
         self.pool = pool
+        self.validation = validation
         self.check_duplicated_id()
 
     def check_duplicated_id(self) -> None:
@@ -109,14 +154,14 @@ class CollectionGenerator:
         return pystac.SpatialExtent(bbox)
 
     @staticmethod
-    def temporal_extent(items: Sequence[pystac.Item]) -> pystac.TemporalExtent:
+    def temporal_extent(items: Sequence[pystac.Item | ItemPayload]) -> pystac.TemporalExtent:
         """Extract a collection's temporal extent based on time information of its items.
 
         Produces the tuple (start_ts, end_ts) which are the smallest and largest timestamps
         of the Items' start_datetime and end_datetime values.
 
         Args:
-            items (Sequence[pystac.Item]): sequence of generated items
+            items (Sequence[pystac.Item | ItemPayload]): sequence of generated items or item payloads
 
         Raises:
             ValueError: if an item's datetime attribute cannot be accessed
@@ -140,10 +185,35 @@ class CollectionGenerator:
         )
         return pystac.TemporalExtent([[min_dt, max_dt]])
 
+    @classmethod
+    def payload_extent(cls, payloads: Sequence[ItemPayload]) -> Extent:
+        """Extract a collection's extent from the bounds and datetimes of item payloads, without decoding the items.
+
+        Produces the same extent as `spatial_extent` and `temporal_extent` of the decoded items.
+
+        Args:
+            payloads (Sequence[ItemPayload]): sequence of generated item payloads
+
+        Returns:
+            Extent: the calculated extent
+        """
+        bounds = [payload.bounds for payload in payloads if payload.bounds is not None]
+        if not bounds:
+            return Extent(cls.spatial_extent([]), cls.temporal_extent(payloads))
+        bbox = [
+            min(bound[0] for bound in bounds),
+            min(bound[1] for bound in bounds),
+            max(bound[2] for bound in bounds),
+            max(bound[3] for bound in bounds),
+        ]
+        logger.debug(f"collection bbox: {bbox}")
+        return Extent(pystac.SpatialExtent(bbox), cls.temporal_extent(payloads))
+
     def _create_collection_from_items(
         self,
         items: Sequence[pystac.Item],
         collection_config: StacCollectionConfig | None = None,
+        extent: Extent | None = None,
     ) -> pystac.Collection:
         logger.debug("Generating collection from items")
         if collection_config is None:  # pragma: no cover
@@ -155,7 +225,9 @@ class CollectionGenerator:
                 if collection_config.description
                 else f"Auto-generated collection {collection_config.id} with stac_generator"
             ),
-            extent=Extent(self.spatial_extent(items), self.temporal_extent(items)),
+            extent=extent
+            if extent is not None
+            else Extent(self.spatial_extent(items), self.temporal_extent(items)),
             title=collection_config.title,
             license=collection_config.license if collection_config.license else "proprietary",
             providers=[
@@ -167,13 +239,131 @@ class CollectionGenerator:
         collection.add_items(items)
         return collection
 
+    def plan_groups(self) -> list[list[int]]:
+        """Group generators that read at least one common asset.
+
+        Each group is processed by one worker so that an asset referenced by multiple configs is read once. Layers of
+        a vector asset count as the same asset, so that the worker reads them in one pass over the datasource.
+        Groups preserve the order of the generators.
+
+        Returns:
+            list[list[int]]: groups of generator positions
+        """
+        parent = list(range(len(self.generators)))
+
+        def find(idx: int) -> int:
+            while parent[idx] != idx:
+                parent[idx] = parent[parent[idx]]
+                idx = parent[idx]
+            return idx
+
+        owners: dict[tuple[Any, ...], int] = {}
+        for idx, generator in enumerate(self.generators):
+            for request in generator.read_requests():
+                if request.source in owners:
+                    parent[find(idx)] = find(owners[request.source])
+                else:
+                    owners[request.source] = idx
+        groups: dict[int, list[int]] = {}
+        for idx in range(len(self.generators)):
+            groups.setdefault(find(idx), []).append(idx)
+        return list(groups.values())
+
+    @staticmethod
+    def merge_bboxes(first: Sequence[float], second: Sequence[float]) -> list[float]:
+        """Smallest bbox enclosing two bboxes.
+
+        A 2D and a 3D bbox are merged on their x and y components, and keep the z range of the 3D bbox.
+
+        Args:
+            first (Sequence[float]): 2D or 3D bbox
+            second (Sequence[float]): 2D or 3D bbox
+
+        Returns:
+            list[float]: merged bbox
+        """
+        if len(first) == len(second):
+            half = len(first) // 2
+            return [
+                *(min(pair) for pair in zip(first[:half], second[:half], strict=True)),
+                *(max(pair) for pair in zip(first[half:], second[half:], strict=True)),
+            ]
+        flat, deep = (first, second) if len(first) == 4 else (second, first)
+        return [
+            min(flat[0], deep[0]),
+            min(flat[1], deep[1]),
+            deep[2],
+            max(flat[2], deep[3]),
+            max(flat[3], deep[4]),
+            deep[5],
+        ]
+
+    @classmethod
+    def widen_extent(cls, extent: Extent, payloads: Sequence[ItemPayload]) -> Extent:
+        """Smallest extent enclosing an existing extent and additional items.
+
+        An open end of the existing temporal interval stays open.
+
+        Args:
+            extent (Extent): existing extent
+            payloads (Sequence[ItemPayload]): payloads of the additional items
+
+        Returns:
+            Extent: widened extent
+        """
+        if not payloads:
+            return extent
+        payloads_extent = cls.payload_extent(payloads)
+        bbox = cls.merge_bboxes(extent.spatial.bboxes[0], payloads_extent.spatial.bboxes[0])
+        start, end = payloads_extent.temporal.intervals[0]
+        interval = extent.temporal.intervals[0]
+        start = None if interval[0] is None or start is None else min(start, interval[0])
+        end = None if interval[1] is None or end is None else max(end, interval[1])
+        return Extent(pystac.SpatialExtent(bbox), pystac.TemporalExtent([[start, end]]))
+
+    def create_collection(self, payloads: Sequence[ItemPayload]) -> pystac.Collection:
+        """Collection whose extent covers the given item payloads, without building its items.
+
+        Args:
+            payloads (Sequence[ItemPayload]): payloads of the collection's items
+
+        Returns:
+            pystac.Collection: collection without items
+        """
+        return self._create_collection_from_items(
+            [], self.collection_config, self.payload_extent(payloads)
+        )
+
     def __call__(self) -> pystac.Collection:
         """Generate all items from `ItemGenerator` then generate the Collection object"""
+        payloads = self.generate_payloads()
+        return self._create_collection_from_items(
+            [payload.to_item() for payload in payloads],
+            self.collection_config,
+            self.payload_extent(payloads),
+        )
+
+    def generate_items(self) -> list[pystac.Item]:
+        """Generate all items from `ItemGenerator`, in the order of the generators"""
+        return [payload.to_item() for payload in self.generate_payloads()]
+
+    def generate_payloads(self) -> list[ItemPayload]:
+        """Generate the payloads of all items from `ItemGenerator`, in the order of the generators"""
+        groups = self.plan_groups()
+        generator_groups = [[self.generators[idx] for idx in group] for group in groups]
+        run = functools.partial(
+            run_generator_group, validation=self.validation, run_id=uuid.uuid4().hex
+        )
         if self.pool:
-            result = list(self.pool.map(run_generator, self.generators))
+            group_results = list(self.pool.map(run, generator_groups))
         else:
-            result = [item.generate() for item in self.generators]
-        return self._create_collection_from_items(result, self.collection_config)
+            group_results = [run(group) for group in generator_groups]
+        # Restore config order
+        result: list[ItemPayload] = [None] * len(self.generators)  # type: ignore[list-item]
+        for group, payloads in zip(groups, group_results, strict=True):
+            for idx, payload in zip(group, payloads, strict=True):
+                result[idx] = payload
+        return result
 
 
 class ItemGenerator(abc.ABC, Generic[T]):
@@ -209,10 +399,45 @@ class ItemGenerator(abc.ABC, Generic[T]):
         else:
             raise TypeError(f"Invalid config type: {type(config)}")
 
-    @abc.abstractmethod
+    download_remote: bool = False
+    """Whether remote assets are always downloaded to the local asset cache before being read. Generators
+    reading assets with GDAL default to reading remote assets in place unless the config `requires_download`."""
+
+    @functools.cached_property
+    def source(self) -> str:
+        """Location the asset is read from. Remote assets that are downloaded resolve to the cached copy."""
+        if is_remote(self.config.location) and (
+            self.download_remote or self.config.requires_download
+        ):
+            return fetch_source(self.config)
+        return self.config.location
+
+    def expand(self) -> Sequence[ItemGenerator]:
+        """Expand the generator into the generators of each item described by the config.
+
+        Most configs describe a single item and the default returns the generator itself. Configs that
+        describe several items from one asset (i.e. a multi-layer vector asset) return one generator per item.
+        """
+        return [self]
+
+    def read_requests(self) -> list[ReadRequest]:
+        """Tabular reads performed by `generate`. Generators reading the same asset share a single read.
+
+        Subclasses that read assets through `read_point_asset`, `read_vector_asset` or `read_join_asset`
+        can override this method to take part in read planning. Defaults to no shared reads.
+        """
+        return []
+
     def generate(self) -> pystac.Item:
-        """Abstract method that handles `pystac.Item` generation from the appropriate config"""
-        raise NotImplementedError
+        """Generate a `pystac.Item` from the appropriate config, by converting the record of `generate_record`"""
+        return self.generate_record().to_item()
+
+    @abc.abstractmethod
+    def generate_record(self) -> ItemRecord:
+        """Generate an `ItemRecord` from the appropriate config.
+
+        Generators building a `pystac.Item` can return `ItemRecord.from_item(item)`.
+        """
 
 
 class BaseVectorGenerator(ItemGenerator[T]):
@@ -224,29 +449,29 @@ class BaseVectorGenerator(ItemGenerator[T]):
         return type(f"BaseVectorGenerator[{source_type.__name__}]", (BaseVectorGenerator,), kwargs)
 
     @staticmethod
-    def geometry(  # noqa: C901
-        df: gpd.GeoDataFrame,
-    ) -> Geometry:
-        """Calculate the geometry from geopandas dataframe.
+    def merge_geometries(  # noqa: C901
+        geometries: Sequence[Geometry],
+    ) -> Geometry | None:
+        """Merge a sequence of unique geometries into a single geometry.
 
-        If geopandas dataframe has only one item, the geometry will be that of the item.
-        If geopandas dataframe has less than 10 items of the same type, the geometry will be the Multi version of the type.
-        Note that MultiPoint will be unpacked into points for the 10 items limit.
-        If there are more than 10 items of the same type or there are items of different types i.e. Point and LineString, the returned
-        geometry will be the Polygon of the bounding box. Note that Point and MultiPoint are treated as the same type (so are type and its Multi version).
+        A single geometry is returned as is. Geometries of the same type are merged into the
+        Multi version of the type, provided that there are at most 10 parts after unpacking Multi geometries.
+        Returns None if the geometries have mixed types or there are more than 10 parts, in which case
+        the caller should fall back to a bounding box.
 
+        Args:
+            geometries (Sequence[Geometry]): unique geometries
 
         Returns:
-            Geometry: extracted geometry
+            Geometry | None: merged geometry or None if the geometries cannot be merged
         """
-        points: Sequence[Geometry] = df["geometry"].unique()
         # One item
-        if len(points) == 1:
-            return points[0]
+        if len(geometries) == 1:
+            return geometries[0]
         # Multiple Items of the same type
         curr_type = None
         curr_collection: list[Geometry] = []
-        for point in points:
+        for point in geometries:
             if curr_type is None:
                 match point:
                     case Point() | MultiPoint():
@@ -256,7 +481,7 @@ class BaseVectorGenerator(ItemGenerator[T]):
                     case Polygon() | MultiPolygon():
                         curr_type = MultiPolygon
                     case _:  # pragma: no cover
-                        return box(*df.total_bounds)
+                        return None
             if isinstance(point, Point) and curr_type == MultiPoint:
                 curr_collection.append(point)
             elif isinstance(point, MultiPoint) and curr_type == MultiPoint:
@@ -270,42 +495,119 @@ class BaseVectorGenerator(ItemGenerator[T]):
             elif isinstance(point, MultiPolygon) and curr_type == MultiPolygon:
                 curr_collection.extend(point.geoms)
             else:
-                return box(*df.total_bounds)
+                return None
         if len(curr_collection) > 10:
-            return box(*df.total_bounds)
+            return None
         return cast(Geometry, curr_type)(curr_collection)
 
     @staticmethod
-    def df_to_item(
+    def geometry(
         df: gpd.GeoDataFrame,
-        assets: dict[str, pystac.Asset],
+    ) -> Geometry:
+        """Calculate the geometry from geopandas dataframe.
+
+        If geopandas dataframe has only one item, the geometry will be that of the item.
+        If geopandas dataframe has less than 10 items of the same type, the geometry will be the Multi version of the type.
+        Note that MultiPoint will be unpacked into points for the 10 items limit.
+        If there are more than 10 items of the same type or there are items of different types i.e. Point and LineString, the returned
+        geometry will be the Polygon of the bounding box. Note that Point and MultiPoint are treated as the same type (so are type and its Multi version).
+
+
+        Returns:
+            Geometry: extracted geometry
+        """
+        geometry = BaseVectorGenerator.merge_geometries(df["geometry"].unique())
+        if geometry is None:
+            return box(*df.total_bounds)
+        return geometry
+
+    @staticmethod
+    def footprint(
+        df: gpd.GeoDataFrame,
+        footprint_config: FootprintConfig | None = None,
+    ) -> Geometry | None:
+        """Calculate the footprint of the dataframe in the dataframe's crs based on the footprint strategy.
+
+        The `default` strategy produces the same geometry as `geometry`. Other strategies are computed with
+        vectorised shapely operations over all geometries and are simplified to the configured vertex budget.
+
+        Args:
+            df (gpd.GeoDataFrame): input dataframe
+            footprint_config (FootprintConfig | None, optional): footprint strategy. Defaults to None, which uses the `default` strategy.
+
+        Returns:
+            Geometry | None: footprint geometry or None if the footprint is the bounding box.
+        """
+        config = footprint_config if footprint_config is not None else FootprintConfig()
+        if config.method == "default":
+            return BaseVectorGenerator.merge_geometries(df["geometry"].unique())
+        if config.method == "bbox":
+            return None
+        geometries = df["geometry"].to_numpy()
+        geometries = geometries[~(shapely.is_missing(geometries) | shapely.is_empty(geometries))]
+        if len(geometries) == 0:
+            return None
+        match config.method:
+            case "convex_hull":
+                footprint = shapely.convex_hull(shapely.geometrycollections(geometries))
+            case "concave_hull":
+                footprint = shapely.concave_hull(
+                    shapely.geometrycollections(geometries), ratio=config.ratio
+                )
+            case "simplify":
+                footprint = shapely.union_all(geometries)
+            case "coverage":
+                if config.grid_size:
+                    geometries = shapely.set_precision(geometries, config.grid_size)
+                if np.isin(shapely.get_type_id(geometries), POLYGON_TYPE_IDS).all():
+                    footprint = shapely.coverage_union_all(geometries)
+                else:
+                    footprint = shapely.union_all(geometries)
+        return simplify_to_budget(footprint, config.max_vertices)
+
+    @staticmethod
+    def df_to_record(
+        df: gpd.GeoDataFrame,
+        assets: dict[str, dict[str, Any]],
         source_config: SourceConfig,
         properties: dict[str, Any],
         epsg: int = 4326,
         time_column: str | None = None,
-    ) -> pystac.Item:
-        """Convert dataframe to pystac.Item
+        footprint_config: FootprintConfig | None = None,
+    ) -> ItemRecord:
+        """Convert dataframe to an `ItemRecord`
+
+        The footprint is computed in the frame's crs and only the footprint is reprojected to WGS 84. The bbox is
+        computed by transforming a densified envelope of the frame's bounds, so that it covers the data whichever
+        footprint is used and the frame itself is never reprojected.
 
         Args:
             df (gpd.GeoDataFrame): input dataframe
-            assets (dict[str, pystac.Asset]): data asset object
+            assets (dict[str, dict[str, Any]]): data asset dictionaries
             source_config (SourceConfig): config object
             properties (dict[str, Any]): serialised properties
             epsg (int, optional): frame's epsg code. Defaults to 4326.
             time_column (str | None, optional): datetime column in the dataframe. Defaults to None.
+            footprint_config (FootprintConfig | None, optional): footprint strategy. Defaults to None.
 
         Returns:
-            pystac.Item: generated STAC Item
+            ItemRecord: generated item record
         """
         crs = cast(CRS, df.crs)
+        crs_info = get_crs_info(crs)
         # Convert to WGS 84 for computing geometry and bbox
-        df.to_crs(epsg=4326, inplace=True)
-        geometry = box(*df.total_bounds)
+        # The bbox covers the data, and the footprint which may extend past the data once simplified
+        bbox = reproject_bounds(df.total_bounds, crs)
+        footprint = BaseVectorGenerator.footprint(df, footprint_config)
+        if footprint is None:
+            footprint = box(*bbox)
+        else:
+            footprint = crs_info.to_wgs84(footprint)
+            bbox = merge_bounds(bbox, footprint.bounds)
+        geometry = box(*bbox)
         item_tz = get_timezone(source_config.timezone, geometry)
         item_ts = source_config.get_datetime(geometry)
 
-        geometry = json.loads(to_geojson(BaseVectorGenerator.geometry(df)))
-
         # Process timestamps
         if time_column is None:
             # Item TS should be UTC by default
@@ -317,52 +619,200 @@ class BaseVectorGenerator(ItemGenerator[T]):
             start_datetime = timestamps.min()
             end_datetime = timestamps.max()
 
-        item = pystac.Item(
+        record = ItemRecord(
             source_config.id,
-            bbox=df.total_bounds.tolist(),
-            geometry=geometry,
+            bbox=list(bbox),
+            geometry=geometry_dict(footprint),
             datetime=item_ts,
             properties=properties,
             assets=assets,
             start_datetime=start_datetime,
             end_datetime=end_datetime,
         )
-        proj_ext = ItemProjectionExtension.ext(item, add_if_missing=True)
-        proj_ext.apply(epsg=epsg, wkt2=crs.to_wkt())
-        return item
+        record.properties.update(projection_fields(epsg, crs_info.wkt2))
+        record.add_extension(PROJECTION_SCHEMA)
+        return record
+
+    @staticmethod
+    def df_to_item(
+        df: gpd.GeoDataFrame,
+        assets: dict[str, pystac.Asset],
+        source_config: SourceConfig,
+        properties: dict[str, Any],
+        epsg: int = 4326,
+        time_column: str | None = None,
+        footprint_config: FootprintConfig | None = None,
+    ) -> pystac.Item:
+        """Convert dataframe to pystac.Item. See `df_to_record`
+
+        Returns:
+            pystac.Item: generated STAC Item
+        """
+        return BaseVectorGenerator.df_to_record(
+            df,
+            {key: asset.to_dict() for key, asset in assets.items()},
+            source_config,
+            properties,
+            epsg,
+            time_column,
+            footprint_config,
+        ).to_item()
 
 
 class StacSerialiser:  # pragma: no cover
     """Class that handles validating generated stac metadata and storing them locally or remotely"""
 
-    def __init__(self, generator: CollectionGenerator, href: str | Path) -> None:
+    def __init__(
+        self,
+        generator: CollectionGenerator,
+        href: str | Path,
+        validation: ValidationConfig | None = None,
+        writer: WriterConfig | None = None,
+        api: ApiConfig | None = None,
+    ) -> None:
         """Constructor
 
         Args:
             generator (CollectionGenerator): collection generator object
             href (str | Path): serialisation location
+            validation (ValidationConfig | None, optional): validation of the generated metadata. Defaults to the generator's validation config, or validating every item if the generator has none.
+            writer (WriterConfig | None, optional): how local json files are written. Defaults to None, which uses default `WriterConfig` values.
+            api (ApiConfig | None, optional): how metadata is pushed to a STAC API. Defaults to None, which uses default `ApiConfig` values.
         """
         self.generator = generator
-        self.collection = generator()
+        self.writer = writer if writer is not None else WriterConfig()
+        self.api = api if api is not None else ApiConfig()
+        self.validation = validation or generator.validation or ValidationConfig()
+        generator.validation = self.validation
         self.href = is_string_convertible(href)
+        self.index: ItemIndex | None = None
+        """Item index of a `json` collection. Set when an existing collection is updated incrementally"""
+        self.payloads: list[ItemPayload] = []
+        """Payloads of the generated items. Items are written from their dictionaries, without building `pystac.Item`s"""
+        if self.writer.mode != "overwrite" and self.existing_collection_path().exists():
+            self.collection = self.update_collection()
+        else:
+            self.payloads = generator.generate_payloads()
+            self.collection = generator.create_collection(self.payloads)
+
+    def existing_collection_path(self) -> Path:
+        """Path of the collection document of a local `json` destination"""
+        return Path(self.href) / "collection.json"
+
+    def update_collection(self) -> pystac.Collection:
+        """Load the collection at the destination and add the items of new or changed configs.
+
+        Only the collection document and its item index are read. Configs are generated if their id is not in the
+        index, or in `update` mode if their hash differs from the indexed one. Generated items replace the items of
+        the same id, keeping their position in the collection's links, and their payloads are kept in `payloads`.
+        The collection's extents are widened to cover the generated items.
+
+        Raises:
+            StacConfigException: if the destination is not a local `json` collection
+
+        Returns:
+            pystac.Collection: collection linking to its existing and generated items
+        """
+        if href_is_stac_api_endpoint(self.href) or self.writer.format != "json":
+            raise StacConfigException(
+                f"Mode {self.writer.mode} requires a local json destination. Use --sync to update a STAC API."
+            )
+        collection = pystac.Collection.from_file(self.existing_collection_path().as_posix())
+        index = ItemIndex.read(collection)
+        hashes = {
+            generator.config.id: generator.config.content_hash()
+            for generator in self.generator.generators
+        }
+        pending = [
+            generator
+            for generator in self.generator.generators
+            if generator.config.id not in index.items
+            or (
+                self.writer.mode == "update"
+                and index.items[generator.config.id] != hashes[generator.config.id]
+            )
+        ]
+        logger.debug(
+            f"Generating {len(pending)} of {len(self.generator.generators)} items to {self.writer.mode} collection {collection.id}"
+        )
+        self.payloads = (
+            CollectionGenerator(
+                self.generator.collection_config, pending, self.generator.pool, self.validation
+            ).generate_payloads()
+            if pending
+            else []
+        )
+        # Replaced items keep their link, and so their position in the collection's links
+        existing = {link.get_absolute_href() for link in collection.get_item_links()}
+        href = cast(str, collection.get_self_href())
+        self.add_item_links(
+            collection,
+            href,
+            [payload.id for payload in self.payloads],
+            existing,
+        )
+        for payload in self.payloads:
+            index.items[payload.id] = hashes[payload.id]
+        collection.extent = self.generator.widen_extent(collection.extent, self.payloads)
+        self.index = index
+        return collection
+
+    @staticmethod
+    def add_item_links(
+        collection: pystac.Collection,
+        href: str,
+        item_ids: Sequence[str],
+        existing: set[str | None] | None = None,
+    ) -> None:
+        """Link a collection to its items by href and set the collection's self href.
+
+        Links are added in the order `normalize_hrefs` gives them, with the self link after the item links.
+
+        Args:
+            collection (pystac.Collection): collection
+            href (str): self href of the collection
+            item_ids (Sequence[str]): ids of the items, stored next to the collection
+            existing (set[str | None] | None, optional): absolute hrefs of the items the collection already links to. Defaults to None.
+        """
+        directory = posixpath.dirname(href)
+        collection.set_self_href(None)
+        for item_id in item_ids:
+            target = item_href(directory, item_id)
+            if existing is None or target not in existing:
+                collection.add_link(
+                    pystac.Link(pystac.RelType.ITEM, target, pystac.MediaType.GEOJSON)
+                )
+        collection.set_self_href(href)
 
     def pre_serialisation_hook(self, collection: pystac.Collection, href: str) -> None:
         """Hook that can be overwritten to provide pre-serialisation functionality.
-        By default, this normalises collection href and performs validation
+        By default, this links the collection to its items at the hrefs `normalize_hrefs` would give them, then validates the collection. Items are validated by the generator's workers.
 
         Args:
             collection (pystac.Collection): stac Collection
             href (str): href for normalisation
         """
-        logger.debug("Validating generated collection and items")
-        collection.normalize_hrefs(href)
-        collection.validate_all()
+        # Hrefs of an incrementally updated collection are already set
+        if self.index is None:
+            root = make_absolute_href(href, start_is_dir=True)
+            self.add_item_links(
+                collection,
+                posixpath.join(root, "collection.json"),
+                [payload.id for payload in self.payloads],
+            )
+        if self.validation.enabled:
+            logger.debug("Validating generated collection")
+            get_validator(self.validation).validate(collection.to_dict(include_self_link=False))
 
     def __call__(self) -> None:
         """Call API for serialisation"""
         self.pre_serialisation_hook(self.collection, self.href)
         if href_is_stac_api_endpoint(self.href):
             self.to_api()
+        elif self.writer.format == "ndjson":
+            self.to_ndjson()
+        elif self.writer.format == "geoparquet":
+            self.to_geoparquet()
         else:
             self.to_json()
         logger.info(f"successfully save collection {self.collection.id} to {self.href}")
@@ -401,24 +851,55 @@ class StacSerialiser:  # pragma: no cover
         with Path(dst).open("w") as file:
             json.dump(config, file)
 
+    def item_documents(self) -> ItemDocuments:
+        """Dictionaries of the generated items, decoded one at a time from their payloads"""
+        return ItemDocuments(self.payloads, self.collection.id)
+
     def to_json(self) -> None:
-        """Generate STAC Collection and save to disk as json files"""
+        """Generate STAC Collection and save to disk as json files, with the index of its items.
+        Only the generated items are written if an existing collection is updated incrementally.
+        """
         logger.debug("Saving collection as local json")
-        self.collection.save()
+        writer = CatalogWriter(self.writer)
+        writer.write(self.collection, self.item_documents())
+        index = self.index
+        if index is None:
+            index = ItemIndex(
+                {
+                    generator.config.id: generator.config.content_hash()
+                    for generator in self.generator.generators
+                }
+            )
+        writer.write_index(self.collection, index)
+
+    def to_ndjson(self) -> None:
+        """Save the collection as a local json file and its items as a single newline delimited json file"""
+        logger.debug("Saving collection as local ndjson")
+        CatalogWriter(self.writer).write_ndjson(self.collection, self.item_documents(), self.href)
+
+    def to_geoparquet(self) -> None:
+        """Save the collection as a local json file and its items as a single stac-geoparquet file"""
+        logger.debug("Saving collection as local stac-geoparquet")
+        CatalogWriter(self.writer).write_geoparquet(
+            self.collection, self.item_documents(), self.href
+        )
 
     def to_api(self) -> None:
-        """_Generate STAC Collection and push to remote API.
-        The API will first attempt to send a POST request which will be replaced with a PUT request if a 409 error is encountered
+        """Push the STAC Collection, then its items, to a remote API implementing the Transactions extension.
+        Items are sent concurrently over one pooled client, in batches if the API provides the bulk items endpoint.
+        Otherwise each item is POSTed, and PUT instead if a 409 error is encountered. With `ApiConfig.sync`, only new and
+        changed items are sent.
+
+        Raises:
+            StacApiException: if some items could not be pushed. Failed ids are written to `ApiConfig.failed_path`.
         """
         logger.debug("Saving collection to STAC API")
-        force_write_to_stac_api(
-            url=parse_href(self.href, "collections"),
-            id=self.collection.id,
-            json=self.collection.to_dict(),
+        summary = push_collection(
+            self.href,
+            self.collection.to_dict(),
+            self.item_documents(),
+            self.api,
+        )
+        logger.debug(
+            f"Sent {summary.sent} items to STAC API, {summary.unchanged} unchanged, {summary.deleted} deleted"
         )
-        for item in self.collection.get_items(recursive=True):
-            force_write_to_stac_api(
-                url=parse_href(self.href, f"collections/{self.collection.id}/items"),
-                id=item.id,
-                json=item.to_dict(),
-            )
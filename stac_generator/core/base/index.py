@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import datetime as pydatetime
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+import pystac
+import shapely
+from shapely import Geometry, STRtree
+from shapely.geometry import shape
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TimeLike = str | pydatetime.datetime | pd.Timestamp
+"""Accepted time bounds for a query. Non-timezone-aware values are treated as UTC"""
+
+
+def _to_utc_ns(value: TimeLike) -> int:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return int(ts.tz_convert("UTC").value)
+
+
+class CollectionIndex:
+    """In-memory spatio-temporal index over STAC Items.
+
+    Item geometries are indexed with a shapely `STRtree`, while items' `start_datetime` and `end_datetime`
+    (or `datetime` if the item has no time range) are stored in a sorted interval index.
+
+    Example:
+        ```python
+        collection = generator()
+        collection_index = CollectionIndex.from_collection(collection)
+        items = collection_index.query(paddock, "2023-01-01", "2023-06-30")
+        ```
+    """
+
+    def __init__(self, items: Iterable[pystac.Item]) -> None:
+        """Constructor
+
+        Args:
+            items (Iterable[pystac.Item]): items to be indexed
+        """
+        self.items: list[pystac.Item] = list(items)
+        geometries: list[Geometry] = []
+        starts: list[int] = []
+        ends: list[int] = []
+        for item in self.items:
+            if item.geometry is not None:
+                geometries.append(shape(item.geometry))
+            elif item.bbox is not None:
+                geometries.append(shapely.box(*item.bbox[:2], *item.bbox[-2:]))
+            else:
+                raise ValueError(f"Unable to determine geometry for item: {item.id}")
+            start = item.properties.get("start_datetime", item.datetime)
+            end = item.properties.get("end_datetime", item.datetime)
+            if start is None or end is None:
+                raise ValueError(f"Unable to determine datetime for item: {item.id}")
+            starts.append(_to_utc_ns(start))
+            ends.append(_to_utc_ns(end))
+        self._tree = STRtree(geometries)
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._ends = np.asarray(ends, dtype=np.int64)
+        # Sorted interval index - item positions ordered by start time
+        self._order = np.argsort(self._starts, kind="stable")
+        self._sorted_starts = self._starts[self._order]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @classmethod
+    def from_collection(cls, collection: pystac.Collection) -> CollectionIndex:
+        """Build the index from the items of a generated collection"""
+        return cls(collection.get_items(recursive=True))
+
+    @classmethod
+    def from_file(cls, href: str | Path) -> CollectionIndex:
+        """Build the index from a collection serialised on disk or behind a url
+
+        Args:
+            href (str | Path): location of the collection json
+
+        Returns:
+            CollectionIndex: index over the collection's items
+        """
+        logger.debug(f"Building collection index from {href}")
+        return cls.from_collection(pystac.Collection.from_file(str(href)))
+
+    def query_indices(
+        self,
+        geometry: Geometry | dict[str, Any] | None = None,
+        start: TimeLike | None = None,
+        end: TimeLike | None = None,
+    ) -> np.ndarray:
+        """Positions of items that intersect geometry and whose time range overlaps [start, end].
+
+        Args:
+            geometry (Geometry | dict[str, Any] | None, optional): query geometry in WGS 84 as a shapely geometry or geojson dictionary. Defaults to None, which matches all items.
+            start (TimeLike | None, optional): start of the query window. Defaults to None (unbounded).
+            end (TimeLike | None, optional): end of the query window. Defaults to None (unbounded).
+
+        Returns:
+            np.ndarray: sorted item positions
+        """
+        start_ns = _to_utc_ns(start) if start is not None else None
+        end_ns = _to_utc_ns(end) if end is not None else None
+        if geometry is not None:
+            geom = shape(geometry) if isinstance(geometry, dict) else geometry
+            candidates = self._tree.query(geom, predicate="intersects")
+        elif end_ns is not None:
+            # Items starting after the end of the window can never overlap
+            stop = np.searchsorted(self._sorted_starts, end_ns, side="right")
+            candidates = self._order[:stop]
+            end_ns = None
+        else:
+            candidates = np.arange(len(self.items))
+        mask = np.ones(len(candidates), dtype=bool)
+        if end_ns is not None:
+            mask &= self._starts[candidates] <= end_ns
+        if start_ns is not None:
+            mask &= self._ends[candidates] >= start_ns
+        return np.sort(candidates[mask])
+
+    def query(
+        self,
+        geometry: Geometry | dict[str, Any] | None = None,
+        start: TimeLike | None = None,
+        end: TimeLike | None = None,
+    ) -> list[pystac.Item]:
+        """Items that intersect geometry and whose time range overlaps [start, end].
+
+        Args:
+            geometry (Geometry | dict[str, Any] | None, optional): query geometry in WGS 84 as a shapely geometry or geojson dictionary. Defaults to None, which matches all items.
+            start (TimeLike | None, optional): start of the query window. Defaults to None (unbounded).
+            end (TimeLike | None, optional): end of the query window. Defaults to None (unbounded).
+
+        Returns:
+            list[pystac.Item]: matched items
+        """
+        return [self.items[idx] for idx in self.query_indices(geometry, start, end)]
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import pystac
+import shapely
+from pystac.extensions.datacube import DatacubeExtension
+from pystac.extensions.eo import EOExtension
+from pystac.extensions.projection import ProjectionExtension
+from pystac.extensions.raster import RasterExtension
+from pystac.utils import datetime_to_str, str_to_datetime
+from shapely.geometry import shape
+
+if TYPE_CHECKING:
+    import datetime as pydatetime
+    from collections.abc import Iterator, Sequence
+
+    from shapely import Geometry
+
+PROJECTION_SCHEMA = ProjectionExtension.get_schema_uri()
+"""Schema uri of the projection extension"""
+RASTER_SCHEMA = RasterExtension.get_schema_uri()
+"""Schema uri of the raster extension"""
+EO_SCHEMA = EOExtension.get_schema_uri()
+"""Schema uri of the electro-optical extension"""
+DATACUBE_SCHEMA = DatacubeExtension.get_schema_uri()
+"""Schema uri of the datacube extension"""
+
+
+def asset_dict(
+    href: str,
+    media_type: str | None = None,
+    title: str | None = None,
+    description: str | None = None,
+    roles: list[str] | None = None,
+    fields: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Dictionary of a STAC Asset, with the keys in the order `pystac.Asset.to_dict` writes them.
+
+    Args:
+        href (str): asset location
+        media_type (str | None, optional): asset media type. Defaults to None.
+        title (str | None, optional): asset title. Defaults to None.
+        description (str | None, optional): asset description. Defaults to None.
+        roles (list[str] | None, optional): asset roles. Defaults to None.
+        fields (dict[str, Any] | None, optional): extension fields of the asset. Defaults to None.
+
+    Returns:
+        dict[str, Any]: asset dictionary
+    """
+    asset: dict[str, Any] = {"href": href}
+    if media_type is not None:
+        asset["type"] = media_type
+    if title is not None:
+        asset["title"] = title
+    if description is not None:
+        asset["description"] = description
+    if fields:
+        asset.update(fields)
+    if roles is not None:
+        asset["roles"] = roles
+    return asset
+
+
+def geometry_dict(geometry: Geometry) -> dict[str, Any]:
+    """GeoJSON dictionary of a geometry, as `shapely.geometry.mapping` with coordinates given as lists.
+
+    Coordinates are read from each ring or part in bulk rather than point by point.
+
+    Args:
+        geometry (Geometry): input geometry
+
+    Returns:
+        dict[str, Any]: GeoJSON geometry
+    """
+    geom_type = geometry.geom_type
+    if geom_type == "GeometryCollection":
+        return {"type": geom_type, "geometries": [geometry_dict(part) for part in geometry.geoms]}
+    return {"type": geom_type, "coordinates": _coordinates(geometry, geom_type, geometry.has_z)}
+
+
+def _coordinates(geometry: Geometry, geom_type: str, include_z: bool) -> list[Any]:
+    if geom_type == "Point":
+        position: list[Any] = shapely.get_coordinates(geometry, include_z).tolist()
+        return position[0] if position else []
+    if geom_type in ("LineString", "LinearRing", "MultiPoint"):
+        return cast(list[Any], shapely.get_coordinates(geometry, include_z).tolist())
+    if geom_type == "Polygon":
+        # A polygon without holes has the coordinates of its exterior
+        rings = (
+            [geometry.exterior, *geometry.interiors]  # type: ignore[attr-defined]
+            if shapely.get_num_interior_rings(geometry)
+            else [geometry]
+        )
+        return [shapely.get_coordinates(ring, include_z).tolist() for ring in rings]
+    return [
+        _coordinates(part, part.geom_type, include_z)
+        for part in geometry.geoms  # type: ignore[attr-defined]
+    ]
+
+
+def projection_fields(
+    epsg: int | None,
+    wkt2: str | None,
+    shape: list[int] | None = None,
+    transform: list[float] | None = None,
+) -> dict[str, Any]:
+    """Projection extension fields of an item or asset. Fields without a value are left out.
+
+    Args:
+        epsg (int | None): epsg code of the crs
+        wkt2 (str | None): wkt2 description of the crs
+        shape (list[int] | None, optional): number of pixels in the y and x directions. Defaults to None.
+        transform (list[float] | None, optional): affine transform coefficients of the grid. Defaults to None.
+
+    Returns:
+        dict[str, Any]: projection fields
+    """
+    fields = {
+        "proj:code": f"EPSG:{epsg}" if epsg else None,
+        "proj:wkt2": wkt2,
+        "proj:shape": shape,
+        "proj:transform": transform,
+    }
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+class ItemRecord:
+    """Compact description of a STAC Item, filled in directly by the item generators.
+
+    A record holds plain dictionaries and serialises straight to a dictionary without building `pystac` objects. Use `to_item` when a `pystac.Item` is needed, i.e. to add the item to a collection.
+    """
+
+    __slots__ = (
+        "assets",
+        "bbox",
+        "collection",
+        "datetime",
+        "geometry",
+        "id",
+        "properties",
+        "stac_extensions",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        geometry: dict[str, Any] | None,
+        bbox: list[float] | None,
+        datetime: pydatetime.datetime | None,
+        properties: dict[str, Any],
+        start_datetime: pydatetime.datetime | None = None,
+        end_datetime: pydatetime.datetime | None = None,
+        assets: dict[str, dict[str, Any]] | None = None,
+        stac_extensions: list[str] | None = None,
+        collection: str | None = None,
+    ) -> None:
+        """Constructor, with the arguments of `pystac.Item`
+
+        Args:
+            id (str): item id
+            geometry (dict[str, Any] | None): GeoJSON geometry of the item in WGS 84
+            bbox (list[float] | None): bounding box of the item in WGS 84
+            datetime (pydatetime.datetime | None): item datetime
+            properties (dict[str, Any]): item properties. Start and end datetimes are added to the properties
+            start_datetime (pydatetime.datetime | None, optional): start of the item's time range. Defaults to None.
+            end_datetime (pydatetime.datetime | None, optional): end of the item's time range. Defaults to None.
+            assets (dict[str, dict[str, Any]] | None, optional): asset dictionaries keyed by asset key. Defaults to None.
+            stac_extensions (list[str] | None, optional): schema uris of the extensions used by the item. Defaults to None.
+            collection (str | None, optional): id of the item's collection. Defaults to None.
+        """
+        self.id = id
+        self.geometry = geometry
+        self.bbox = bbox
+        self.datetime = datetime
+        self.properties = properties
+        if start_datetime:
+            properties["start_datetime"] = datetime_to_str(start_datetime)
+        if end_datetime:
+            properties["end_datetime"] = datetime_to_str(end_datetime)
+        self.assets = assets if assets is not None else {}
+        self.stac_extensions = stac_extensions if stac_extensions is not None else []
+        self.collection = collection
+
+    def __repr__(self) -> str:
+        return f"<ItemRecord id={self.id}>"
+
+    def add_extension(self, schema_uri: str) -> None:
+        """Declare that the item or one of its assets uses an extension"""
+        if schema_uri not in self.stac_extensions:
+            self.stac_extensions.append(schema_uri)
+
+    def add_asset(self, key: str, asset: dict[str, Any] | pystac.Asset) -> None:
+        """Add an asset, given as a dictionary or as a `pystac.Asset`"""
+        self.assets[key] = asset.to_dict() if isinstance(asset, pystac.Asset) else asset
+
+    def to_dict(self) -> dict[str, Any]:
+        """Item dictionary, with the keys in the order `pystac.Item.to_dict` writes them. Records have no links"""
+        document: dict[str, Any] = {
+            "type": "Feature",
+            "stac_version": pystac.get_stac_version(),
+            "stac_extensions": self.stac_extensions,
+            "id": self.id,
+            "geometry": self.geometry,
+            "bbox": self.bbox if self.bbox is not None else [],
+            "properties": {
+                **self.properties,
+                "datetime": datetime_to_str(self.datetime) if self.datetime is not None else None,
+            },
+            "links": [],
+            "assets": self.assets,
+        }
+        if self.collection:
+            document["collection"] = self.collection
+        # This field is prohibited if there's no geometry
+        if not self.geometry:
+            document.pop("bbox")
+        return document
+
+    def to_item(self) -> pystac.Item:
+        """Convert the record to a `pystac.Item`"""
+        return pystac.Item.from_dict(self.to_dict(), migrate=False, preserve_dict=False)
+
+    @classmethod
+    def from_item(cls, item: pystac.Item) -> ItemRecord:
+        """Record of a `pystac.Item`. Links of the item are dropped"""
+        return cls(
+            item.id,
+            geometry=item.geometry,
+            bbox=item.bbox,
+            datetime=item.datetime,
+            properties=dict(item.properties),
+            assets={key: asset.to_dict() for key, asset in item.assets.items()},
+            stac_extensions=list(item.stac_extensions),
+            collection=item.collection_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ItemPayload:
+    """Compact form of a generated item, returned by the workers generating items.
+
+    The item is carried as json bytes along with the scalars the collection's extent is computed from, so that
+    a worker process sends a few small objects to the parent process rather than a pickled `pystac.Item`. The
+    parent computes the collection's extent from the scalars, and writers decode each item dictionary as they
+    write it. A `pystac.Item` is only built when a `pystac.Collection` is requested.
+    """
+
+    id: str
+    """Item id"""
+    content: bytes
+    """Json encoding of the item dictionary"""
+    bounds: tuple[float, float, float, float] | None
+    """Bounds of the item's geometry in WGS 84. None if the item has no geometry"""
+    datetime: pydatetime.datetime | None
+    """Item datetime, as decoded from the item dictionary"""
+
+    @classmethod
+    def from_dict(cls, document: dict[str, Any]) -> ItemPayload:
+        """Payload of an item dictionary, as given by `ItemRecord.to_dict`"""
+        timestamp = document["properties"]["datetime"]
+        geometry = document["geometry"]
+        return cls(
+            document["id"],
+            json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode(),
+            shape(geometry).bounds if geometry else None,
+            str_to_datetime(timestamp) if timestamp is not None else None,
+        )
+
+    @classmethod
+    def from_record(cls, record: ItemRecord) -> ItemPayload:
+        """Payload of a generated record"""
+        return cls.from_dict(record.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decode the item dictionary"""
+        return cast(dict[str, Any], json.loads(self.content))
+
+    def to_item(self) -> pystac.Item:
+        """Decode the item as a `pystac.Item`"""
+        return pystac.Item.from_dict(self.to_dict(), migrate=False, preserve_dict=False)
+
+
+@dataclass(frozen=True)
+class ItemDocuments:
+    """Dictionaries of the items of a collection, decoded one at a time from their payloads.
+
+    Unlike a generator, the documents can be iterated more than once, e.g. by a writer inferring a schema before
+    writing the items.
+    """
+
+    payloads: Sequence[ItemPayload]
+    """Payloads of the items"""
+    collection: str
+    """Id of the items' collection, set as their `collection` field"""
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for payload in self.payloads:
+            yield {**payload.to_dict(), "collection": self.collection}
+
+    def __len__(self) -> int:
+        return len(self.payloads)
@@ -1,5 +1,6 @@
 import abc
 import datetime
+import hashlib
 import logging
 from collections.abc import Sequence
 from typing import Annotated, Any, Literal, NotRequired, Required, TypeVar
@@ -120,6 +121,19 @@ class SourceConfig(StacItemConfig):
     json_body: Any = None
     """HTTP query body content for getting file from `location`"""
 
+    @property
+    def requires_download(self) -> bool:
+        """Whether the asset can only be retrieved by replaying the configured HTTP request, as opposed to
+        being read in place with range requests. This is the case for non-GET requests or requests with a body.
+        """
+        return (self.method or "GET") != "GET" or any(
+            body is not None for body in (self.content, self.data, self.json_body)
+        )
+
+    def content_hash(self) -> str:
+        """Hash of the config's fields, identifying the config an item was generated from"""
+        return hashlib.sha256(self.model_dump_json().encode()).hexdigest()
+
     def to_common_metadata(self) -> dict[str, Any]:
         """Method to convert config to a python dictionary of common metadata excluding id"""
         return StacCollectionConfig.model_construct(
@@ -179,6 +193,168 @@ class ColumnInfo(TypedDict):
     """Column data type"""
 
 
+FOOTPRINT_METHOD = Literal[
+    "default",
+    "bbox",
+    "convex_hull",
+    "concave_hull",
+    "simplify",
+    "coverage",
+]
+
+
+class FootprintConfig(BaseModel):
+    """Describes how an item's footprint geometry is derived from the geometries of a vector/point asset.
+
+    - `default`: up to 10 raw geometries, falling back to the bounding box.
+    - `bbox`: bounding box of the asset.
+    - `convex_hull`: convex hull of all geometries.
+    - `concave_hull`: concave hull of all geometries controlled by `ratio`.
+    - `simplify`: union of all geometries, simplified to `max_vertices`.
+    - `coverage`: coverage union of non-overlapping polygons, snapped to `grid_size`. Suitable for
+    polygon coverages such as cadastre or paddock boundaries.
+
+    Except for `default` and `bbox`, footprints are simplified to at most `max_vertices` vertices. Footprints
+    are computed in the asset's crs before being converted to WGS 84.
+    """
+
+    method: FOOTPRINT_METHOD = "default"
+    """Footprint strategy"""
+    max_vertices: int = Field(default=1000, gt=4)
+    """Vertex budget of the footprint. Footprints exceeding the budget are simplified, then replaced with the convex hull and finally the bounding box."""
+    ratio: float = Field(default=0.3, ge=0, le=1)
+    """Concave hull ratio. 1 produces the convex hull, lower values produce tighter hulls"""
+    grid_size: float | None = None
+    """Precision grid size in the asset's crs units. Used by `coverage` to snap shared edges before union"""
+
+
+class ValidationConfig(BaseModel):
+    """Describes how generated STAC metadata is validated before serialisation.
+
+    Schemas are resolved offline first: the core STAC schemas bundled with pystac, then the schema directory, which
+    mirrors schema urls (i.e. `<schema_dir>/stac-extensions.github.io/projection/v2.0.0/schema.json`). Schemas missing
+    from both are downloaded into the schema directory unless `offline` is set, so a directory populated by one online
+    run can be copied to air-gapped nodes.
+
+    Items are validated by the collection generator's workers as they are produced. With `sample` below 1, a
+    deterministic fraction of the items is validated, along with every item whose structure (extensions, properties,
+    asset fields, geometry type) has not been seen by the worker.
+    """
+
+    enabled: bool = True
+    """Whether generated metadata is validated"""
+    sample: float = Field(default=1.0, ge=0, le=1)
+    """Fraction of items validated in addition to the structurally unique items"""
+    schema_dir: str | None = None
+    """Schema directory. Defaults to `STAC_GENERATOR_SCHEMA_DIR` or `~/.cache/stac_generator/schemas`"""
+    offline: bool = False
+    """Never download schemas. Also enabled by setting `STAC_GENERATOR_OFFLINE`"""
+    strict: bool = False
+    """Raise if a schema is unavailable instead of skipping it with a warning"""
+
+
+OUTPUT_FORMAT = Literal["json", "ndjson", "geoparquet"]
+COMPRESSION = Literal["gzip", "zstd"]
+WRITE_MODE = Literal["overwrite", "append", "update"]
+
+
+class WriterConfig(BaseModel):
+    """Describes how a collection is written to the local file system.
+
+    - `json`: one json file per item and a collection listing every item. Items are serialised and written by a pool
+    of threads in batches. Every file is written to a temporary file next to its destination and renamed in place once
+    its batch has been flushed, so readers never observe partially written files.
+    - `ndjson`: the collection json file and a single `items.ndjson` file holding one item per line, suitable for bulk
+    loaders such as pgstac. Neither the collection nor the items have hierarchical links.
+    - `geoparquet`: the collection json file and a single `items.parquet` file following the
+    <a href=https://github.com/stac-utils/stac-geoparquet/blob/main/spec/stac-geoparquet-spec.md>stac-geoparquet</a>
+    specification, for analytics with DuckDB, pandas or GeoPandas. Requires the `pyarrow` package.
+
+    A `json` collection written before can be changed incrementally instead of being regenerated:
+
+    - `append`: only the configs whose id is not in the collection are generated.
+    - `update`: the configs whose id is not in the collection or whose fields changed since their item was written are
+    generated.
+
+    Only the existing collection document and its item index are read. The generated items are written, replacing
+    the items of the same id, the collection's extents are widened to cover them and the collection document is
+    rewritten. Other item files are left untouched.
+    """
+
+    format: OUTPUT_FORMAT = "json"
+    """Output format"""
+    compression: COMPRESSION | None = None
+    """Compression of the `ndjson` items file (`zstd` requires the `zstandard` package), or the codec of the
+    `geoparquet` items file (snappy by default)."""
+    max_workers: int | None = Field(default=None, gt=0)
+    """Number of in-flight writes. Defaults to `min(32, os.cpu_count() + 4)`."""
+    batch_size: int = Field(default=64, gt=0)
+    """Number of files written by a thread before they are flushed with fsync and renamed"""
+    fsync: bool = True
+    """Whether files and their directories are flushed to disk before being renamed in place"""
+    row_group_size: int = Field(default=10000, gt=0)
+    """Number of items per row group of the `geoparquet` items file"""
+    mode: WRITE_MODE = "overwrite"
+    """Whether an existing `json` collection is regenerated, or only appended new items or updated changed items"""
+
+
+SYNC_MODE = Literal["manifest", "remote"]
+
+
+class ApiConfig(BaseModel):
+    """Describes how a collection is pushed to a STAC API implementing the Transactions extension.
+
+    Requests are sent over a single pooled client that keeps connections alive. The collection is written first, then
+    up to `concurrency` item requests are in flight at once. If the API provides the bulk items endpoint
+    (`POST /collections/{collection_id}/bulk_items`), items are upserted in batches of `batch_size`. Otherwise, each
+    item is POSTed, then PUT if it already exists. Requests answered with 429 or 5xx are retried with jittered
+    exponential backoff, waiting at least as long as the `Retry-After` header asks.
+
+    With `sync`, only new and changed items are sent, compared by content hash with the items already in the API:
+
+    - `manifest`: hashes of the last push, kept in a local manifest file.
+    - `remote`: hashes of the items read back by paging through the API's collection items.
+    """
+
+    batch_size: int = Field(default=500, gt=0)
+    """Number of items per bulk request"""
+    bulk: bool | None = None
+    """Whether items are sent to the bulk items endpoint. Defaults to detecting the endpoint from the API's conformance classes and OpenAPI document."""
+    http2: bool = False
+    """Whether to negotiate HTTP/2. Requires the `h2` package."""
+    gzip: bool = False
+    """Whether request bodies are gzip compressed. The API must accept `Content-Encoding: gzip` requests."""
+    timeout: float = Field(default=30, gt=0)
+    """Request timeout in seconds"""
+    concurrency: int = Field(default=8, gt=0)
+    """Maximum number of concurrent item requests"""
+    max_retries: int = Field(default=5, ge=0)
+    """Number of times a request answered with 429, 5xx or a transport error is retried"""
+    backoff: float = Field(default=0.5, gt=0)
+    """Base delay in seconds of the exponential backoff between retries"""
+    max_backoff: float = Field(default=60, gt=0)
+    """Maximum delay in seconds between retries, unless the API asks for a longer one with `Retry-After`"""
+    failed_path: str | None = None
+    """File receiving the summary of items that could not be pushed. Defaults to None, which only logs the failed ids."""
+    item_ids: list[str] | None = None
+    """Ids of the items pushed, for instance the ids of a failure summary. Defaults to None, which pushes every item."""
+    sync: SYNC_MODE | None = None
+    """Where the hashes of the items already in the API come from. Defaults to None, which pushes every item."""
+    manifest_path: str | None = None
+    """Manifest file of the `manifest` sync mode. Defaults to a file per API and collection under the cache directory."""
+    delete: bool = False
+    """Whether items of the API that are no longer generated are deleted when syncing"""
+    page_size: int = Field(default=1000, gt=0)
+    """Number of items per page when reading the API's items in `remote` sync mode"""
+
+
+class HasFootprint(BaseModel):
+    """Mixin that provides footprint field"""
+
+    footprint: FootprintConfig = Field(default_factory=FootprintConfig)
+    """Footprint generation strategy for the item's geometry"""
+
+
 class HasColumnInfo(BaseModel):
     """Mixin that provides column info field"""
 
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import datetime as pydatetime
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pystac.utils import datetime_to_str, str_to_datetime
+
+from stac_generator.core.base.fetch import CACHE_DIR_ENV, DEFAULT_CACHE_DIR
+from stac_generator.core.base.writer import DATETIME_PROPERTIES
+
+MANIFEST_DIR = "manifests"
+"""Directory of the cache directory holding the default manifests"""
+
+
+SERVER_FIELDS = frozenset({"links", "collection", "stac_version", "stac_extensions"})
+"""Fields that STAC APIs rewrite or add to the objects they serve, left out of content hashes"""
+SERVER_PROPERTIES = frozenset({"created", "updated"})
+"""Item properties that STAC APIs manage, left out of content hashes"""
+
+
+def _canonical_datetime(value: Any) -> Any:
+    """Datetime string in UTC with the shortest precision. Values that are not datetimes are returned as is"""
+    if not isinstance(value, str):
+        return value
+    try:
+        timestamp = str_to_datetime(value)
+    except ValueError:
+        return value
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=pydatetime.UTC)
+    return datetime_to_str(timestamp.astimezone(pydatetime.UTC))
+
+
+def item_hash(stac: dict[str, Any]) -> str:
+    """Canonical content hash of a STAC Item or Collection dictionary.
+
+    Keys are sorted, and the fields STAC APIs rewrite or add to the objects they serve are left out: links, the
+    collection id, the STAC version and extensions, and the `created` and `updated` properties. Datetime properties
+    and the collection's temporal extent are compared in UTC, as APIs may format datetimes differently. Content
+    read back from an API therefore hashes the same as the generated content, unless the API changes other fields.
+
+    Args:
+        stac (dict[str, Any]): STAC object dictionary
+
+    Returns:
+        str: sha256 hex digest
+    """
+    content = {key: value for key, value in stac.items() if key not in SERVER_FIELDS}
+    if isinstance(properties := content.get("properties"), dict):
+        content["properties"] = {
+            key: _canonical_datetime(value) if key in DATETIME_PROPERTIES else value
+            for key, value in properties.items()
+            if key not in SERVER_PROPERTIES
+        }
+    if isinstance(extent := content.get("extent"), dict) and isinstance(
+        temporal := extent.get("temporal"), dict
+    ):
+        intervals = [
+            [_canonical_datetime(value) for value in interval]
+            for interval in temporal.get("interval", [])
+        ]
+        content["extent"] = {**extent, "temporal": {**temporal, "interval": intervals}}
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def default_manifest_path(url: str, collection_id: str) -> Path:
+    """Manifest location of a collection pushed to an API, under `STAC_GENERATOR_CACHE_DIR` or `~/.cache/stac_generator`"""
+    key = hashlib.sha256(f"{url.rstrip('/')}\n{collection_id}".encode()).hexdigest()
+    return Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)) / MANIFEST_DIR / f"{key}.json"
+
+
+@dataclass
+class SyncManifest:
+    """Content hashes of a collection and its items as last pushed to a STAC API"""
+
+    collection: str | None = None
+    """Hash of the collection. None if the collection has not been pushed"""
+    items: dict[str, str] = field(default_factory=dict)
+    """Hash of every pushed item, keyed by item id"""
+
+    @classmethod
+    def read(cls, path: str | Path) -> SyncManifest:
+        """Read a manifest. A missing manifest is empty, so every item is pushed"""
+        try:
+            with Path(path).open() as file:
+                content = json.load(file)
+        except FileNotFoundError:
+            return cls()
+        return cls(content.get("collection"), content.get("items", {}))
+
+    def write(self, path: str | Path) -> None:
+        """Write the manifest atomically, so an interrupted run leaves the previous manifest in place"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump({"collection": self.collection, "items": self.items}, tmp)
+        Path(tmp.name).replace(path)
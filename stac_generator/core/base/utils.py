@@ -3,7 +3,12 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
 import urllib.parse
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
@@ -11,9 +16,12 @@ import geopandas as gpd
 import httpx
 import numpy as np
 import pandas as pd
+import pyogrio
 import pytz
+import shapely
 import yaml
 from pyogrio.errors import DataLayerError, DataSourceError
+from pyproj.transformer import Transformer
 from shapely import Geometry, GeometryCollection, centroid
 from timezonefinder import TimezoneFinder
 
@@ -23,15 +31,23 @@ from stac_generator.exceptions import (
     SourceAssetException,
     SourceAssetLocationException,
     StacConfigException,
+    StacException,
     TimezoneException,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from pyproj.crs.crs import CRS
 
-    from stac_generator._types import TimeSequence, TimeSeries, Timestamp
+    from stac_generator._types import (
+        CookieTypes,
+        HeaderTypes,
+        QueryParamTypes,
+        TimeSequence,
+        TimeSeries,
+        Timestamp,
+    )
     from stac_generator.core.base.schema import ColumnInfo
 
 SUPPORTED_URI_SCHEMES = ["http", "https"]
@@ -226,6 +242,176 @@ def localise_timezone(data: Timestamp | TimeSeries, tzinfo: str) -> Timestamp |
     return data.apply(localise)
 
 
+@dataclass(frozen=True)
+class ReadRequest:
+    """Description of a tabular read performed by an `ItemGenerator`. Used by `ReadPlan` to merge reads of the same asset."""
+
+    kind: Literal["csv", "vector"]
+    """Reader type"""
+    location: str
+    """Asset location"""
+    layer: str | int | None = None
+    """Vector layer"""
+    columns: frozenset[str] | None = None
+    """Columns to be read. None means all columns"""
+    date_columns: frozenset[str] = frozenset()
+    """Columns to be parsed as dates"""
+    date_format: str | None = "ISO8601"
+    """Date format for parsing date columns"""
+
+    @property
+    def key(self) -> tuple[str, str, str | int | None, str | None]:
+        """Requests with the same key are served by the same read"""
+        return (self.kind, self.location, self.layer, self.date_format)
+
+    @property
+    def source(self) -> tuple[str, str]:
+        """Requests with the same source read the same file, and are handled by the same worker.
+        Layers of a vector source are read together.
+        """
+        return (self.kind, self.location)
+
+
+class ReadPlan:
+    """Merges `ReadRequest`s so that an asset referenced by multiple configs is read once.
+
+    Requests with the same key are merged into one read covering the union of their columns. Csv columns are read
+    unparsed, and each request only gets its own date column parsed, as an individual read would return it. Different
+    layers of a vector asset are read together, in one pass over the datasource. The read is performed lazily on first
+    access and the result is shared by all dependent generators. If the merged read fails, the plan falls back to
+    individual reads so that errors are attributed to the config that caused them. Assets referenced once are not
+    cached.
+
+    The plan is activated with `shared_reads`, after which `read_point_asset`, `read_vector_asset` and
+    `read_join_asset` are served by the plan where possible.
+    """
+
+    def __init__(self, requests: Iterable[ReadRequest]) -> None:
+        self.columns: dict[tuple[Any, ...], set[str] | None] = {}
+        self.date_columns: dict[tuple[Any, ...], set[str]] = {}
+        self.counts: dict[tuple[Any, ...], int] = {}
+        self.layers: dict[str, list[str | int | None]] = {}
+        """Requested layers of each vector asset"""
+        self._frames: dict[tuple[Any, ...], pd.DataFrame | None] = {}
+        self._dates: dict[tuple[Any, ...], pd.Series] = {}
+        for request in requests:
+            self.add(request)
+
+    def add(self, request: ReadRequest) -> None:
+        """Merge a read request into the plan"""
+        key = request.key
+        if key not in self.counts:
+            self.counts[key] = 0
+            self.columns[key] = set()
+            self.date_columns[key] = set()
+        self.counts[key] += 1
+        columns = self.columns[key]
+        if request.columns is None or columns is None:
+            self.columns[key] = None
+        else:
+            columns.update(request.columns)
+        self.date_columns[key].update(request.date_columns)
+        if request.kind == "vector":
+            layers = self.layers.setdefault(request.location, [])
+            if request.layer not in layers:
+                layers.append(request.layer)
+
+    def is_shared(self, key: tuple[Any, ...]) -> bool:
+        """Whether the asset described by key is requested more than once"""
+        return self.counts.get(key, 0) > 1
+
+    def _read(self, key: tuple[Any, ...]) -> pd.DataFrame | None:
+        if key in self._frames:
+            return self._frames[key]
+        kind, location, layer, date_format = key
+        logger.debug(f"Reading shared asset: {location}, requested {self.counts[key]} times")
+        # Deactivate the plan so that the readers below perform the actual read
+        token = _READ_PLAN.set(None)
+        try:
+            if kind == "vector":
+                layers = self.layers[location]
+                frames = dict(zip(layers, read_vector_layers(location, layers), strict=True))
+                for other in layers:
+                    self._frames[ReadRequest("vector", location, layer=other).key] = frames[other]
+                frame: pd.DataFrame | None = frames[layer]
+            else:
+                frame = _read_csv(location, date_format=date_format, columns=self.columns[key])
+        except StacException:
+            logger.debug(f"Shared read failed for {location}. Falling back to individual reads")
+            frame = None
+            if kind == "vector":
+                for other in self.layers[location]:
+                    self._frames[ReadRequest("vector", location, layer=other).key] = None
+        finally:
+            _READ_PLAN.reset(token)
+        self._frames[key] = frame
+        return frame
+
+    def read_csv(
+        self,
+        src_path: str,
+        usecols: set[str] | None,
+        date_col: str | None,
+        date_format: str | None,
+    ) -> pd.DataFrame | None:
+        """Serve a csv read from the plan. Returns None if the read is not shared"""
+        key = ReadRequest("csv", src_path, date_format=date_format).key
+        if not self.is_shared(key) or (date_col and date_col not in self.date_columns[key]):
+            return None
+        frame = self._read(key)
+        if frame is None or (date_col and date_col not in frame.columns):
+            return None
+        if usecols is None:
+            frame = frame.copy(deep=False)
+        else:
+            frame = frame[[col for col in frame.columns if col in usecols]]
+        if not date_col:
+            return frame
+        if (key, date_col) not in self._dates:
+            self._dates[(key, date_col)] = _parse_date_column(frame[date_col], date_format)
+        return frame.assign(**{date_col: self._dates[(key, date_col)]})
+
+    def read_vector(self, src_path: str, layer: str | int | None) -> gpd.GeoDataFrame | None:
+        """Serve a vector read from the plan. Returns None if the read is not shared"""
+        key = ReadRequest("vector", src_path, layer=layer).key
+        if not self.is_shared(key) and len(self.layers.get(src_path, [])) < 2:
+            return None
+        frame = self._read(key)
+        return frame.copy(deep=False) if frame is not None else None
+
+
+_READ_PLAN: ContextVar[ReadPlan | None] = ContextVar("read_plan", default=None)
+
+
+@contextmanager
+def shared_reads(plan: ReadPlan) -> Iterator[ReadPlan]:
+    """Context manager that serves asset reads in the current thread from a `ReadPlan`"""
+    token = _READ_PLAN.set(plan)
+    try:
+        yield plan
+    finally:
+        _READ_PLAN.reset(token)
+
+
+def _parse_date_column(values: pd.Series, date_format: str | None) -> pd.Series:
+    """Parse a column read without `parse_dates` the way `pd.read_csv` parses its date columns.
+    Columns that cannot be parsed are returned as objects, as `pd.read_csv` does.
+    """
+    if values.dtype.kind in "Mm":
+        return values
+    strings = values.astype(object).where(values.isna(), values.astype(str))
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            ".*parsing datetimes with mixed time zones will raise an error",
+            category=FutureWarning,
+        )
+        try:
+            return pd.to_datetime(strings, format=date_format, utc=False)
+        except (ValueError, TypeError):
+            return strings
+
+
 def _read_csv(
     src_path: str,
     required: set[str] | Sequence[str] | None = None,
@@ -246,6 +432,10 @@ def _read_csv(
             usecols.update(optional)
         if date_col:
             usecols.add(date_col)
+    if (plan := _READ_PLAN.get()) is not None:
+        shared = plan.read_csv(src_path, usecols, date_col, date_format)
+        if shared is not None:
+            return shared
     try:
         return pd.read_csv(
             filepath_or_buffer=src_path,
@@ -333,11 +523,113 @@ def read_point_asset(
     return gdf
 
 
+REMOTE_GDAL_OPTIONS: dict[str, str] = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "VSI_CACHE": "TRUE",
+}
+"""GDAL configuration options applied when reading remote assets through /vsicurl/"""
+
+SIDECAR_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    ".shp": (".shp", ".shx", ".dbf", ".prj", ".cpg"),
+    ".zarr": (),
+}
+"""Files GDAL must be allowed to probe for a given primary extension. Empty if the asset is a directory store"""
+
+_GDAL_CONFIG_LOCK = threading.Lock()
+
+
+def is_remote(location: str | Path) -> bool:
+    """Check if location must be accessed over http(s)"""
+    return urllib.parse.urlsplit(str(location)).scheme in SUPPORTED_URI_SCHEMES
+
+
+def cookie_header(cookies: CookieTypes) -> str:
+    """Format cookies as the value of a `Cookie` request header"""
+    return "; ".join(f"{key}={value}" for key, value in httpx.Cookies(cookies).items())
+
+
+def vsi_path(location: str | Path, params: QueryParamTypes | None = None) -> str:
+    """Rewrite a remote location to a GDAL virtual filesystem path.
+
+    Http(s) urls are prefixed with `/vsicurl/` (or `/vsizip//vsicurl/` for zip archives) so that GDAL reads
+    the asset with range requests instead of downloading it. Local paths are returned unchanged.
+
+    Args:
+        location (str | Path): asset location
+        params (QueryParamTypes | None, optional): query params to append to the url. Defaults to None.
+
+    Returns:
+        str: GDAL readable path
+    """
+    if not is_remote(location):
+        return str(location)
+    url = str(httpx.URL(str(location), params=params)) if params else str(location)
+    if urllib.parse.urlsplit(url).path.lower().endswith(".zip"):
+        return f"/vsizip//vsicurl/{url}"
+    return f"/vsicurl/{url}"
+
+
+def gdal_remote_options(
+    location: str | Path,
+    headers: HeaderTypes | None = None,
+    cookies: CookieTypes | None = None,
+) -> dict[str, str]:
+    """GDAL configuration options for reading location. Empty if location is a local path.
+
+    Directory listing and sidecar probing are disabled, consecutive range requests are merged and
+    multiplexed over a single connection, and `headers`/`cookies` are forwarded with every request.
+
+    Args:
+        location (str | Path): asset location
+        headers (HeaderTypes | None, optional): HTTP headers. Defaults to None.
+        cookies (CookieTypes | None, optional): HTTP cookies. Defaults to None.
+
+    Returns:
+        dict[str, str]: GDAL configuration options
+    """
+    if not is_remote(location):
+        return {}
+    options = dict(REMOTE_GDAL_OPTIONS)
+    suffix = Path(urllib.parse.urlsplit(str(location)).path).suffix.lower()
+    if suffix and (allowed := SIDECAR_EXTENSIONS.get(suffix, (suffix,))):
+        options["CPL_VSIL_CURL_ALLOWED_EXTENSIONS"] = ",".join(allowed)
+    if headers:
+        options["GDAL_HTTP_HEADERS"] = "\r\n".join(
+            f"{key}: {value}" for key, value in httpx.Headers(headers).items()
+        )
+    if cookies:
+        options["GDAL_HTTP_COOKIE"] = cookie_header(cookies)
+    return options
+
+
+@contextmanager
+def vector_remote_env(options: dict[str, str]) -> Iterator[None]:
+    """Apply GDAL configuration options to pyogrio for the duration of the context.
+
+    pyogrio configuration is process wide, so remote vector reads are serialised and previous values restored on exit.
+    """
+    if not options:
+        yield
+        return
+    with _GDAL_CONFIG_LOCK:
+        previous = {key: pyogrio.get_gdal_config_option(key) for key in options}
+        pyogrio.set_gdal_config_options(options)
+        try:
+            yield
+        finally:
+            pyogrio.set_gdal_config_options(previous)
+
+
 def read_vector_asset(
     src_path: str | Path,
     bbox: tuple[float, float, float, float] | None = None,
     columns: set[str] | Sequence[str] | None = None,
     layer: str | int | None = None,
+    headers: HeaderTypes | None = None,
+    cookies: CookieTypes | None = None,
+    params: QueryParamTypes | None = None,
 ) -> gpd.GeoDataFrame:
     """Read in vector asset from disk or remote.
 
@@ -350,6 +642,9 @@ def read_vector_asset(
         bbox (tuple[float, float, float, float] | None, optional): bbox to define the region of interest. Defaults to None.
         columns (set[str] | Sequence[str] | None, optional): sequence of columns to be read from the vector file. Defaults to None.
         layer (str | int | None, optional): layer indentifier for a multilayered asset. Defaults to None.
+        headers (HeaderTypes | None, optional): HTTP headers for a remote asset. Defaults to None.
+        cookies (CookieTypes | None, optional): HTTP cookies for a remote asset. Defaults to None.
+        params (QueryParamTypes | None, optional): HTTP query params for a remote asset. Defaults to None.
 
     Raises:
         StacConfigException: if the provided layer is non-existent
@@ -358,14 +653,95 @@ def read_vector_asset(
     Returns:
         gpd.GeoDataFrame: read dataframe
     """
+    if (
+        bbox is None
+        and columns is None
+        and headers is None
+        and cookies is None
+        and params is None
+        and (plan := _READ_PLAN.get()) is not None
+        and (shared := plan.read_vector(str(src_path), layer)) is not None
+    ):
+        return shared
     try:
-        return gpd.read_file(
-            filename=src_path,
-            bbox=bbox,
-            columns=columns,
-            layer=layer,
-            engine="pyogrio",  # For predictability
-        )
+        with vector_remote_env(gdal_remote_options(src_path, headers, cookies)):
+            return gpd.read_file(
+                filename=vsi_path(src_path, params),
+                bbox=bbox,
+                columns=columns,
+                layer=layer,
+                engine="pyogrio",  # For predictability
+            )
+    except DataLayerError:
+        raise StacConfigException(
+            f"Invalid layer. File: {src_path}, layer: {layer}. The config describes a non-existent layer in the vector asset. Fix this error by removing the layer field or changing it to a valid layer."
+        ) from None
+    except DataSourceError as e:
+        raise SourceAssetException(str(e) + f". Asset: {src_path}") from None
+
+
+def list_vector_layers(
+    src_path: str | Path,
+    headers: HeaderTypes | None = None,
+    cookies: CookieTypes | None = None,
+    params: QueryParamTypes | None = None,
+) -> list[str]:
+    """List the layers of a vector asset. The datasource is opened once.
+
+    Args:
+        src_path (str | Path): path to asset.
+        headers (HeaderTypes | None, optional): HTTP headers for a remote asset. Defaults to None.
+        cookies (CookieTypes | None, optional): HTTP cookies for a remote asset. Defaults to None.
+        params (QueryParamTypes | None, optional): HTTP query params for a remote asset. Defaults to None.
+
+    Raises:
+        SourceAssetException: if the asset cannot be accessed or is malformatted
+
+    Returns:
+        list[str]: layer names
+    """
+    try:
+        with vector_remote_env(gdal_remote_options(src_path, headers, cookies)):
+            return [str(name) for name, _ in pyogrio.list_layers(vsi_path(src_path, params))]
+    except DataSourceError as e:
+        raise SourceAssetException(str(e) + f". Asset: {src_path}") from None
+
+
+def read_vector_layers(
+    src_path: str | Path,
+    layers: Sequence[str | int | None],
+    headers: HeaderTypes | None = None,
+    cookies: CookieTypes | None = None,
+    params: QueryParamTypes | None = None,
+) -> list[gpd.GeoDataFrame]:
+    """Read several layers of a vector asset in one pass over the datasource.
+
+    Layers are read one after the other under a single GDAL configuration, so blocks of a remote datasource
+    fetched for a layer are served from GDAL's cache for the next layers.
+
+    Args:
+        src_path (str | Path): path to asset.
+        layers (Sequence[str | int | None]): layers to read. None reads the first layer
+        headers (HeaderTypes | None, optional): HTTP headers for a remote asset. Defaults to None.
+        cookies (CookieTypes | None, optional): HTTP cookies for a remote asset. Defaults to None.
+        params (QueryParamTypes | None, optional): HTTP query params for a remote asset. Defaults to None.
+
+    Raises:
+        StacConfigException: if a layer is non-existent
+        SourceAssetException: if the asset cannot be accessed or is malformatted
+
+    Returns:
+        list[gpd.GeoDataFrame]: dataframe of each layer
+    """
+    logger.debug(f"Reading layers {list(layers)} of vector asset: {src_path}")
+    path = vsi_path(src_path, params)
+    layer = None
+    try:
+        with vector_remote_env(gdal_remote_options(src_path, headers, cookies)):
+            frames = []
+            for layer in layers:
+                frames.append(gpd.read_file(filename=path, layer=layer, engine="pyogrio"))
+            return frames
     except DataLayerError:
         raise StacConfigException(
             f"Invalid layer. File: {src_path}, layer: {layer}. The config describes a non-existent layer in the vector asset. Fix this error by removing the layer field or changing it to a valid layer."
@@ -412,6 +788,146 @@ def add_timestamps(properties: dict[Any, Any], timestamps: TimeSequence) -> None
     properties["timestamps"] = timestamps_str
 
 
+@dataclass(frozen=True)
+class CRSInfo:
+    """CRS lookups that hit the PROJ database, computed once per CRS and process"""
+
+    epsg: int | None
+    """EPSG code of the crs if it can be identified"""
+    wkt2: str
+    """WKT representation of the crs"""
+    transformer: Transformer
+    """Transformer from the crs to EPSG:4326 with (x, y) axis order"""
+
+    def to_wgs84(self, geometry: Geometry) -> Geometry:
+        """Reproject geometry to EPSG:4326"""
+        return shapely.transform(
+            geometry,
+            lambda coords: np.column_stack(self.transformer.transform(coords[:, 0], coords[:, 1])),
+        )
+
+
+_CRS_CACHE: dict[tuple[str, str], CRSInfo] = {}
+
+
+def get_crs_info(crs: Any) -> CRSInfo:
+    """Cached epsg, wkt2 and EPSG:4326 transformer of a pyproj or rasterio crs.
+
+    Entries are keyed on the crs' definition string (the input definition for pyproj, the WKT for rasterio),
+    so items sharing a crs only pay for the PROJ database lookups once.
+
+    Args:
+        crs (Any): pyproj or rasterio crs
+
+    Returns:
+        CRSInfo: cached crs information
+    """
+    key = (type(crs).__name__, crs.srs if hasattr(crs, "srs") else crs.to_wkt())
+    if (info := _CRS_CACHE.get(key)) is None:
+        logger.debug(f"Caching crs information for: {key[1][:50]}")
+        info = CRSInfo(
+            epsg=crs.to_epsg(),
+            wkt2=crs.to_wkt(),
+            transformer=Transformer.from_crs(crs, 4326, always_xy=True),
+        )
+        _CRS_CACHE[key] = info
+    return info
+
+
+def reproject_bounds(
+    bounds: Sequence[float],
+    crs: CRS,
+    densify_pts: int = 21,
+) -> tuple[float, float, float, float]:
+    """Transform a bounding box to EPSG:4326 without reprojecting the underlying geometries.
+
+    Each edge of the box is densified with `densify_pts` points before transformation so
+    that edges which curve in the target CRS (i.e. MGA/UTM zones) are still enclosed by the result.
+
+    Args:
+        bounds (Sequence[float]): bounding box in the source crs as (minx, miny, maxx, maxy)
+        crs (CRS): source crs
+        densify_pts (int, optional): number of points added to each edge. Defaults to 21.
+
+    Returns:
+        tuple[float, float, float, float]: bounding box in EPSG:4326
+    """
+    left, bottom, right, top = bounds
+    minx, miny, maxx, maxy = get_crs_info(crs).transformer.transform_bounds(
+        left, bottom, right, top, densify_pts=densify_pts
+    )
+    return (minx, miny, maxx, maxy)
+
+
+def merge_bounds(*bounds: Sequence[float]) -> tuple[float, float, float, float]:
+    """Smallest bounding box enclosing bounding boxes given as (minx, miny, maxx, maxy)"""
+    return (
+        min(bound[0] for bound in bounds),
+        min(bound[1] for bound in bounds),
+        max(bound[2] for bound in bounds),
+        max(bound[3] for bound in bounds),
+    )
+
+
+def simplify_to_budget(
+    geometry: Geometry,
+    max_vertices: int,
+    max_iter: int = 20,
+    clip: Sequence[float] | None = None,
+) -> Geometry:
+    """Simplify a geometry until it has at most `max_vertices` vertices.
+
+    The simplification tolerance starts at the extent of the geometry divided by the budget and is
+    doubled until the budget is met. The simplified geometry is buffered by the largest distance of an input
+    vertex outside of it, so that the result covers the input rather than cutting into it. If `clip` is given,
+    the result is clipped to it, or replaced by its box where that is the smaller cover within budget. If
+    simplification cannot meet the budget (i.e. for a large number of points), the convex hull is simplified
+    instead. The bounding box is the last resort.
+
+    Args:
+        geometry (Geometry): input geometry
+        max_vertices (int): vertex budget
+        max_iter (int, optional): maximum number of simplification attempts. Defaults to 20.
+        clip (Sequence[float] | None, optional): bounds (minx, miny, maxx, maxy) enclosing the input, i.e. the extent of a raster. Defaults to None.
+
+    Returns:
+        Geometry: geometry with at most `max_vertices` vertices
+    """
+    if shapely.get_num_coordinates(geometry) <= max_vertices:
+        return geometry
+    minx, miny, maxx, maxy = geometry.bounds
+    vertices = shapely.points(shapely.get_coordinates(geometry))
+    for candidate in (geometry, shapely.convex_hull(geometry)):
+        tolerance = max(maxx - minx, maxy - miny) / max_vertices
+        for _ in range(max_iter):
+            simplified = shapely.simplify(candidate, tolerance, preserve_topology=True)
+            if shapely.get_num_coordinates(simplified) <= max_vertices:
+                # Grow the simplified geometry to the vertices it cuts off. Mitred joins add no vertices
+                overshoot = shapely.distance(simplified, vertices).max()
+                if overshoot > 0:
+                    simplified = shapely.buffer(
+                        simplified,
+                        overshoot * (1 + 1e-9),
+                        quad_segs=1,
+                        cap_style="square",
+                        join_style="mitre",
+                    )
+                    if clip is not None:
+                        # Clipping adds vertices where the grown geometry crosses the bounds
+                        clipped = shapely.clip_by_rect(simplified, *clip)
+                        if shapely.get_num_coordinates(clipped) <= max_vertices:
+                            simplified = clipped
+                        elif simplified.area > (clip_box := shapely.box(*clip)).area:
+                            # The bounds are a tighter cover than the grown geometry
+                            simplified = clip_box
+                if shapely.get_num_coordinates(simplified) <= max_vertices and simplified.covers(
+                    geometry
+                ):
+                    return simplified
+            tolerance *= 2
+    return shapely.box(minx, miny, maxx, maxy)  # pragma: no cover
+
+
 def extract_epsg(crs: CRS) -> tuple[int, bool]:
     """Extract epsg information from crs object.
     If epsg info can be extracted directly from crs, return that value.
@@ -425,11 +941,11 @@ def extract_epsg(crs: CRS) -> tuple[int, bool]:
     Returns:
         tuple[int, bool]: epsg code and reliability flag
     """
-    if (result := crs.to_epsg()) is not None:
-        return (result, True)
+    info = get_crs_info(crs)
+    if info.epsg is not None:
+        return (info.epsg, True)
     # Handle WKT1 edge case
-    wkt = crs.to_wkt()
-    match = re.search(r'ID\["EPSG",(\d+)\]', wkt)
+    match = re.search(r'ID\["EPSG",(\d+)\]', info.wkt2)
     if match:
         return (int(match.group(1)), True)
     # No match - defaults to 4326
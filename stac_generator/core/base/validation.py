@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import urllib.parse
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from pystac.validation.local_validator import get_local_schema_cache
+from pystac.version import STACVersion
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource, Unresolvable
+from referencing.jsonschema import DRAFT7
+
+from stac_generator.core.base.fetch import DEFAULT_CACHE_DIR
+from stac_generator.exceptions import StacValidationException
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from jsonschema.protocols import Validator
+
+    from stac_generator.core.base.schema import ValidationConfig
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIR_ENV = "STAC_GENERATOR_SCHEMA_DIR"
+"""Environment variable overriding the schema directory"""
+OFFLINE_ENV = "STAC_GENERATOR_OFFLINE"
+"""Environment variable disabling schema downloads"""
+DEFAULT_SCHEMA_DIR = DEFAULT_CACHE_DIR / "schemas"
+"""Default schema directory"""
+SCHEMA_TIMEOUT = 10.0
+"""Schema download timeout in seconds"""
+STAC_TYPES = {"Feature": "item", "Collection": "collection", "Catalog": "catalog"}
+"""STAC object type mapped to the name of its core schema"""
+
+
+class SchemaStore:
+    """Offline first store of JSON schemas.
+
+    Schemas are looked up in the core schemas bundled with pystac, then in a directory mirroring schema urls.
+    Schemas missing from both are downloaded and written to the directory unless the store is offline.
+    Schemas are kept in memory once loaded.
+    """
+
+    def __init__(self, directory: str | Path, offline: bool = False) -> None:
+        """Constructor
+
+        Args:
+            directory (str | Path): schema directory
+            offline (bool, optional): never download schemas. Defaults to False.
+        """
+        self.directory = Path(directory)
+        self.offline = offline
+        self._schemas: dict[str, dict[str, Any] | None] = dict(get_local_schema_cache())
+        self._lock = threading.Lock()
+
+    def path(self, uri: str) -> Path:
+        """Location of a schema in the schema directory"""
+        parsed = urllib.parse.urlsplit(uri)
+        return self.directory / parsed.netloc / parsed.path.lstrip("/")
+
+    def get(self, uri: str) -> dict[str, Any] | None:
+        """Get a schema by its uri.
+
+        Args:
+            uri (str): schema uri
+
+        Returns:
+            dict[str, Any] | None: schema, None if it is unavailable
+        """
+        uri = uri.split("#", 1)[0]
+        with self._lock:
+            if uri not in self._schemas:
+                self._schemas[uri] = self._load(uri)
+            return self._schemas[uri]
+
+    def _load(self, uri: str) -> dict[str, Any] | None:
+        path = self.path(uri)
+        if path.exists():
+            with path.open() as file:
+                return _as_schema(json.load(file))
+        if self.offline:
+            return None
+        logger.debug(f"Downloading schema: {uri}")
+        try:
+            response = httpx.get(uri, follow_redirects=True, timeout=SCHEMA_TIMEOUT)
+            response.raise_for_status()
+            schema = _as_schema(response.json())
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f"Unable to download schema: {uri}. {e}")
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as tmp:
+            json.dump(schema, tmp)
+        Path(tmp.name).replace(path)
+        return schema
+
+
+def _as_schema(value: Any) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ValueError("Schema is not a JSON object")
+    return value
+
+
+class StacValidator:
+    """Validates STAC objects against the core and extension schemas they declare.
+
+    Each schema is compiled once into a validator that resolves references through the schema store.
+    Validators are safe to share between threads.
+    """
+
+    def __init__(self, store: SchemaStore, strict: bool = False) -> None:
+        """Constructor
+
+        Args:
+            store (SchemaStore): schema store
+            strict (bool, optional): raise if a schema is unavailable. Defaults to False.
+        """
+        self.store = store
+        self.strict = strict
+        self.registry: Registry = Registry(retrieve=self._retrieve)  # type: ignore[call-arg]
+        self._validators: dict[str, Validator | None] = {}
+        self._missing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _retrieve(self, uri: str) -> Resource:
+        schema = self.store.get(uri)
+        if schema is None:
+            raise NoSuchResource(ref=uri)  # type: ignore[call-arg]
+        return Resource.from_contents(schema, default_specification=DRAFT7)
+
+    def validator(self, uri: str) -> Validator | None:
+        """Compiled validator of a schema, None if the schema is unavailable"""
+        with self._lock:
+            if uri not in self._validators:
+                schema = self.store.get(uri)
+                self._validators[uri] = (
+                    validator_for(schema, default=Draft7Validator)(schema, registry=self.registry)
+                    if schema is not None
+                    else None
+                )
+            return self._validators[uri]
+
+    def missing_schema(self, uri: str) -> None:
+        """Handle an unavailable schema"""
+        message = f"Schema: {uri} is unavailable offline and could not be downloaded"
+        if self.strict:
+            raise StacValidationException(message)
+        with self._lock:
+            if uri in self._missing:
+                return
+            self._missing.add(uri)
+        logger.warning(f"{message}. Skipping validation against this schema")
+
+    @staticmethod
+    def schema_uris(stac: dict[str, Any]) -> list[str]:
+        """Core and extension schema uris of a STAC object"""
+        name = STAC_TYPES.get(stac.get("type", ""))
+        if name is None:
+            raise StacValidationException(f"Unknown STAC object type: {stac.get('type')}")
+        version = stac.get("stac_version", STACVersion.DEFAULT_STAC_VERSION)
+        return [
+            f"https://schemas.stacspec.org/v{version}/{name}-spec/json-schema/{name}.json",
+            *stac.get("stac_extensions", []),
+        ]
+
+    def validate(self, stac: dict[str, Any]) -> None:
+        """Validate a STAC object.
+
+        Args:
+            stac (dict[str, Any]): STAC Item, Collection or Catalog as a dictionary
+
+        Raises:
+            StacValidationException: if the object does not conform to its schemas
+        """
+        for uri in self.schema_uris(stac):
+            validator = self.validator(uri)
+            if validator is None:
+                self.missing_schema(uri)
+                continue
+            try:
+                error = best_match(validator.iter_errors(stac))
+            except Unresolvable as e:
+                self.missing_schema(str(e.ref))
+                continue
+            if error is not None:
+                raise StacValidationException(
+                    f"{STAC_TYPES[stac['type']].capitalize()}: {stac.get('id')} does not conform to schema: {uri}. "
+                    f"{error.message} at {error.json_path}"
+                )
+
+
+@functools.lru_cache
+def _get_validator(schema_dir: str, offline: bool, strict: bool) -> StacValidator:
+    return StacValidator(SchemaStore(schema_dir, offline), strict)
+
+
+def get_validator(config: ValidationConfig) -> StacValidator:
+    """Validator described by a validation config. Validators are created once per process.
+
+    Args:
+        config (ValidationConfig): validation config
+
+    Returns:
+        StacValidator: shared validator
+    """
+    schema_dir = config.schema_dir or os.environ.get(SCHEMA_DIR_ENV, str(DEFAULT_SCHEMA_DIR))
+    offline = config.offline or os.environ.get(OFFLINE_ENV, "").lower() in {"1", "true", "yes"}
+    return _get_validator(schema_dir, offline, config.strict)
+
+
+def structural_signature(stac: dict[str, Any]) -> str:
+    """Digest of the structure of a STAC Item - its extensions, property names, asset fields and geometry type"""
+    signature = [
+        sorted(stac.get("stac_extensions", [])),
+        sorted(stac.get("properties", {})),
+        sorted({tuple(sorted(asset)) for asset in stac.get("assets", {}).values()}),
+        (stac.get("geometry") or {}).get("type"),
+    ]
+    return hashlib.sha1(json.dumps(signature).encode(), usedforsecurity=False).hexdigest()
+
+
+def in_sample(item_id: str, sample: float) -> bool:
+    """Deterministically select a fraction of item ids"""
+    if sample >= 1:
+        return True
+    digest = hashlib.sha1(item_id.encode(), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:4]) / 2**32 < sample
+
+
+class ValidationSampler:
+    """Selects the items validated by a worker: sampled items and items with a structure not seen before"""
+
+    def __init__(self, sample: float) -> None:
+        """Constructor
+
+        Args:
+            sample (float): fraction of items validated in addition to structurally unique items
+        """
+        self.sample = sample
+        self.seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def select(self, stac: dict[str, Any]) -> bool:
+        """Whether an item should be validated"""
+        signature = structural_signature(stac)
+        with self._lock:
+            unseen = signature not in self.seen
+            self.seen.add(signature)
+        return unseen or in_sample(stac.get("id", ""), self.sample)
+
+
+@functools.lru_cache(maxsize=1)
+def get_sampler(run_id: str, sample: float) -> ValidationSampler:
+    """Sampler shared by the tasks of a generation run in this process. A new run resets the seen structures."""
+    return ValidationSampler(sample)
+
+
+def validate_items(items: Sequence[dict[str, Any]], config: ValidationConfig, run_id: str) -> int:
+    """Validate the selected items of a generation run.
+
+    Args:
+        items (Sequence[dict[str, Any]]): STAC Items as dictionaries
+        config (ValidationConfig): validation config
+        run_id (str): id of the generation run, used to share seen structures between the run's tasks
+
+    Raises:
+        StacValidationException: if an item does not conform to its schemas
+
+    Returns:
+        int: number of validated items
+    """
+    validator = get_validator(config)
+    sampler = get_sampler(run_id, config.sample)
+    count = 0
+    for item in items:
+        if sampler.select(item):
+            validator.validate(item)
+            count += 1
+    return count
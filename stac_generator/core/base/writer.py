@@ -0,0 +1,584 @@
+from __future__ import annotations
+
+import contextlib
+import datetime as pydatetime
+import gzip
+import itertools
+import json
+import logging
+import os
+import posixpath
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+import pystac
+import shapely
+from pystac.utils import make_relative_href, str_to_datetime
+from shapely.geometry import shape
+
+from stac_generator.core.base.schema import COMPRESSION, WriterConfig
+from stac_generator.exceptions import StacConfigException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "stac_generator.index.json"
+"""Name of the item index written next to a `json` collection"""
+NDJSON_ITEMS = "items.ndjson"
+"""Name of the items file written in `ndjson` format"""
+COMPRESSION_SUFFIXES: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+"""File suffix of each compression"""
+HIERARCHICAL_RELS = {
+    pystac.RelType.ROOT,
+    pystac.RelType.PARENT,
+    pystac.RelType.CHILD,
+    pystac.RelType.ITEM,
+    pystac.RelType.SELF,
+    pystac.RelType.COLLECTION,
+}
+"""Link relations describing the layout of a catalog on disk, which are dropped in `ndjson` and `geoparquet` formats"""
+GEOPARQUET_ITEMS = "items.parquet"
+"""Name of the items file written in `geoparquet` format"""
+GEOPARQUET_VERSION = "1.1.0"
+STAC_GEOPARQUET_VERSION = "1.0.0"
+DATETIME_PROPERTIES = ("datetime", "start_datetime", "end_datetime", "created", "updated")
+"""Properties stored as timestamp columns in `geoparquet` format"""
+
+
+def _fsync(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _staging_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _compressed(
+    file: IO[bytes], compression: COMPRESSION | None
+) -> contextlib.AbstractContextManager[IO[bytes]]:
+    """Compressed stream writing to file. Closing the stream leaves the file open."""
+    if compression == "gzip":
+        # No timestamp in the header, so the same items produce the same file
+        return cast(IO[bytes], gzip.GzipFile(fileobj=file, mode="wb", mtime=0))
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise StacConfigException(
+                "zstd compression requires the zstandard package. Install it with `pip install zstandard`."
+            ) from None
+        return cast(IO[bytes], zstandard.ZstdCompressor().stream_writer(file, closefd=False))
+    return contextlib.nullcontext(file)
+
+
+def _without_empty(value: Any) -> Any:
+    """Replace empty objects, which cannot be stored as parquet structs, with None"""
+    if isinstance(value, dict):
+        return {key: _without_empty(child) for key, child in value.items()} or None
+    if isinstance(value, list):
+        return [_without_empty(child) for child in value]
+    return value
+
+
+def geoparquet_record(item: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a STAC Item dictionary into a stac-geoparquet row.
+
+    Properties become top level columns, with datetime properties as UTC timestamps. The geometry is encoded as
+    WKB and the bbox as a struct of its bounds.
+
+    Args:
+        item (dict[str, Any]): STAC Item as a dictionary
+
+    Returns:
+        dict[str, Any]: stac-geoparquet row
+    """
+    record = {
+        key: value for key, value in item.items() if key not in {"properties", "geometry", "bbox"}
+    }
+    geometry = item.get("geometry")
+    record["geometry"] = shapely.to_wkb(shape(geometry)) if geometry else None
+    if bbox := item.get("bbox"):
+        keys = (
+            ("xmin", "ymin", "xmax", "ymax")
+            if len(bbox) == 4
+            else ("xmin", "ymin", "zmin", "xmax", "ymax", "zmax")
+        )
+        record["bbox"] = dict(zip(keys, bbox, strict=True))
+    for key, value in item.get("properties", {}).items():
+        record[key] = (
+            str_to_datetime(value).astimezone(pydatetime.UTC)
+            if key in DATETIME_PROPERTIES and value
+            else value
+        )
+    return cast(dict[str, Any], _without_empty(record))
+
+
+def item_href(directory: str, item_id: str) -> str:
+    """Href of an item of the collection stored in directory, in the layout given by `pystac.Collection.normalize_hrefs`"""
+    return posixpath.join(directory, item_id, f"{item_id}.json")
+
+
+def geoparquet_schema(records: Sequence[dict[str, Any]]) -> pa.Schema:
+    """Parquet schema inferred from stac-geoparquet rows.
+
+    Types are inferred from the rows, except for the columns stac-geoparquet defines: the geometry is binary,
+    datetime properties are UTC timestamps, and links and extensions are lists.
+
+    Args:
+        records (Sequence[dict[str, Any]]): stac-geoparquet rows, as given by `geoparquet_record`
+
+    Returns:
+        pa.Schema: parquet schema
+    """
+    import pyarrow as pa
+
+    inferred = pa.infer_type(records) if records else pa.struct([])
+    fields = {inferred.field(idx).name: inferred.field(idx) for idx in range(inferred.num_fields)}
+    fields["stac_extensions"] = pa.field("stac_extensions", pa.list_(pa.string()))
+    fields["links"] = pa.field(
+        "links",
+        pa.list_(pa.struct([(name, pa.string()) for name in ("href", "rel", "type", "title")])),
+    )
+    fields["geometry"] = pa.field("geometry", pa.binary())
+    for name in DATETIME_PROPERTIES:
+        if name in fields:
+            fields[name] = pa.field(name, pa.timestamp("us", tz="UTC"))
+    return pa.schema(list(fields.values()))
+
+
+def unified_geoparquet_schema(batches: Iterable[Sequence[dict[str, Any]]]) -> pa.Schema:
+    """Parquet schema of stac-geoparquet rows with different fields, unifying the schemas of batches of rows.
+
+    Fields missing from some batches are kept, and fields that are null in some batches take the type of the others.
+
+    Args:
+        batches (Iterable[Sequence[dict[str, Any]]]): batches of stac-geoparquet rows
+
+    Raises:
+        StacConfigException: if a field has incompatible types in different batches
+
+    Returns:
+        pa.Schema: parquet schema
+    """
+    import pyarrow as pa
+
+    try:
+        return pa.unify_schemas(
+            [geoparquet_schema(batch) for batch in batches] or [geoparquet_schema([])],
+            promote_options="permissive",
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+        raise StacConfigException(f"Items have fields of incompatible types: {error}") from error
+
+
+def geoparquet_batch(
+    records: Sequence[dict[str, Any]], schema: pa.Schema, start: int
+) -> pa.RecordBatch:
+    """Record batch of stac-geoparquet rows cast to a schema. Fields missing from a row are null.
+
+    Args:
+        records (Sequence[dict[str, Any]]): stac-geoparquet rows
+        schema (pa.Schema): parquet schema
+        start (int): position of the first row among the written items, used in error messages
+
+    Raises:
+        StacConfigException: if rows have fields missing from the schema or values of another type
+
+    Returns:
+        pa.RecordBatch: record batch
+    """
+    import pyarrow as pa
+
+    unknown = {key for record in records for key in record} - set(schema.names)
+    if unknown:
+        raise StacConfigException(
+            f"Items {start} to {start + len(records)} have fields missing from the parquet schema: {sorted(unknown)}"
+        )
+    try:
+        return pa.RecordBatch.from_pylist(records, schema=schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+        raise StacConfigException(
+            f"Items {start} to {start + len(records)} do not match the parquet schema: {error}"
+        ) from error
+
+
+def without_hierarchical_links(stac: dict[str, Any]) -> dict[str, Any]:
+    """STAC object dictionary without links describing the layout of its catalog"""
+    return {
+        **stac,
+        "links": [link for link in stac.get("links", []) if link["rel"] not in HIERARCHICAL_RELS],
+    }
+
+
+@dataclass
+class ItemIndex:
+    """Ids of the items of a local `json` collection, with the hash of the config each item was generated from.
+
+    The index lets a collection be appended to or updated without reading its item files.
+    """
+
+    items: dict[str, str | None] = field(default_factory=dict)
+    """Config hash of every item, keyed by item id. None if unknown"""
+
+    @classmethod
+    def read(cls, collection: pystac.Collection) -> ItemIndex:
+        """Index of a collection read from its file, stored next to the collection document.
+
+        Collections written without an index are indexed from their item links, whose file names are the item ids.
+        Config hashes of these items are unknown.
+        """
+        path = CatalogWriter.destination(collection).parent / INDEX_FILE
+        try:
+            with path.open() as file:
+                return cls(json.load(file)["items"])
+        except FileNotFoundError:
+            logger.debug(f"No item index at {path}. Indexing items from the collection's links")
+        return cls(
+            {Path(link.href).stem: None for link in collection.get_item_links()},
+        )
+
+
+class CatalogWriter:
+    """Writes a collection and its items as local json files.
+
+    `pystac.Collection.save` writes one item after the other, so writing many small files is bound by the latency of
+    each write. The writer takes the destination of each item from its self href, or from its id for items given as
+    dictionaries, then serialises and writes items in batches from a pool of threads. Files are written to temporary files next to their destination. Once a batch is
+    written, its files are flushed with fsync and renamed in place, and their directories are flushed, so a batch costs
+    one round of syncs instead of a sync per write. The collection is written last.
+
+    The written files are identical to those written by `pystac.Collection.save`.
+    """
+
+    def __init__(self, config: WriterConfig | None = None) -> None:
+        """Constructor
+
+        Args:
+            config (WriterConfig | None, optional): writer config. Defaults to None, which uses default `WriterConfig` values.
+        """
+        self.config = config if config is not None else WriterConfig()
+        self.stac_io = pystac.StacIO.default()
+
+    @staticmethod
+    def destination(stac_object: pystac.STACObject) -> Path:
+        """Local path of a STAC object, taken from its self href"""
+        href = stac_object.get_self_href()
+        if href is None:
+            raise ValueError(
+                f"Self href of {stac_object.id} must be set. Normalise hrefs before writing."
+            )
+        return Path(href)
+
+    def write_batch(self, documents: Sequence[tuple[Path, dict[str, Any]]]) -> None:
+        """Atomically write a batch of json documents.
+
+        Args:
+            documents (Sequence[tuple[Path, dict[str, Any]]]): destination and content of each document
+        """
+        staged: list[tuple[Path, Path]] = []
+        try:
+            for path, document in documents:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = _staging_path(path)
+                staged.append((tmp, path))
+                with tmp.open("w", encoding="utf-8") as file:
+                    file.write(self.stac_io.json_dumps(document))
+            if self.config.fsync:
+                for tmp, _ in staged:
+                    _fsync(tmp)
+            for tmp, path in staged:
+                tmp.replace(path)
+            if self.config.fsync:
+                for directory in {path.parent for _, path in staged}:
+                    # Directories cannot be opened on some platforms
+                    with contextlib.suppress(OSError):
+                        _fsync(directory)
+        except BaseException:
+            for tmp, _ in staged:
+                tmp.unlink(missing_ok=True)
+            raise
+
+    def write_items(self, items: Sequence[pystac.Item], include_self_link: bool) -> None:
+        """Serialise and write a batch of items"""
+        self.write_batch(
+            [
+                (self.destination(item), item.to_dict(include_self_link=include_self_link))
+                for item in items
+            ]
+        )
+
+    def write_item_dicts(
+        self,
+        collection: pystac.Collection,
+        items: Sequence[dict[str, Any]],
+        include_self_link: bool,
+    ) -> None:
+        """Build and write a batch of items given as dictionaries"""
+        self.write_batch(
+            [self.item_document(collection, item, include_self_link) for item in items]
+        )
+
+    def item_document(
+        self, collection: pystac.Collection, item: dict[str, Any], include_self_link: bool
+    ) -> tuple[Path, dict[str, Any]]:
+        """Destination and content of an item given as a dictionary, with the links `pystac.Item.to_dict` writes.
+
+        Args:
+            collection (pystac.Collection): collection of the item, with normalised hrefs
+            item (dict[str, Any]): STAC Item as a dictionary without links
+            include_self_link (bool): whether hrefs are absolute and the item has a self link
+
+        Returns:
+            tuple[Path, dict[str, Any]]: destination and content of the item document
+        """
+        root = collection.get_root() or collection
+        collection_href = self.destination(collection).as_posix()
+        href = item_href(Path(collection_href).parent.as_posix(), item["id"])
+        links = []
+        for rel, target in (
+            (pystac.RelType.ROOT, root),
+            (pystac.RelType.COLLECTION, collection),
+            (pystac.RelType.PARENT, collection),
+        ):
+            target_href = self.destination(target).as_posix()
+            link = {
+                "rel": rel,
+                "href": target_href if include_self_link else make_relative_href(target_href, href),
+                "type": pystac.MediaType.JSON,
+            }
+            if target.title is not None:
+                link["title"] = target.title
+            links.append(link)
+        if include_self_link:
+            links.append({"rel": pystac.RelType.SELF, "href": href, "type": pystac.MediaType.JSON})
+        return Path(href), {**item, "links": links, "collection": collection.id}
+
+    def write(
+        self, collection: pystac.Collection, items: Iterable[dict[str, Any]] | None = None
+    ) -> None:
+        """Write a collection and its items to the location described by their self hrefs.
+
+        Items can be given as dictionaries without links, in which case they are written next to the collection at
+        the location `pystac.Collection.normalize_hrefs` would give them. The collection must already link to them.
+
+        Args:
+            collection (pystac.Collection): collection with normalised hrefs
+            items (Iterable[dict[str, Any]] | None, optional): STAC Items as dictionaries. Defaults to None, in which case the resolved items of the collection are written.
+        """
+        root = collection.get_root() or collection
+        include_self_link = root.catalog_type == pystac.CatalogType.ABSOLUTE_PUBLISHED
+        if items is None:
+            # Item links are read as is, since resolving them through `get_items` reorders the items' links
+            resolved = [
+                cast(pystac.Item, link.target)
+                for link in collection.get_item_links()
+                if link.is_resolved()
+            ]
+            batches = [
+                resolved[idx : idx + self.config.batch_size]
+                for idx in range(0, len(resolved), self.config.batch_size)
+            ]
+            logger.debug(f"Writing {len(resolved)} items in {len(batches)} batches")
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+                list(pool.map(lambda batch: self.write_items(batch, include_self_link), batches))
+        else:
+            # Batches are submitted as writes complete, so at most `max_workers` batches are in flight
+            max_workers = self.config.max_workers or min(32, (os.cpu_count() or 1) + 4)
+            iterator = iter(items)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                pending: set[Future[None]] = set()
+                for batch in iter(
+                    lambda: list(itertools.islice(iterator, self.config.batch_size)), []
+                ):
+                    if len(pending) >= max_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    pending.add(
+                        pool.submit(self.write_item_dicts, collection, batch, include_self_link)
+                    )
+                for future in pending:
+                    future.result()
+        self.write_batch(
+            [
+                (
+                    self.destination(collection),
+                    collection.to_dict(
+                        include_self_link=root.catalog_type != pystac.CatalogType.SELF_CONTAINED
+                    ),
+                )
+            ]
+        )
+
+    def write_index(self, collection: pystac.Collection, index: ItemIndex) -> None:
+        """Write the item index of a collection next to the collection document"""
+        path = self.destination(collection).parent / INDEX_FILE
+        self.write_batch([(path, {"items": index.items})])
+
+    def write_ndjson(
+        self, collection: pystac.Collection, items: Iterable[dict[str, Any]], href: str | Path
+    ) -> Path:
+        """Write the collection as a json file and stream its items as one json document per line into a single file.
+
+        Neither the collection nor the items have hierarchical links (root, parent, item, self...). Items are given
+        the `collection` field, so the items file can be bulk loaded into a STAC API database such as pgstac.
+
+        Args:
+            collection (pystac.Collection): collection
+            items (Iterable[dict[str, Any]]): STAC Items of the collection as dictionaries
+            href (str | Path): destination directory
+
+        Raises:
+            StacConfigException: if `zstd` compression is requested and zstandard is not installed
+
+        Returns:
+            Path: path of the items file
+        """
+        directory = Path(href)
+        directory.mkdir(parents=True, exist_ok=True)
+        compression = self.config.compression
+        path = directory / f"{NDJSON_ITEMS}{COMPRESSION_SUFFIXES.get(compression or '', '')}"
+        tmp = _staging_path(path)
+        count = 0
+        try:
+            with tmp.open("wb") as file:
+                with _compressed(file, compression) as stream:
+                    for item in items:
+                        document = {**without_hierarchical_links(item), "collection": collection.id}
+                        stream.write(json.dumps(document, separators=(",", ":")).encode())
+                        stream.write(b"\n")
+                        count += 1
+                if self.config.fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+            tmp.replace(path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Wrote {count} items to {path}")
+        self.write_batch(
+            [
+                (
+                    directory / "collection.json",
+                    without_hierarchical_links(
+                        collection.to_dict(include_self_link=False, transform_hrefs=False)
+                    ),
+                )
+            ]
+        )
+        return path
+
+    def write_geoparquet(
+        self,
+        collection: pystac.Collection,
+        items: Iterable[dict[str, Any]],
+        href: str | Path,
+        schema: pa.Schema | None = None,
+    ) -> Path:
+        """Write the collection as a json file and stream its items into a stac-geoparquet file.
+
+        Unless a schema is given, items are read twice. The first pass infers the schema of each row group of
+        `row_group_size` items and unifies them, so items may have different properties. The second pass writes the
+        row groups, with the fields an item does not have set to null. Only one row group is held in memory, unless
+        items are given as an iterator, which is read into memory to be iterated twice. The file carries GeoParquet
+        metadata for its WKB geometry column and the collection under the `stac-geoparquet` metadata key.
+
+        Args:
+            collection (pystac.Collection): collection
+            items (Iterable[dict[str, Any]]): STAC Items of the collection as dictionaries
+            href (str | Path): destination directory
+            schema (pa.Schema | None, optional): schema of the item rows. Defaults to None, in which case it is inferred from every item.
+
+        Raises:
+            StacConfigException: if pyarrow is not installed, or if items do not fit a single schema
+
+        Returns:
+            Path: path of the items file
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise StacConfigException(
+                "geoparquet output requires the pyarrow package. Install it with `pip install pyarrow`."
+            ) from None
+        directory = Path(href)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / GEOPARQUET_ITEMS
+        collection_dict = without_hierarchical_links(
+            collection.to_dict(include_self_link=False, transform_hrefs=False)
+        )
+        geometry_types: set[str] = set()
+
+        def rows() -> Iterator[dict[str, Any]]:
+            for item in items:
+                if item.get("geometry"):
+                    geometry_types.add(item["geometry"]["type"])
+                yield geoparquet_record(
+                    {**without_hierarchical_links(item), "collection": collection.id}
+                )
+
+        def batches() -> Iterator[list[dict[str, Any]]]:
+            records = rows()
+            return iter(lambda: list(itertools.islice(records, self.config.row_group_size)), [])
+
+        if schema is None:
+            if iter(items) is items:
+                items = list(items)
+            schema = unified_geoparquet_schema(batches())
+
+        tmp = _staging_path(path)
+        count = 0
+        try:
+            # The metadata is only complete once every item is read. It is added to the file's key value metadata,
+            # which is not read back if the arrow schema is stored in the file
+            with pq.ParquetWriter(
+                str(tmp),
+                schema,
+                compression=self.config.compression or "snappy",
+                store_schema=False,
+            ) as writer:
+                for batch in batches():
+                    writer.write_batch(geoparquet_batch(batch, schema, count))
+                    count += len(batch)
+                geo = {
+                    "version": GEOPARQUET_VERSION,
+                    "primary_column": "geometry",
+                    "columns": {
+                        "geometry": {
+                            "encoding": "WKB",
+                            "geometry_types": sorted(geometry_types),
+                            "bbox": collection.extent.spatial.bboxes[0],
+                        }
+                    },
+                }
+                writer.add_key_value_metadata(
+                    {
+                        "geo": json.dumps(geo),
+                        "stac-geoparquet": json.dumps(
+                            {
+                                "version": STAC_GEOPARQUET_VERSION,
+                                "collections": {collection.id: collection_dict},
+                            }
+                        ),
+                    }
+                )
+            if self.config.fsync:
+                _fsync(tmp)
+            tmp.replace(path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Wrote {count} items to {path}")
+        self.write_batch([(directory / "collection.json", collection_dict)])
+        return path
@@ -0,0 +1,4 @@
+from stac_generator.core.datacube.generator import DatacubeGenerator
+from stac_generator.core.datacube.schema import DatacubeConfig, DatacubeOwnConfig
+
+__all__ = ("DatacubeConfig", "DatacubeGenerator", "DatacubeOwnConfig")
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import pystac
+import shapely
+from pyproj import CRS
+from pystac.extensions.datacube import Dimension
+from pystac.extensions.eo import Band
+from pystac.extensions.raster import DataType, RasterBand
+from shapely import box
+
+from stac_generator.core.base.generator import ItemGenerator
+from stac_generator.core.base.record import (
+    DATACUBE_SCHEMA,
+    EO_SCHEMA,
+    PROJECTION_SCHEMA,
+    RASTER_SCHEMA,
+    ItemRecord,
+    asset_dict,
+    geometry_dict,
+    projection_fields,
+)
+from stac_generator.core.base.schema import ASSET_KEY
+from stac_generator.core.base.utils import gdal_remote_options, get_crs_info, vsi_path
+from stac_generator.exceptions import SourceAssetException, StacConfigException
+
+from .schema import DatacubeConfig
+from .utils import VariableHeader, decode_cf_time, list_variables, read_variable_header
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    "nc": pystac.MediaType.NETCDF,
+    "nc4": pystac.MediaType.NETCDF,
+    "netcdf": pystac.MediaType.NETCDF,
+    "h5": pystac.MediaType.HDF5,
+    "hdf5": pystac.MediaType.HDF5,
+    "he5": pystac.MediaType.HDF5,
+    "zarr": pystac.MediaType.ZARR,
+}
+"""Asset media type by extension"""
+
+
+class DatacubeGenerator(ItemGenerator[DatacubeConfig]):
+    """Generator for multidimensional (NetCDF, HDF5, Zarr) assets"""
+
+    def read_headers(self) -> list[VariableHeader]:
+        """Read the headers of the asset's variables in a thread pool.
+
+        Raises:
+            SourceAssetException: if the asset cannot be accessed or has no georeferenced variable
+            StacConfigException: if a requested variable does not exist or is not georeferenced
+
+        Returns:
+            list[VariableHeader]: headers of the selected variables
+        """
+        options = gdal_remote_options(
+            self.config.location, self.config.headers, self.config.cookies
+        )
+        variables = list_variables(
+            self.config.location, vsi_path(self.source, self.config.params), options
+        )
+        if self.config.variables is not None:
+            variables = {
+                name: path for name, path in variables.items() if name in self.config.variables
+            }
+        logger.info(f"Reading {len(variables)} variable headers of datacube: {self.config.id}")
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+            headers = [
+                header
+                for header in pool.map(
+                    lambda item: read_variable_header(item[0], item[1], options), variables.items()
+                )
+                if header is not None
+            ]
+        if self.config.variables is not None:
+            missing = set(self.config.variables) - {header.name for header in headers}
+            if missing:
+                raise StacConfigException(
+                    f"Variables: {sorted(missing)} are missing or not georeferenced in asset: {self.config.location}"
+                )
+        if not headers:
+            raise SourceAssetException(
+                f"No georeferenced variable in multidimensional asset: {self.config.location}"
+            )
+        return headers
+
+    def generate_record(self) -> ItemRecord:
+        """Generate a STAC Item record from DatacubeConfig
+
+        Raises:
+            SourceAssetException: if the data cannot be accessed
+
+        Returns:
+            ItemRecord: generated item record
+        """
+        headers = self.read_headers()
+        reference = headers[0]
+        crs = [
+            cast(CRS, header.crs) if header.crs else CRS.from_epsg(self.config.epsg)
+            for header in headers
+        ]
+
+        # Union of the variables' extents in 4326
+        geometry = shapely.union_all(
+            [
+                get_crs_info(header_crs).to_wgs84(box(*header.bounds))
+                for header, header_crs in zip(headers, crs, strict=True)
+            ]
+        )
+        bbox = geometry.bounds
+        item_ts = self.config.get_datetime(geometry)
+        time_range = self.time_range(headers)
+        start, end = time_range if time_range is not None else (item_ts, item_ts)
+        record = ItemRecord(
+            id=self.config.id,
+            geometry=geometry_dict(geometry),
+            bbox=list(bbox),
+            datetime=item_ts,
+            properties=self.config.to_properties(),
+            start_datetime=start,
+            end_datetime=end,
+        )
+
+        crs_info = get_crs_info(crs[0])
+        record.properties.update(
+            projection_fields(
+                crs_info.epsg,
+                crs_info.wkt2,
+                shape=[reference.height, reference.width],
+                transform=[reference.transform[i] for i in range(9)],
+            )
+        )
+        record.properties["cube:dimensions"] = {
+            name: dimension.to_dict()
+            for name, dimension in self.cube_dimensions(headers, crs_info.epsg, time_range).items()
+        }
+        record.properties["cube:variables"] = {
+            header.name: {
+                "dimensions": [*header.dimensions, "y", "x"],
+                "type": "data",
+                **({"description": header.description} if header.description else {}),
+                **({"unit": header.unit} if header.unit else {}),
+            }
+            for header in headers
+        }
+
+        ext = self.config.extension or Path(self.config.location.rstrip("/")).suffix[1:]
+        record.add_asset(
+            ASSET_KEY,
+            asset_dict(
+                href=self.config.location,
+                media_type=MEDIA_TYPES.get(ext.lower()),
+                roles=["data"],
+                title="Datacube Data",
+                fields={
+                    "raster:bands": [
+                        RasterBand.create(
+                            nodata=header.nodata,
+                            data_type=cast(DataType, header.dtype),
+                            unit=header.unit,
+                        ).to_dict()
+                        for header in headers
+                    ],
+                    "eo:bands": [
+                        Band.create(name=header.name, description=header.description).to_dict()
+                        for header in headers
+                    ],
+                },
+            ),
+        )
+        for schema_uri in (PROJECTION_SCHEMA, DATACUBE_SCHEMA, RASTER_SCHEMA, EO_SCHEMA):
+            record.add_extension(schema_uri)
+        return record
+
+    def time_range(self, headers: list[VariableHeader]) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """First and last timestamps of the variables' time coordinates, if any can be decoded"""
+        ranges = [
+            time_range
+            for header in headers
+            if self.config.time_dimension in header.dimensions
+            and (time_range := decode_cf_time(header.dimensions[self.config.time_dimension]))
+        ]
+        if not ranges:
+            return None
+        return min(start for start, _ in ranges), max(end for _, end in ranges)
+
+    def cube_dimensions(
+        self,
+        headers: list[VariableHeader],
+        epsg: int | None,
+        time_range: tuple[pd.Timestamp, pd.Timestamp] | None,
+    ) -> dict[str, Dimension]:
+        """Datacube extension dimensions spanned by the variables"""
+        left = min(header.bounds[0] for header in headers)
+        bottom = min(header.bounds[1] for header in headers)
+        right = max(header.bounds[2] for header in headers)
+        top = max(header.bounds[3] for header in headers)
+        reference = headers[0]
+        dimensions: dict[str, dict[str, Any]] = {
+            "x": {
+                "type": "spatial",
+                "axis": "x",
+                "extent": [left, right],
+                "step": reference.transform.a,
+                "reference_system": epsg,
+            },
+            "y": {
+                "type": "spatial",
+                "axis": "y",
+                "extent": [bottom, top],
+                "step": reference.transform.e,
+                "reference_system": epsg,
+            },
+        }
+        for header in headers:
+            for name, info in header.dimensions.items():
+                if name in dimensions:
+                    continue
+                if name == self.config.time_dimension and time_range is not None:
+                    dimensions[name] = {
+                        "type": "temporal",
+                        "extent": [timestamp.isoformat() for timestamp in time_range],
+                    }
+                else:
+                    dimensions[name] = {
+                        "type": "other",
+                        "extent": [min(info.values), max(info.values)]
+                        if info.values
+                        else [None, None],
+                        **({"unit": info.unit} if info.unit else {}),
+                    }
+        for properties in dimensions.values():
+            if properties.get("reference_system") is None:
+                properties.pop("reference_system", None)
+        return {name: Dimension.from_dict(properties) for name, properties in dimensions.items()}
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from stac_generator.core.base.schema import SourceConfig
+
+
+class DatacubeOwnConfig(BaseModel):
+    """Config that defines the minimum information for parsing and reading multidimensional (NetCDF, HDF5, Zarr) assets. This config is produced for datacube asset when the method `to_asset_config` is invoked, or when `StacGeneratorFactory.extract_item_config` is called on a datacube STAC Item."""
+
+    variables: list[str] | None = None
+    """Variables described as bands. Defaults to every georeferenced variable of the asset"""
+    time_dimension: str = "time"
+    """Name of the dimension holding CF encoded timestamps (i.e. `days since 2000-01-01`)"""
+    epsg: int = 4326
+    """EPSG code of the asset's grid, used if the asset does not declare a crs"""
+
+
+class DatacubeConfig(SourceConfig, DatacubeOwnConfig):
+    """Extends SourceConfig to describe multidimensional assets.
+
+    Only the coordinate variables and attributes of the asset are read. Variables become bands of the item's asset,
+    the time coordinate sets the item's `start_datetime` and `end_datetime`, and the asset's dimensions and variables
+    are described with the datacube extension.
+    """
+
+    max_workers: int | None = Field(default=None, gt=0)
+    """Number of threads reading variable headers. Defaults to `min(32, os.cpu_count() + 4)`."""
+
+    def to_asset_config(self) -> dict[str, Any]:
+        """Produce a dictionary that has the signature of `DatacubeOwnConfig`"""
+        return DatacubeOwnConfig.model_construct(
+            **self.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+        ).model_dump(mode="json", exclude_none=True, exclude_unset=True, warnings=False)
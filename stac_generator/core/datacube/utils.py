@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import pandas as pd
+import rasterio
+
+from stac_generator.exceptions import SourceAssetException
+
+if TYPE_CHECKING:
+    from affine import Affine
+    from rasterio.io import DatasetReader
+
+logger = logging.getLogger(__name__)
+
+CF_TIME_UNITS = re.compile(r"^\s*(\w+)\s+since\s+(.+?)\s*$", re.IGNORECASE)
+"""CF time units - `<unit> since <origin>`"""
+
+CF_TIME_UNIT_ALIASES: dict[str, Literal["D", "h", "min", "s", "ms", "us"]] = {
+    "days": "D",
+    "day": "D",
+    "d": "D",
+    "hours": "h",
+    "hour": "h",
+    "hrs": "h",
+    "hr": "h",
+    "h": "h",
+    "minutes": "min",
+    "minute": "min",
+    "mins": "min",
+    "min": "min",
+    "seconds": "s",
+    "second": "s",
+    "secs": "s",
+    "sec": "s",
+    "s": "s",
+    "milliseconds": "ms",
+    "microseconds": "us",
+}
+"""CF time units mapped to pandas timedelta units"""
+
+STANDARD_CALENDARS = {"standard", "gregorian", "proleptic_gregorian"}
+"""CF calendars that can be decoded to timestamps"""
+
+DIM_VALUE_TAG = re.compile(r"^DIM_(.+)_VALUE$")
+DIM_UNIT_TAG = re.compile(r"^DIM_(.+)_UNIT$")
+"""Band metadata items describing a band's position along extra dimensions (Zarr and HDF5 drivers)"""
+
+
+@dataclass(frozen=True)
+class DimensionInfo:
+    """Coordinate values of a non spatial dimension"""
+
+    values: tuple[float, ...]
+    unit: str | None = None
+    calendar: str | None = None
+
+
+@dataclass(frozen=True)
+class VariableHeader:
+    """Header information of a georeferenced variable"""
+
+    name: str
+    """Variable name"""
+    path: str
+    """GDAL path of the variable"""
+    crs: Any
+    """Variable crs, None if not declared"""
+    transform: Affine
+    width: int
+    height: int
+    dtype: str
+    nodata: float | None
+    unit: str | None = None
+    description: str | None = None
+    dimensions: dict[str, DimensionInfo] = field(default_factory=dict)
+    """Non spatial dimensions"""
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Bounds as (left, bottom, right, top)"""
+        left, top = self.transform * (0, 0)
+        right, bottom = self.transform * (self.width, self.height)
+        return (min(left, right), min(bottom, top), max(left, right), max(bottom, top))
+
+
+def _split_list(value: str) -> list[str]:
+    """Split a GDAL `{a,b,c}` list"""
+    return [item.strip() for item in value.strip("{}").split(",") if item.strip()]
+
+
+def _to_floats(values: list[str]) -> tuple[float, ...]:
+    try:
+        return tuple(float(value) for value in values)
+    except ValueError:
+        return ()
+
+
+def read_dimensions(src: DatasetReader) -> dict[str, DimensionInfo]:
+    """Read the coordinate values of the non spatial dimensions of a variable from its metadata.
+
+    The netCDF driver lists every coordinate value in the dataset metadata, while the Zarr and HDF5 drivers
+    describe each band's position along the extra dimensions in the band metadata.
+
+    Args:
+        src (DatasetReader): opened variable
+
+    Returns:
+        dict[str, DimensionInfo]: dimension name to coordinate values
+    """
+    tags = src.tags()
+    if "NETCDF_DIM_EXTRA" in tags:
+        return {
+            name: DimensionInfo(
+                values=_to_floats(_split_list(tags.get(f"NETCDF_DIM_{name}_VALUES", ""))),
+                unit=tags.get(f"{name}#units"),
+                calendar=tags.get(f"{name}#calendar"),
+            )
+            for name in _split_list(tags["NETCDF_DIM_EXTRA"])
+        }
+    values: dict[str, dict[str, None]] = {}
+    units: dict[str, str] = {}
+    for band in range(1, src.count + 1):
+        for key, value in src.tags(band).items():
+            if match := DIM_VALUE_TAG.match(key):
+                values.setdefault(match[1], {})[value] = None
+            elif match := DIM_UNIT_TAG.match(key):
+                units[match[1]] = value
+    return {
+        name: DimensionInfo(values=_to_floats(list(dim_values)), unit=units.get(name))
+        for name, dim_values in values.items()
+    }
+
+
+def decode_cf_time(dimension: DimensionInfo) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+    """Decode the first and last timestamps of a CF time coordinate (i.e. `days since 2000-01-01`).
+
+    Args:
+        dimension (DimensionInfo): time dimension
+
+    Returns:
+        tuple[pd.Timestamp, pd.Timestamp] | None: UTC start and end timestamps, None if the coordinate cannot be decoded
+    """
+    match = CF_TIME_UNITS.match(dimension.unit or "")
+    calendar = (dimension.calendar or "standard").lower()
+    if not dimension.values or match is None:
+        return None
+    unit = CF_TIME_UNIT_ALIASES.get(match[1].lower())
+    if unit is None or calendar not in STANDARD_CALENDARS:
+        logger.warning(f"Unable to decode time coordinate: {dimension.unit} ({calendar} calendar)")
+        return None
+    try:
+        origin = pd.Timestamp(match[2])
+    except ValueError:
+        logger.warning(f"Unable to decode time coordinate origin: {match[2]}")
+        return None
+    origin = origin.tz_localize("UTC") if origin.tzinfo is None else origin.tz_convert("UTC")
+    return (
+        origin + pd.to_timedelta(min(dimension.values), unit=unit),
+        origin + pd.to_timedelta(max(dimension.values), unit=unit),
+    )
+
+
+def list_variables(
+    location: str, path: str, options: dict[str, str] | None = None
+) -> dict[str, str]:
+    """List the variables (subdatasets) of a multidimensional asset without reading them.
+
+    Args:
+        location (str): asset location
+        path (str): GDAL path of the asset
+        options (dict[str, str] | None, optional): GDAL configuration options. Defaults to None.
+
+    Raises:
+        SourceAssetException: if the asset cannot be accessed
+
+    Returns:
+        dict[str, str]: variable name to GDAL path of the variable
+    """
+    try:
+        with rasterio.Env(**(options or {})), rasterio.open(path) as src:
+            if src.subdatasets:
+                return dict(
+                    sorted(
+                        (subdataset.rsplit(":", 1)[-1].strip("/"), subdataset)
+                        for subdataset in src.subdatasets
+                    )
+                )
+            name = src.tags(1).get("NETCDF_VARNAME") if src.count else None
+            return {name or Path(location.rstrip("/")).stem: path}
+    except rasterio.errors.RasterioIOError as e:
+        raise SourceAssetException(
+            f"Unable to read multidimensional asset: {location}. " + str(e)
+        ) from None
+
+
+def read_variable_header(
+    name: str, path: str, options: dict[str, str] | None = None
+) -> VariableHeader | None:
+    """Read the header of a variable. Only coordinate variables and attributes are read.
+
+    Args:
+        name (str): variable name
+        path (str): GDAL path of the variable
+        options (dict[str, str] | None, optional): GDAL configuration options. Defaults to None.
+
+    Raises:
+        SourceAssetException: if the variable cannot be accessed
+
+    Returns:
+        VariableHeader | None: variable header, None if the variable is not georeferenced (i.e. a coordinate variable)
+    """
+    try:
+        with rasterio.Env(**(options or {})), rasterio.open(path) as src:
+            if src.width < 2 or src.height < 2 or src.transform.is_identity:
+                return None
+            tags = src.tags()
+            band_tags = src.tags(1)
+            return VariableHeader(
+                name=name,
+                path=path,
+                crs=src.crs,
+                transform=src.transform,
+                width=src.width,
+                height=src.height,
+                dtype=src.dtypes[0],
+                nodata=src.nodata,
+                unit=src.units[0] or band_tags.get("units") or tags.get("units"),
+                description=band_tags.get("long_name") or tags.get("long_name"),
+                dimensions=read_dimensions(src),
+            )
+    except rasterio.errors.RasterioIOError as e:
+        raise SourceAssetException(f"Unable to read variable: {path}. " + str(e)) from None
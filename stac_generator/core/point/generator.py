@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import logging
 
-import pystac
-
 from stac_generator._types import CsvMediaType
 from stac_generator.core.base.generator import BaseVectorGenerator
+from stac_generator.core.base.record import ItemRecord, asset_dict
 from stac_generator.core.base.schema import ASSET_KEY
-from stac_generator.core.base.utils import read_point_asset
+from stac_generator.core.base.utils import ReadRequest, is_remote, read_point_asset
 from stac_generator.core.point.schema import PointConfig
 from stac_generator.exceptions import StacConfigException
 
@@ -17,14 +16,36 @@ logger = logging.getLogger(__name__)
 class PointGenerator(BaseVectorGenerator[PointConfig]):
     """ItemGenerator class that handles point data in csv format"""
 
-    def generate(self) -> pystac.Item:
-        """Generate a STAC Item based on provided point config
+    download_remote = True
+
+    def read_requests(self) -> list[ReadRequest]:
+        if is_remote(self.config.location):
+            # Downloaded through the asset cache when generating
+            return []
+        columns: set[str] | None = None
+        if self.config.column_info:
+            columns = {col["name"] for col in self.config.column_info}
+            columns.update(
+                col for col in (self.config.X, self.config.Y, self.config.Z, self.config.T) if col
+            )
+        return [
+            ReadRequest(
+                "csv",
+                self.config.location,
+                columns=frozenset(columns) if columns is not None else None,
+                date_columns=frozenset([self.config.T]) if self.config.T else frozenset(),
+                date_format=self.config.date_format,
+            )
+        ]
+
+    def generate_record(self) -> ItemRecord:
+        """Generate a STAC Item record based on provided point config
 
         Returns:
-            pystac.Item: generated STAC Item
+            ItemRecord: generated item record
         """
         assets = {
-            ASSET_KEY: pystac.Asset(
+            ASSET_KEY: asset_dict(
                 href=self.config.location,
                 description="Raw csv data",
                 roles=["data"],
@@ -33,7 +54,7 @@ class PointGenerator(BaseVectorGenerator[PointConfig]):
         }
         logger.info(f"Reading point asset: {self.config.id}")
         raw_df = read_point_asset(
-            self.config.location,
+            self.source,
             self.config.X,
             self.config.Y,
             self.config.epsg,
@@ -47,11 +68,12 @@ class PointGenerator(BaseVectorGenerator[PointConfig]):
             raise StacConfigException(
                 f"Empty dataframe for {self.config.id}. Check that the file is non-empty and that column_info values are provided."
             )
-        return self.df_to_item(
+        return self.df_to_record(
             raw_df,
             assets,
             self.config,
             properties=self.config.to_properties(),
             epsg=self.config.epsg,
             time_column=self.config.T,
+            footprint_config=self.config.footprint,
         )
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import Any
 
-from stac_generator.core.base.schema import HasColumnInfo, SourceConfig
+from stac_generator.core.base.schema import HasColumnInfo, HasFootprint, SourceConfig
 
 
-class PointOwnConfig(HasColumnInfo):
+class PointOwnConfig(HasColumnInfo, HasFootprint):
     """Source config for point(csv) data. This config is produced for point asset when the method `to_asset_config` is invoked, or when `StacGeneratorFactory.extract_item_config` is called on a point STAC Item."""
 
     X: str
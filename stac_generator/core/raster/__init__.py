@@ -1,4 +1,21 @@
-from stac_generator.core.raster.generator import RasterGenerator
-from stac_generator.core.raster.schema import RasterConfig, RasterOwnConfig
+from stac_generator.core.raster.generator import (
+    RasterGenerator,
+    RasterMosaicGenerator,
+    RasterMultiAssetGenerator,
+)
+from stac_generator.core.raster.schema import (
+    RasterConfig,
+    RasterMosaicConfig,
+    RasterMultiAssetConfig,
+    RasterOwnConfig,
+)
 
-__all__ = ("RasterConfig", "RasterGenerator", "RasterOwnConfig")
+__all__ = (
+    "RasterConfig",
+    "RasterGenerator",
+    "RasterMosaicConfig",
+    "RasterMosaicGenerator",
+    "RasterMultiAssetConfig",
+    "RasterMultiAssetGenerator",
+    "RasterOwnConfig",
+)
@@ -1,71 +1,222 @@
 from __future__ import annotations
 
-import json
 import logging
-from typing import cast
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
 import pystac
 import rasterio
+import shapely
 from pyproj import CRS
-from pyproj.transformer import Transformer
-from pystac.extensions.eo import Band, EOExtension
-from pystac.extensions.projection import AssetProjectionExtension, ItemProjectionExtension
-from pystac.extensions.raster import AssetRasterExtension, RasterBand
-from shapely import box, to_geojson
+from pystac.extensions.eo import Band
+from pystac.extensions.raster import DataType, Histogram, RasterBand, Statistics
+from rasterio.coords import BoundingBox
+from shapely import box
 
 from stac_generator.core.base.generator import ItemGenerator
+from stac_generator.core.base.record import (
+    EO_SCHEMA,
+    PROJECTION_SCHEMA,
+    RASTER_SCHEMA,
+    ItemRecord,
+    asset_dict,
+    geometry_dict,
+    projection_fields,
+)
 from stac_generator.core.base.schema import ASSET_KEY
-from stac_generator.exceptions import SourceAssetException
+from stac_generator.core.base.utils import (
+    gdal_remote_options,
+    get_crs_info,
+    is_remote,
+    merge_bounds,
+    reproject_bounds,
+    simplify_to_budget,
+    vsi_path,
+)
+from stac_generator.exceptions import SourceAssetException, StacConfigException
 
-from .schema import RasterConfig
+from .schema import (
+    BandAssetInfo,
+    BandInfo,
+    RasterConfig,
+    RasterMosaicConfig,
+    RasterMultiAssetConfig,
+)
+from .tiff import read_geotiff_header
+from .utils import (
+    RasterHeader,
+    check_mosaic_grid,
+    check_shared_extent,
+    compute_band_statistics,
+    read_raster_header,
+    valid_data_footprint,
+    write_thumbnail,
+    write_vrt,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 logger = logging.getLogger(__name__)
 
+THUMBNAIL_KEY = "thumbnail"
+
+
+def band_fields(
+    band_info: Sequence[BandInfo],
+    nodata: float | None,
+    dtypes: Sequence[str],
+    band_statistics: Sequence[tuple[Statistics | None, Histogram | None]],
+) -> dict[str, Any]:
+    """Raster and eo extension bands of a raster asset, or of an item whose assets share them"""
+    # Create EO and Raster bands
+    eo_bands = []
+    raster_bands = []
+
+    for idx, info in enumerate(band_info):
+        eo_band = Band.create(
+            name=info.name,
+            common_name=info.common_name,
+            center_wavelength=info.wavelength,
+            description=info.description,
+        )
+        eo_bands.append(eo_band.to_dict())
+
+        statistics, histogram = band_statistics[idx]
+        raster_band = RasterBand.create(
+            nodata=nodata,
+            data_type=cast(DataType, dtypes[idx]),
+            statistics=statistics,
+            histogram=histogram,
+        )
+        raster_bands.append(raster_band.to_dict())
+
+    return {"raster:bands": raster_bands, "eo:bands": eo_bands}
+
+
+def raster_asset_fields(
+    band_info: Sequence[BandInfo],
+    nodata: float | None,
+    dtypes: Sequence[str],
+    band_statistics: Sequence[tuple[Statistics | None, Histogram | None]],
+    epsg: int | None,
+    wkt2: str,
+    shape: list[int],
+    transform: list[float],
+) -> dict[str, Any]:
+    """Projection, raster and eo extension fields of a raster asset"""
+    return {
+        **projection_fields(epsg, wkt2, shape=shape, transform=transform),
+        **band_fields(band_info, nodata, dtypes, band_statistics),
+    }
+
+
+def add_raster_extensions(record: ItemRecord) -> None:
+    """Declare the extensions of assets described by `raster_asset_fields`"""
+    for schema_uri in (PROJECTION_SCHEMA, RASTER_SCHEMA, EO_SCHEMA):
+        record.add_extension(schema_uri)
+
 
 class RasterGenerator(ItemGenerator[RasterConfig]):
     """Raster Generator"""
 
-    def generate(self) -> pystac.Item:
-        """Generate a STAC Item from RasterConfig
+    def generate_record(self) -> ItemRecord:
+        """Generate a STAC Item record from RasterConfig
 
         Raises:
             SourceAssetException: if the data cannot be accessed
 
         Returns:
-            pystac.Item: generated STAC Item
+            ItemRecord: generated item record
         """
-        try:
-            logger.info(f"Reading raster asset: {self.config.id}")
-            with rasterio.open(self.config.location) as src:
-                bounds = src.bounds
-                crs = cast(CRS, src.crs)
-                shape = list(src.shape)
-                nodata = src.nodata
-                dtypes = src.dtypes
-        except rasterio.errors.RasterioIOError as e:
-            raise SourceAssetException(
-                f"Unable to read raster asset: {self.config.location}. " + str(e)
-            ) from None
+        logger.info(f"Reading raster asset: {self.config.id}")
+        header = (
+            read_geotiff_header(self.source)
+            if self.config.fast_header
+            and self.config.statistics.mode == "none"
+            and self.config.footprint.method == "bbox"
+            and self.config.thumbnail is None
+            and not is_remote(self.source)
+            else None
+        )
+        if header is not None:
+            bounds = BoundingBox(*header.bounds)
+            crs = header.crs
+            shape = [header.height, header.width]
+            nodata = header.nodata
+            dtypes = header.dtypes
+            band_statistics: list[tuple[Statistics | None, Histogram | None]] = [
+                (None, None)
+            ] * len(self.config.band_info)
+            footprint = None
+            thumbnail = None
+        else:
+            try:
+                options = gdal_remote_options(
+                    self.config.location, self.config.headers, self.config.cookies
+                )
+                with (
+                    rasterio.Env(**options),
+                    rasterio.open(vsi_path(self.source, self.config.params)) as src,
+                ):
+                    bounds = src.bounds
+                    crs = cast(CRS, src.crs)
+                    shape = list(src.shape)
+                    nodata = src.nodata
+                    dtypes = src.dtypes
+                    band_statistics = (
+                        compute_band_statistics(
+                            src,
+                            src.name,
+                            range(1, len(self.config.band_info) + 1),
+                            self.config.statistics,
+                            options,
+                        )
+                        if self.config.statistics.mode != "none"
+                        else [(None, None)] * len(self.config.band_info)
+                    )
+                    footprint = (
+                        valid_data_footprint(src, self.config.footprint)
+                        if self.config.footprint.method == "valid_data"
+                        else None
+                    )
+                    thumbnail = (
+                        write_thumbnail(src, self.config.band_info, self.config.thumbnail)
+                        if self.config.thumbnail is not None
+                        else None
+                    )
+            except rasterio.errors.RasterioIOError as e:
+                raise SourceAssetException(
+                    f"Unable to read raster asset: {self.config.location}. " + str(e)
+                ) from None
 
         # Convert to 4326 for bbox and geometry
-        transformer = Transformer.from_crs(crs, 4326, always_xy=True)
-        minx, miny = transformer.transform(bounds.left, bounds.bottom)
-        maxx, maxy = transformer.transform(bounds.right, bounds.top)
-        bbox: tuple[float, float, float, float] = (minx, miny, maxx, maxy)
-
-        # Create geometry as Shapely Polygon
-        geometry = box(*bbox)
-        geometry_geojson = json.loads(to_geojson(geometry))
+        crs_info = get_crs_info(crs)
+        if footprint is not None:
+            # The bbox describes the dataset rather than its valid region. Edges are densified so that it encloses
+            # the footprint in curved projections
+            geometry = crs_info.to_wgs84(footprint)
+            bbox: tuple[float, float, float, float] = merge_bounds(
+                reproject_bounds(bounds, crs), geometry.bounds
+            )
+        else:
+            minx, miny = crs_info.transformer.transform(bounds.left, bounds.bottom)
+            maxx, maxy = crs_info.transformer.transform(bounds.right, bounds.top)
+            bbox = (minx, miny, maxx, maxy)
+            # Create geometry as Shapely Polygon
+            geometry = box(*bbox)
+        geometry_geojson = geometry_dict(geometry)
 
         # Process datetime
         item_ts = self.config.get_datetime(geometry)
 
         # Get EPSG
-        epsg = crs.to_epsg()
+        epsg = crs_info.epsg
 
         # Create STAC Item
         # Start datetime and end_datetime are set to be collection datetime for Raster data
-        item = pystac.Item(
+        record = ItemRecord(
             id=self.config.id,
             geometry=geometry_geojson,
             bbox=list(bbox),
@@ -76,50 +227,295 @@ class RasterGenerator(ItemGenerator[RasterConfig]):
         )
 
         # Projection extension
-        proj_ext = ItemProjectionExtension.ext(item, add_if_missing=True)
         affine_transform = [
             rasterio.transform.from_bounds(*bounds, shape[1], shape[0])[i] for i in range(9)
         ]
-        proj_ext.apply(epsg=epsg, wkt2=crs.to_wkt(), shape=shape, transform=affine_transform)
-
-        # Create EO and Raster bands
-        eo_bands = []
-        raster_bands = []
-
-        for idx, band_info in enumerate(self.config.band_info):
-            eo_band = Band.create(
-                name=band_info.name,
-                common_name=band_info.common_name,
-                center_wavelength=band_info.wavelength,
-                description=band_info.description,
+        record.properties.update(
+            projection_fields(epsg, crs_info.wkt2, shape=shape, transform=affine_transform)
+        )
+
+        # Create Asset and Add to Item
+        record.add_asset(
+            ASSET_KEY,
+            asset_dict(
+                href=self.config.location,
+                media_type=pystac.MediaType.GEOTIFF,
+                roles=["data"],
+                title="Raster Data",
+                fields=raster_asset_fields(
+                    self.config.band_info,
+                    nodata,
+                    dtypes,
+                    band_statistics,
+                    epsg=epsg,
+                    wkt2=crs_info.wkt2,
+                    shape=shape,
+                    transform=affine_transform,
+                ),
+            ),
+        )
+        add_raster_extensions(record)
+        if thumbnail is not None:
+            record.add_asset(THUMBNAIL_KEY, thumbnail)
+
+        return record
+
+
+class RasterMosaicGenerator(ItemGenerator[RasterMosaicConfig]):
+    """Generator for a mosaic of raster tiles described as a single item"""
+
+    def generate_record(self) -> ItemRecord:
+        """Generate a STAC Item record from RasterMosaicConfig
+
+        Tile headers are read in a thread pool and checked for grid compatibility. The item's bbox spans the
+        tiles' bounds and its geometry is the union of the tiles' extents (or valid data footprints). The crs and
+        bands the tiles share are described on the item, and each tile is added as an asset with its own grid.
+        If `vrt` is provided, a VRT mosaicking the tiles is written and added as the primary asset.
+
+        Raises:
+            StacConfigException: if no tile matches the location or tiles do not share a grid
+            SourceAssetException: if a tile cannot be accessed
+
+        Returns:
+            ItemRecord: generated item record
+        """
+        tiles = self.config.tiles
+        if not tiles:
+            raise StacConfigException(
+                f"No raster tile matches location: {self.config.location} for mosaic: {self.config.id}"
+            )
+        logger.info(f"Reading {len(tiles)} raster tile headers for mosaic: {self.config.id}")
+
+        def read_header(location: str) -> RasterHeader:
+            return read_raster_header(
+                location,
+                vsi_path(location, self.config.params),
+                gdal_remote_options(location, self.config.headers, self.config.cookies),
+                self.config.footprint,
+                self.config.fast_header,
             )
-            eo_bands.append(eo_band)
 
-            raster_band = RasterBand.create(nodata=nodata, data_type=dtypes[idx])
-            raster_bands.append(raster_band)
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+            headers = list(pool.map(read_header, tiles))
+        check_mosaic_grid(headers)
+        reference = headers[0]
 
-        # Create Asset and Add to Item
-        asset = pystac.Asset(
-            href=self.config.location,
-            media_type=pystac.MediaType.GEOTIFF,
-            roles=["data"],
-            title="Raster Data",
+        # Mosaic grid and footprint in the tiles' crs
+        left = min(header.bounds[0] for header in headers)
+        bottom = min(header.bounds[1] for header in headers)
+        right = max(header.bounds[2] for header in headers)
+        top = max(header.bounds[3] for header in headers)
+        res_x, res_y = reference.transform.a, -reference.transform.e
+        shape = [round((top - bottom) / res_y), round((right - left) / res_x)]
+        transform = rasterio.transform.from_origin(left, top, res_x, res_y)
+        footprint = simplify_to_budget(
+            shapely.union_all(
+                [
+                    header.footprint if header.footprint is not None else box(*header.bounds)
+                    for header in headers
+                ]
+            ),
+            self.config.footprint.max_vertices,
+            clip=(left, bottom, right, top),
+        )
+        crs_info = get_crs_info(reference.crs)
+        geometry = crs_info.to_wgs84(footprint)
+        bbox = merge_bounds(
+            reproject_bounds((left, bottom, right, top), reference.crs), geometry.bounds
         )
-        item.add_asset(ASSET_KEY, asset)
+        item_ts = self.config.get_datetime(geometry)
+        record = ItemRecord(
+            id=self.config.id,
+            geometry=geometry_dict(geometry),
+            bbox=list(bbox),
+            datetime=item_ts,
+            properties=self.config.to_properties(),
+            start_datetime=item_ts,
+            end_datetime=item_ts,
+        )
+        affine_transform = [transform[i] for i in range(9)]
+        record.properties.update(
+            projection_fields(crs_info.epsg, crs_info.wkt2, shape=shape, transform=affine_transform)
+        )
+        no_statistics: list[tuple[Statistics | None, Histogram | None]] = [(None, None)] * len(
+            self.config.band_info
+        )
+        # Tiles share the crs and bands of the mosaic
+        record.properties.update(
+            band_fields(self.config.band_info, reference.nodata, reference.dtypes, no_statistics)
+        )
+        add_raster_extensions(record)
+        if self.config.vrt is not None:
+            write_vrt(headers, self.config.vrt, transform, shape[1], shape[0])
+            band_statistics = no_statistics
+            thumbnail = None
+            if self.config.statistics.mode != "none" or self.config.thumbnail is not None:
+                with rasterio.open(self.config.vrt) as src:
+                    if self.config.statistics.mode != "none":
+                        band_statistics = compute_band_statistics(
+                            src,
+                            self.config.vrt,
+                            range(1, len(self.config.band_info) + 1),
+                            self.config.statistics,
+                        )
+                    if self.config.thumbnail is not None:
+                        thumbnail = write_thumbnail(
+                            src, self.config.band_info, self.config.thumbnail
+                        )
+            record.add_asset(
+                ASSET_KEY,
+                asset_dict(
+                    href=self.config.vrt,
+                    media_type=pystac.MediaType.XML,
+                    roles=["data"],
+                    title="Raster Mosaic",
+                    fields=raster_asset_fields(
+                        self.config.band_info,
+                        reference.nodata,
+                        reference.dtypes,
+                        band_statistics,
+                        epsg=crs_info.epsg,
+                        wkt2=crs_info.wkt2,
+                        shape=shape,
+                        transform=affine_transform,
+                    ),
+                ),
+            )
+            if thumbnail is not None:
+                record.add_asset(THUMBNAIL_KEY, thumbnail)
+        elif self.config.statistics.mode != "none" or self.config.thumbnail is not None:
+            logger.warning(
+                f"Statistics and thumbnail of mosaic: {self.config.id} are computed from its VRT. Provide `vrt` to compute them."
+            )
+
+        width = len(str(len(headers) - 1))
+        for idx, header in enumerate(headers):
+            record.add_asset(
+                f"tile_{idx:0{width}d}",
+                asset_dict(
+                    href=header.location,
+                    media_type=pystac.MediaType.GEOTIFF,
+                    roles=["tile"],
+                    title=Path(header.location).name,
+                    fields=projection_fields(
+                        None,
+                        None,
+                        shape=[header.height, header.width],
+                        transform=[header.transform[i] for i in range(9)],
+                    ),
+                ),
+            )
+        return record
+
+
+class RasterMultiAssetGenerator(ItemGenerator[RasterMultiAssetConfig]):
+    """Generator for a scene stored as one file per band, described as a single item with an asset per file"""
 
-        # Apply projection extension to asset
-        asset_proj_ext = AssetProjectionExtension.ext(asset, add_if_missing=True)
-        asset_proj_ext.apply(
-            epsg=crs.to_epsg(), wkt2=crs.to_wkt(), shape=shape, transform=affine_transform
+    def read_band_file(
+        self, location: str, bands: list[BandAssetInfo]
+    ) -> tuple[RasterHeader, list[tuple[Statistics | None, Histogram | None]]]:
+        """Read the header, and optionally the band statistics, of a band file"""
+        path = vsi_path(location, self.config.params)
+        options = gdal_remote_options(location, self.config.headers, self.config.cookies)
+        header = read_raster_header(
+            location, path, options, self.config.footprint, self.config.fast_header
         )
+        if self.config.statistics.mode == "none":
+            return header, [(None, None)] * len(bands)
+        try:
+            with rasterio.Env(**options), rasterio.open(path) as src:
+                return header, compute_band_statistics(
+                    src, path, range(1, len(bands) + 1), self.config.statistics, options
+                )
+        except rasterio.errors.RasterioIOError as e:
+            raise SourceAssetException(
+                f"Unable to read raster asset: {location}. " + str(e)
+            ) from None
 
-        # Apply Raster Extension to the Asset
-        asset_raster_ext = AssetRasterExtension.ext(asset, add_if_missing=True)
-        asset_raster_ext.apply(bands=raster_bands)
+    def generate_record(self) -> ItemRecord:
+        """Generate a STAC Item record from RasterMultiAssetConfig
 
-        # Add eo:bands to Asset
-        # Apply EO bands to the asset using AssetEOExtension
-        asset_eo_ext = EOExtension.ext(asset, add_if_missing=True)
-        asset_eo_ext.apply(bands=eo_bands)
+        Band files are read in a thread pool and checked for a shared crs and extent, from which the item's bbox
+        is taken. Each file is added as an asset holding the bands that reference it.
 
-        return item
+        Raises:
+            StacConfigException: if band files do not share a grid
+            SourceAssetException: if a band file cannot be accessed
+
+        Returns:
+            ItemRecord: generated item record
+        """
+        band_files = self.config.band_files
+        if self.config.thumbnail is not None:
+            logger.warning(
+                f"Thumbnails are not generated for raster assets stored as one file per band: {self.config.id}"
+            )
+        logger.info(f"Reading {len(band_files)} band files of raster asset: {self.config.id}")
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+            results = list(pool.map(lambda item: self.read_band_file(*item), band_files.items()))
+        headers = [header for header, _ in results]
+        check_shared_extent(headers)
+        reference = headers[0]
+
+        crs_info = get_crs_info(reference.crs)
+        # Band files agree on their extent within half a pixel
+        bounds = merge_bounds(*(header.bounds for header in headers))
+        footprints = [header.footprint for header in headers if header.footprint is not None]
+        if footprints:
+            footprint = simplify_to_budget(
+                shapely.union_all(footprints), self.config.footprint.max_vertices, clip=bounds
+            )
+        else:
+            footprint = box(*bounds)
+        geometry = crs_info.to_wgs84(footprint)
+        item_ts = self.config.get_datetime(geometry)
+        record = ItemRecord(
+            id=self.config.id,
+            geometry=geometry_dict(geometry),
+            bbox=list(merge_bounds(reproject_bounds(bounds, reference.crs), geometry.bounds)),
+            datetime=item_ts,
+            properties=self.config.to_properties(),
+            start_datetime=item_ts,
+            end_datetime=item_ts,
+        )
+
+        # Shape and transform are item properties only if all assets share them
+        shared_grid = all(
+            (header.width, header.height, header.transform)
+            == (reference.width, reference.height, reference.transform)
+            for header in headers
+        )
+        record.properties.update(
+            projection_fields(
+                crs_info.epsg,
+                crs_info.wkt2,
+                shape=[reference.height, reference.width] if shared_grid else None,
+                transform=[reference.transform[i] for i in range(9)] if shared_grid else None,
+            )
+        )
+        add_raster_extensions(record)
+
+        for (location, bands), (header, band_statistics) in zip(
+            band_files.items(), results, strict=True
+        ):
+            key = bands[0].name if len(bands) == 1 else Path(location).stem
+            record.add_asset(
+                key,
+                asset_dict(
+                    href=location,
+                    media_type=pystac.MediaType.GEOTIFF,
+                    roles=["data"],
+                    title=bands[0].description if len(bands) == 1 and bands[0].description else key,
+                    fields=raster_asset_fields(
+                        bands,
+                        header.nodata,
+                        header.dtypes,
+                        band_statistics,
+                        epsg=crs_info.epsg,
+                        wkt2=crs_info.wkt2,
+                        shape=[header.height, header.width],
+                        transform=[header.transform[i] for i in range(9)],
+                    ),
+                ),
+            )
+        return record
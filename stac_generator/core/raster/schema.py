@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import glob
+from pathlib import Path
 from typing import Annotated, Any, Literal
 
-from pydantic import AfterValidator, BaseModel, BeforeValidator
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field
 
 from stac_generator.core.base.schema import SourceConfig
+from stac_generator.core.base.utils import is_string_convertible
 
 VALID_COMMON_NAME = Literal[
     "coastal",
@@ -33,9 +36,107 @@ class RasterOwnConfig(BaseModel):
     """List of band information - REQUIRED"""
 
 
+STATISTICS_MODE = Literal["none", "exact", "approximate"]
+
+
+class StatisticsConfig(BaseModel):
+    """Describes how per-band statistics of the raster extension are computed.
+
+    - `none`: no statistics.
+    - `exact`: statistics of every pixel, read block by block in a thread pool.
+    - `approximate`: statistics of the band read at a reduced resolution, served from the lowest adequate overview.
+
+    Statistics embedded in the asset (GDAL PAM `.aux.xml` or the GDAL_METADATA TIFF tag) are reused when present.
+    """
+
+    mode: STATISTICS_MODE = "none"
+    """Statistics computation mode"""
+    histogram: bool = False
+    """Whether to compute band histograms"""
+    bins: int = Field(default=256, gt=0)
+    """Number of histogram buckets"""
+    overview_size: int = Field(default=1024, gt=0)
+    """Maximum size of the longest side of the bands read in `approximate` mode"""
+    max_workers: int | None = Field(default=None, gt=0)
+    """Number of threads reading blocks in `exact` mode. Defaults to `min(32, os.cpu_count() + 4)`."""
+
+
+RASTER_FOOTPRINT_METHOD = Literal["bbox", "valid_data"]
+
+
+class RasterFootprintConfig(BaseModel):
+    """Describes how a raster item's footprint geometry is derived.
+
+    - `bbox`: bounding box of the raster.
+    - `valid_data`: region of valid (non-nodata) pixels, vectorised from the dataset mask read at a
+    resolution of at most `overview_size` pixels on the longest side, which is served from the mask's overviews.
+    """
+
+    method: RASTER_FOOTPRINT_METHOD = "bbox"
+    """Footprint method"""
+    max_vertices: int = Field(default=1000, gt=4)
+    """Vertex budget of the valid data footprint"""
+    overview_size: int = Field(default=512, gt=0)
+    """Maximum size of the longest side of the mask that is vectorised"""
+
+
+THUMBNAIL_RESAMPLING = Literal["nearest", "average", "bilinear", "cubic", "mode"]
+
+
+def _check_thumbnail_location(location: str) -> str:
+    if Path(location).suffix.lower() not in {".png", ".webp"}:
+        raise ValueError(f"Thumbnail location must be a png or webp file: {location}")
+    return location
+
+
+def _check_thumbnail_bands(bands: list[int] | None) -> list[int] | None:
+    if bands is not None and len(bands) not in {1, 3}:
+        raise ValueError("Thumbnail bands must be a single band or three (red, green, blue) bands")
+    return bands
+
+
+class ThumbnailConfig(BaseModel):
+    """Describes the thumbnail asset of a raster item.
+
+    The thumbnail is read at a resolution of at most `size` pixels on the longest side, which is served from the
+    raster's overviews, then each band is linearly stretched between the `percentiles` of its valid values. Nodata
+    pixels are transparent.
+    """
+
+    location: Annotated[
+        str, BeforeValidator(is_string_convertible), AfterValidator(_check_thumbnail_location)
+    ]
+    """Output location of the thumbnail. The format (png or webp) is derived from the extension"""
+    size: int = Field(default=256, gt=0)
+    """Maximum size of the longest side of the thumbnail"""
+    bands: Annotated[list[int] | None, AfterValidator(_check_thumbnail_bands)] = None
+    """1-based indexes of the grayscale band or of the red, green and blue bands. Defaults to the bands whose common
+    names are red, green and blue, or the first three bands, or the first band"""
+    percentiles: tuple[float, float] = (2, 98)
+    """Percentiles of the valid values mapped to black and white"""
+    resampling: THUMBNAIL_RESAMPLING = "average"
+    """Resampling method used to decimate the raster"""
+
+    @property
+    def format(self) -> Literal["png", "webp"]:
+        """Thumbnail format"""
+        return "webp" if self.location.lower().endswith(".webp") else "png"
+
+
 class RasterConfig(SourceConfig, RasterOwnConfig):
     """Extends SourceConfig to describe raster asset."""
 
+    statistics: StatisticsConfig = Field(default_factory=StatisticsConfig)
+    """Band statistics added to the raster extension"""
+    footprint: RasterFootprintConfig = Field(default_factory=RasterFootprintConfig)
+    """Strategy for deriving the item's geometry"""
+    thumbnail: ThumbnailConfig | None = None
+    """Thumbnail asset generated from the raster's overviews. If not provided, no thumbnail is generated"""
+    fast_header: bool = True
+    """Whether to parse the header of local GeoTIFFs in pure python instead of opening them with rasterio, when no
+    statistics, valid data footprint or thumbnail are requested. Falls back to rasterio for GeoTIFFs the parser does
+    not support"""
+
     def to_asset_config(self) -> dict[str, Any]:
         """Produce a dictionary that has the signature of `RasterOwnConfig`"""
         return RasterOwnConfig.model_construct(
@@ -63,3 +164,75 @@ class BandInfo(BaseModel):
     """Band's data_type"""
     description: str | None = None
     """Band's description"""
+
+
+class RasterMosaicConfig(RasterConfig):
+    """Extends RasterConfig to describe a mosaic of raster tiles sharing a grid as a single item.
+
+    `location` is either a glob pattern (i.e. `flight_01/*.tif`) or a list of tile locations. Tiles must share
+    a crs, resolution, grid alignment and band layout. If `vrt` is provided, a GDAL VRT mosaicking the tiles is
+    written to that path and becomes the item's primary asset.
+    """
+
+    location: Annotated[  # type: ignore[assignment]
+        str | list[Annotated[str, BeforeValidator(is_string_convertible)]],
+        BeforeValidator(
+            lambda value: value if isinstance(value, list) else is_string_convertible(value)
+        ),
+    ]
+    """Glob pattern or list of tile locations"""
+    vrt: Annotated[str, BeforeValidator(is_string_convertible)] | None = None
+    """Output location of the VRT mosaic. If not provided, no VRT is written"""
+    max_workers: int | None = Field(default=None, gt=0)
+    """Number of threads reading tile headers. Defaults to `min(32, os.cpu_count() + 4)`."""
+
+    @staticmethod
+    def describes_mosaic(location: Any) -> bool:
+        """Whether a raster location describes several tiles - a list of locations or a glob pattern"""
+        return isinstance(location, list) or (
+            isinstance(location, str) and any(char in location for char in "*?[")
+        )
+
+    @property
+    def tiles(self) -> list[str]:
+        """Sorted tile locations matched by `location`"""
+        if isinstance(self.location, list):
+            return self.location
+        return sorted(glob.glob(self.location, recursive=True))  # noqa: PTH207 - absolute patterns
+
+
+class BandAssetInfo(BandInfo):
+    """Band information of a band stored in its own file"""
+
+    location: Annotated[str, BeforeValidator(is_string_convertible)]
+    """Location of the file holding the band. Bands sharing a location are read from the file's bands in order"""
+
+
+class RasterMultiAssetConfig(RasterConfig):
+    """Extends RasterConfig to describe a scene stored as one file per band (i.e. Sentinel-2 products or
+    multispectral cameras) as a single item.
+
+    Each entry of `band_info` provides the `location` of its file. Files must share a crs and extent, and each
+    file becomes an asset of the item. `location` describes the scene as a whole (i.e. its directory or manifest).
+    """
+
+    band_info: list[BandAssetInfo]  # type: ignore[assignment]
+    """List of band information and band file locations - REQUIRED"""
+    max_workers: int | None = Field(default=None, gt=0)
+    """Number of threads reading band files. Defaults to `min(32, os.cpu_count() + 4)`."""
+
+    @staticmethod
+    def describes_multi_asset(config: dict[str, Any]) -> bool:
+        """Whether a raster config maps bands to their own files"""
+        band_info = config.get("band_info")
+        return isinstance(band_info, list) and any(
+            isinstance(band, dict) and "location" in band for band in band_info
+        )
+
+    @property
+    def band_files(self) -> dict[str, list[BandAssetInfo]]:
+        """Bands grouped by file location, in order of appearance"""
+        files: dict[str, list[BandAssetInfo]] = {}
+        for band in self.band_info:
+            files.setdefault(band.location, []).append(band)
+        return files
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from rasterio.crs import CRS
+from rasterio.transform import Affine
+
+logger = logging.getLogger(__name__)
+
+# TIFF tags
+IMAGE_WIDTH = 256
+IMAGE_LENGTH = 257
+BITS_PER_SAMPLE = 258
+SAMPLES_PER_PIXEL = 277
+SAMPLE_FORMAT = 339
+MODEL_PIXEL_SCALE = 33550
+MODEL_TIEPOINT = 33922
+MODEL_TRANSFORMATION = 34264
+GEO_KEY_DIRECTORY = 34735
+GDAL_NODATA = 42113
+HEADER_TAGS = {
+    IMAGE_WIDTH,
+    IMAGE_LENGTH,
+    BITS_PER_SAMPLE,
+    SAMPLES_PER_PIXEL,
+    SAMPLE_FORMAT,
+    MODEL_PIXEL_SCALE,
+    MODEL_TIEPOINT,
+    MODEL_TRANSFORMATION,
+    GEO_KEY_DIRECTORY,
+    GDAL_NODATA,
+}
+
+# GeoKeys
+GT_MODEL_TYPE = 1024
+GT_RASTER_TYPE = 1025
+GEOGRAPHIC_TYPE = 2048
+PROJECTED_CS_TYPE = 3072
+SUPPORTED_GEO_KEYS = {
+    GT_MODEL_TYPE,
+    GT_RASTER_TYPE,
+    1026,  # GTCitation
+    GEOGRAPHIC_TYPE,
+    2049,  # GeogCitation
+    2054,  # GeogAngularUnits
+    2057,  # GeogSemiMajorAxis
+    2058,  # GeogSemiMinorAxis
+    2059,  # GeogInvFlattening
+    PROJECTED_CS_TYPE,
+    3073,  # PCSCitation
+    3076,  # ProjLinearUnits
+}
+"""GeoKeys written by GDAL alongside an EPSG code, which they do not alter"""
+USER_DEFINED = 32767
+PIXEL_IS_AREA = 1
+
+FIELD_TYPES: dict[int, str] = {
+    1: "B",
+    2: "s",
+    3: "H",
+    4: "I",
+    6: "b",
+    7: "B",
+    8: "h",
+    9: "i",
+    11: "f",
+    12: "d",
+    16: "Q",
+    17: "q",
+}
+"""TIFF field types mapped to struct format characters"""
+
+DTYPES = {
+    (1, 8): "uint8",
+    (1, 16): "uint16",
+    (1, 32): "uint32",
+    (1, 64): "uint64",
+    (2, 8): "int8",
+    (2, 16): "int16",
+    (2, 32): "int32",
+    (2, 64): "int64",
+    (3, 32): "float32",
+    (3, 64): "float64",
+}
+"""(SampleFormat, BitsPerSample) mapped to numpy data types"""
+
+
+class UnsupportedTiffError(Exception):
+    """The file is not a GeoTIFF that can be described without GDAL"""
+
+
+@dataclass(frozen=True)
+class GeoTiffHeader:
+    """Header information of a GeoTIFF, matching what rasterio reports"""
+
+    crs: CRS
+    transform: Affine
+    width: int
+    height: int
+    dtypes: tuple[str, ...]
+    nodata: float | None
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Bounds as (left, bottom, right, top)"""
+        corners = [
+            self.transform * corner
+            for corner in [(0, 0), (0, self.height), (self.width, self.height), (self.width, 0)]
+        ]
+        xs, ys = zip(*corners, strict=True)
+        return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _read_ifd(buffer: mmap.mmap) -> dict[int, Any]:
+    """Read the header tags of the first IFD of a classic or BigTIFF file"""
+    byte_order = {b"II": "<", b"MM": ">"}.get(buffer[:2])
+    if byte_order is None:
+        raise UnsupportedTiffError("Not a TIFF file")
+    (version,) = struct.unpack_from(f"{byte_order}H", buffer, 2)
+    if version == 42:
+        (offset,) = struct.unpack_from(f"{byte_order}I", buffer, 4)
+        count_format, entry_format, offset_format = "H", "HHI4s", "I"
+    elif version == 43:
+        (offset,) = struct.unpack_from(f"{byte_order}Q", buffer, 8)
+        count_format, entry_format, offset_format = "Q", "HHQ8s", "Q"
+    else:
+        raise UnsupportedTiffError(f"Unknown TIFF version: {version}")
+    (n_entries,) = struct.unpack_from(f"{byte_order}{count_format}", buffer, offset)
+    offset += struct.calcsize(count_format)
+    entry_size = struct.calcsize(f"{byte_order}{entry_format}")
+    tags: dict[int, Any] = {}
+    for idx in range(n_entries):
+        tag, field_type, count, value = struct.unpack_from(
+            f"{byte_order}{entry_format}", buffer, offset + idx * entry_size
+        )
+        if tag not in HEADER_TAGS:
+            continue
+        if field_type not in FIELD_TYPES:
+            raise UnsupportedTiffError(f"Unsupported field type: {field_type} for tag: {tag}")
+        item_format = FIELD_TYPES[field_type]
+        size = struct.calcsize(item_format) * count
+        if size <= len(value):
+            data = value[:size]
+        else:
+            (data_offset,) = struct.unpack(f"{byte_order}{offset_format}", value)
+            data = buffer[data_offset : data_offset + size]
+        if item_format == "s":
+            tags[tag] = data.rstrip(b"\x00")
+        else:
+            tags[tag] = struct.unpack(f"{byte_order}{count}{item_format}", data)
+    return tags
+
+
+def _parse_crs(geo_keys: tuple[Any, ...]) -> CRS:
+    """Identify the crs of a GeoKey directory by its EPSG code"""
+    keys: dict[int, int] = {}
+    for idx in range(4, 4 + 4 * geo_keys[3], 4):
+        key, location, _, value = geo_keys[idx : idx + 4]
+        if key not in SUPPORTED_GEO_KEYS:
+            raise UnsupportedTiffError(f"Unsupported GeoKey: {key}")
+        if location == 0:
+            keys[key] = value
+    if keys.get(GT_RASTER_TYPE, PIXEL_IS_AREA) != PIXEL_IS_AREA:
+        raise UnsupportedTiffError("PixelIsPoint rasters are shifted by GDAL")
+    model_type = keys.get(GT_MODEL_TYPE)
+    code = {1: keys.get(PROJECTED_CS_TYPE), 2: keys.get(GEOGRAPHIC_TYPE)}.get(
+        model_type if model_type is not None else -1
+    )
+    if code is None or code == USER_DEFINED:
+        raise UnsupportedTiffError("crs is not identified by an EPSG code")
+    return CRS.from_epsg(code)
+
+
+def _parse_transform(tags: dict[int, Any]) -> Affine:
+    if MODEL_TRANSFORMATION in tags:
+        matrix = tags[MODEL_TRANSFORMATION]
+        return Affine(matrix[0], matrix[1], matrix[3], matrix[4], matrix[5], matrix[7])
+    tiepoint, scale = tags.get(MODEL_TIEPOINT), tags.get(MODEL_PIXEL_SCALE)
+    if tiepoint is None or scale is None or len(tiepoint) != 6:
+        raise UnsupportedTiffError("Raster is not georeferenced by a single tiepoint")
+    col, row, _, x, y, _ = tiepoint
+    scale_x, scale_y = scale[0], scale[1]
+    if scale_x <= 0 or scale_y <= 0:
+        raise UnsupportedTiffError("Raster is not north up")
+    return Affine(scale_x, 0.0, x - col * scale_x, 0.0, -scale_y, y + row * scale_y)
+
+
+def _parse_nodata(value: bytes | None, dtype: str) -> float | None:
+    """GDAL_NODATA value, rounded to the band's precision as GDAL does"""
+    if not value:
+        return None
+    nodata = float(value)
+    return float(np.float32(nodata)) if dtype == "float32" else nodata
+
+
+def parse_geotiff_header(buffer: mmap.mmap) -> GeoTiffHeader:
+    """Parse the header of a GeoTIFF.
+
+    Args:
+        buffer (mmap.mmap): memory mapped GeoTIFF
+
+    Raises:
+        UnsupportedTiffError: if the file cannot be described without GDAL
+
+    Returns:
+        GeoTiffHeader: GeoTIFF header
+    """
+    try:
+        tags = _read_ifd(buffer)
+        samples = tags.get(SAMPLES_PER_PIXEL, (1,))[0]
+        bits = tags.get(BITS_PER_SAMPLE, (1,))
+        formats = tags.get(SAMPLE_FORMAT, (1,))
+        if len(set(bits)) != 1 or len(set(formats)) != 1:
+            raise UnsupportedTiffError("Bands have different data types")
+        dtype = DTYPES.get((formats[0], bits[0]))
+        if dtype is None:
+            raise UnsupportedTiffError(f"Unsupported data type: {formats[0]}, {bits[0]} bits")
+        if GEO_KEY_DIRECTORY not in tags:
+            raise UnsupportedTiffError("Missing GeoKey directory")
+        nodata = tags.get(GDAL_NODATA)
+        return GeoTiffHeader(
+            crs=_parse_crs(tags[GEO_KEY_DIRECTORY]),
+            transform=_parse_transform(tags),
+            width=tags[IMAGE_WIDTH][0],
+            height=tags[IMAGE_LENGTH][0],
+            dtypes=(dtype,) * samples,
+            nodata=_parse_nodata(nodata, dtype),
+        )
+    except (struct.error, KeyError, IndexError, ValueError) as e:
+        raise UnsupportedTiffError(f"Malformed TIFF: {e}") from None
+
+
+def read_geotiff_header(path: str | Path) -> GeoTiffHeader | None:
+    """Read the header of a local GeoTIFF without GDAL.
+
+    Opening a small GeoTIFF with rasterio is dominated by GDAL's driver probing and dataset setup. If the
+    georeferencing is fully described by an EPSG code and a tiepoint and pixel scale (or model transformation), the first
+    IFD and the GeoKey directory hold everything needed. Anything else (user defined crs, ground control points,
+    `PixelIsPoint` rasters, complex data types, a GDAL PAM `.aux.xml` sidecar overriding the georeferencing) is left
+    to rasterio.
+
+    Args:
+        path (str | Path): local path of the GeoTIFF
+
+    Returns:
+        GeoTiffHeader | None: GeoTIFF header, None if the file must be read with rasterio
+    """
+    if Path(f"{path}.aux.xml").exists():
+        return None
+    try:
+        with (
+            Path(path).open("rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            return parse_geotiff_header(buffer)
+    except (UnsupportedTiffError, OSError, ValueError) as e:
+        logger.debug(f"Reading header of {path} with rasterio: {e}")
+        return None
@@ -0,0 +1,602 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import warnings
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+import pystac
+import rasterio
+import shapely
+from pystac.extensions.raster import Histogram, Statistics
+from rasterio import features
+from rasterio.enums import Resampling
+from rasterio.errors import NotGeoreferencedWarning
+
+from stac_generator.core.base.utils import simplify_to_budget
+from stac_generator.core.raster.tiff import read_geotiff_header
+from stac_generator.exceptions import SourceAssetException, StacConfigException
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from affine import Affine
+    from rasterio.io import DatasetReader
+    from rasterio.windows import Window
+    from shapely import Geometry
+
+    from stac_generator.core.raster.schema import (
+        BandInfo,
+        RasterFootprintConfig,
+        StatisticsConfig,
+        ThumbnailConfig,
+    )
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_TAGS = {
+    "minimum": "STATISTICS_MINIMUM",
+    "maximum": "STATISTICS_MAXIMUM",
+    "mean": "STATISTICS_MEAN",
+    "stddev": "STATISTICS_STDDEV",
+    "valid_percent": "STATISTICS_VALID_PERCENT",
+}
+"""GDAL metadata items holding statistics stored in PAM (.aux.xml) or the GDAL_METADATA TIFF tag"""
+
+
+@dataclass
+class BandStatistics:
+    """Running statistics of a band, merged across windows with Chan's parallel algorithm"""
+
+    count: int = 0
+    """Number of valid pixels"""
+    total: int = 0
+    """Number of pixels, including invalid ones"""
+    mean: float = 0.0
+    m2: float = 0.0
+    """Sum of squared differences from the mean"""
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, total: int) -> BandStatistics:
+        """Statistics of the valid values of a window containing `total` pixels"""
+        if values.size == 0:
+            return cls(total=total)
+        values = values.astype(np.float64, copy=False)
+        mean = float(values.mean())
+        return cls(
+            count=int(values.size),
+            total=total,
+            mean=mean,
+            m2=float(np.square(values - mean).sum()),
+            minimum=float(values.min()),
+            maximum=float(values.max()),
+        )
+
+    def merge(self, other: BandStatistics) -> BandStatistics:
+        """Combine the statistics of two disjoint sets of pixels"""
+        count = self.count + other.count
+        if count == 0:
+            return BandStatistics(total=self.total + other.total)
+        delta = other.mean - self.mean
+        return BandStatistics(
+            count=count,
+            total=self.total + other.total,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta**2 * self.count * other.count / count,
+            minimum=min(self.minimum, other.minimum),
+            maximum=max(self.maximum, other.maximum),
+        )
+
+    def to_statistics(self) -> Statistics | None:
+        """Raster extension statistics. None if the band has no valid pixel"""
+        if self.count == 0:
+            return None
+        return Statistics.create(
+            minimum=self.minimum,
+            maximum=self.maximum,
+            mean=self.mean,
+            stddev=math.sqrt(self.m2 / self.count),
+            valid_percent=100 * self.count / self.total,
+        )
+
+
+def valid_values(data: np.ma.MaskedArray) -> np.ndarray:
+    """Flattened values that are neither masked nor non-finite"""
+    values: np.ndarray = data.compressed()  # type: ignore[no-untyped-call]
+    if np.issubdtype(values.dtype, np.floating):
+        values = values[np.isfinite(values)]
+    return values
+
+
+def embedded_statistics(src: DatasetReader, band: int) -> Statistics | None:
+    """Statistics stored in the dataset's metadata, if all of minimum, maximum, mean and stddev are present"""
+    tags = src.tags(band)
+    values = {key: tags.get(tag) for key, tag in STATISTICS_TAGS.items()}
+    if any(values[key] is None for key in ("minimum", "maximum", "mean", "stddev")):
+        return None
+    return Statistics.create(
+        **{key: float(value) for key, value in values.items() if value is not None}
+    )
+
+
+def decimated_shape(src: DatasetReader, max_size: int) -> tuple[int, int]:
+    """Shape of the dataset decimated by an integer factor so that its longest side is at most `max_size`.
+
+    Reads at this shape are served by GDAL from the lowest adequate overview.
+    """
+    decimation = max(1, math.ceil(max(src.width, src.height) / max_size))
+    return (max(1, src.height // decimation), max(1, src.width // decimation))
+
+
+def valid_data_footprint(src: DatasetReader, config: RasterFootprintConfig) -> Geometry | None:
+    """Region of valid pixels in the dataset's crs, simplified to the config's vertex budget within the dataset's bounds.
+
+    The dataset mask (nodata, alpha or mask band) is read at a reduced resolution and vectorised.
+
+    Args:
+        src (DatasetReader): opened dataset
+        config (RasterFootprintConfig): footprint config
+
+    Returns:
+        Geometry | None: valid data region or None if the dataset has no valid pixel
+    """
+    height, width = decimated_shape(src, config.overview_size)
+    mask = src.dataset_mask(out_shape=(height, width))
+    transform = src.transform * src.transform.scale(src.width / width, src.height / height)
+    polygons = [
+        shapely.geometry.shape(geometry)
+        for geometry, _ in features.shapes(mask, mask=mask > 0, transform=transform)
+    ]
+    if not polygons:
+        return None
+    return simplify_to_budget(shapely.union_all(polygons), config.max_vertices, clip=src.bounds)
+
+
+THUMBNAIL_MEDIA_TYPES = {"png": pystac.MediaType.PNG, "webp": "image/webp"}
+THUMBNAIL_DRIVERS = {"png": "PNG", "webp": "WEBP"}
+
+
+def thumbnail_bands(src: DatasetReader, band_info: Sequence[BandInfo]) -> list[int]:
+    """Default thumbnail bands - red, green and blue by common name, otherwise the first three bands or the first band"""
+    common_names = [band.common_name for band in band_info]
+    if all(name in common_names for name in ("red", "green", "blue")):
+        return [common_names.index(name) + 1 for name in ("red", "green", "blue")]
+    return [1, 2, 3] if src.count >= 3 else [1]
+
+
+def render_thumbnail(
+    src: DatasetReader, indexes: Sequence[int], config: ThumbnailConfig
+) -> np.ndarray:
+    """Read bands at thumbnail resolution and stretch them to an RGBA image.
+
+    Args:
+        src (DatasetReader): opened dataset
+        indexes (Sequence[int]): 1-based indexes of the grayscale band or of the red, green and blue bands
+        config (ThumbnailConfig): thumbnail config
+
+    Returns:
+        np.ndarray: uint8 array of shape (4, height, width)
+    """
+    height, width = decimated_shape(src, config.size)
+    data = src.read(
+        list(indexes),
+        out_shape=(len(indexes), height, width),
+        resampling=Resampling[config.resampling],
+        masked=True,
+    )
+    if np.issubdtype(data.dtype, np.floating):
+        data = np.ma.masked_invalid(data)  # type: ignore[no-untyped-call]
+    mask = np.ma.getmaskarray(data)  # type: ignore[no-untyped-call]
+    image = np.zeros((4, height, width), dtype=np.uint8)
+    for idx, band in enumerate(data):
+        values = band.compressed()  # type: ignore[no-untyped-call]
+        if values.size == 0:
+            continue
+        low, high = np.percentile(values, config.percentiles)
+        scaled = (band.filled(low).astype(np.float64) - low) / max(high - low, np.finfo(float).eps)
+        image[idx] = np.clip(np.round(scaled * 255), 0, 255)
+    if len(indexes) == 1:
+        image[1] = image[2] = image[0]
+    image[3] = np.where(mask.any(axis=0), 0, 255)
+    return image
+
+
+def write_thumbnail(
+    src: DatasetReader, band_info: Sequence[BandInfo], config: ThumbnailConfig
+) -> pystac.Asset | None:
+    """Write the thumbnail of an opened dataset and describe it as an asset.
+
+    The dataset is read at a reduced resolution, so that the cost of the thumbnail is that of reading an overview.
+
+    Args:
+        src (DatasetReader): opened dataset
+        band_info (Sequence[BandInfo]): band information, used to find the red, green and blue bands
+        config (ThumbnailConfig): thumbnail config
+
+    Returns:
+        pystac.Asset | None: thumbnail asset, None for complex rasters
+    """
+    indexes = config.bands or thumbnail_bands(src, band_info)
+    if any(np.issubdtype(np.dtype(src.dtypes[band - 1]), np.complexfloating) for band in indexes):
+        logger.warning(f"Thumbnail is not generated for complex raster: {src.name}")
+        return None
+    image = render_thumbnail(src, indexes, config)
+    Path(config.location).parent.mkdir(parents=True, exist_ok=True)
+    with warnings.catch_warnings():
+        # Thumbnails are not georeferenced
+        warnings.simplefilter("ignore", NotGeoreferencedWarning)
+        with rasterio.open(
+            config.location,
+            "w",
+            driver=THUMBNAIL_DRIVERS[config.format],
+            width=image.shape[2],
+            height=image.shape[1],
+            count=4,
+            dtype="uint8",
+        ) as dst:
+            dst.write(image)
+    return pystac.Asset(
+        href=config.location,
+        media_type=THUMBNAIL_MEDIA_TYPES[config.format],
+        roles=["thumbnail"],
+        title="Thumbnail",
+    )
+
+
+def _histogram(values: np.ndarray, statistics: Statistics, bins: int) -> np.ndarray:
+    value_range = (cast(float, statistics.minimum), cast(float, statistics.maximum))
+    return np.histogram(values, bins=bins, range=value_range)[0].astype(np.int64)
+
+
+def _window_statistics(
+    path: str, options: dict[str, str], indexes: Sequence[int], windows: Sequence[Window]
+) -> list[BandStatistics]:
+    result = [BandStatistics() for _ in indexes]
+    with rasterio.Env(**options), rasterio.open(path) as src:
+        for window in windows:
+            data = src.read(indexes, window=window, masked=True)
+            for idx in range(len(indexes)):
+                result[idx] = result[idx].merge(
+                    BandStatistics.from_values(valid_values(data[idx]), data[idx].size)
+                )
+    return result
+
+
+def _window_histograms(
+    path: str,
+    options: dict[str, str],
+    indexes: Sequence[int],
+    windows: Sequence[Window],
+    statistics: Sequence[Statistics],
+    bins: int,
+) -> list[np.ndarray]:
+    result = [np.zeros(bins, dtype=np.int64) for _ in indexes]
+    with rasterio.Env(**options), rasterio.open(path) as src:
+        for window in windows:
+            data = src.read(indexes, window=window, masked=True)
+            for idx in range(len(indexes)):
+                result[idx] += _histogram(valid_values(data[idx]), statistics[idx], bins)
+    return result
+
+
+def _approximate_statistics(
+    src: DatasetReader, band: int, statistics: Statistics | None, config: StatisticsConfig
+) -> tuple[Statistics | None, np.ndarray | None]:
+    if statistics is not None and not config.histogram:
+        return statistics, None
+    out_shape = decimated_shape(src, config.overview_size)
+    values = valid_values(src.read(band, out_shape=out_shape, masked=True))
+    if statistics is None:
+        statistics = BandStatistics.from_values(values, out_shape[0] * out_shape[1]).to_statistics()
+    if statistics is None or not config.histogram:
+        return statistics, None
+    return statistics, _histogram(values, statistics, config.bins)
+
+
+def _exact_statistics(
+    path: str,
+    options: dict[str, str],
+    indexes: Sequence[int],
+    windows: Sequence[Window],
+    statistics: list[Statistics | None],
+    config: StatisticsConfig,
+) -> list[tuple[Statistics | None, np.ndarray | None]]:
+    workers = min(config.max_workers or min(32, (os.cpu_count() or 1) + 4), len(windows))
+    chunks = [windows[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        missing = [band for band, stats in zip(indexes, statistics, strict=True) if stats is None]
+        if missing:
+            merged = [BandStatistics() for _ in missing]
+            for partial in pool.map(
+                lambda chunk: _window_statistics(path, options, missing, chunk), chunks
+            ):
+                merged = [total.merge(part) for total, part in zip(merged, partial, strict=True)]
+            computed = iter(merged)
+            statistics = [
+                stats if stats is not None else next(computed).to_statistics()
+                for stats in statistics
+            ]
+        # Histogram ranges require the statistics of the band - second pass
+        valid = [(band, stats) for band, stats in zip(indexes, statistics, strict=True) if stats]
+        histograms: dict[int, np.ndarray] = {}
+        if config.histogram and valid:
+            bands = [band for band, _ in valid]
+            ranges = [stats for _, stats in valid]
+            for partial_histograms in pool.map(
+                lambda chunk: _window_histograms(path, options, bands, chunk, ranges, config.bins),
+                chunks,
+            ):
+                for band, histogram in zip(bands, partial_histograms, strict=True):
+                    histograms[band] = histograms.get(band, 0) + histogram
+    return [(stats, histograms.get(band)) for band, stats in zip(indexes, statistics, strict=True)]
+
+
+def compute_band_statistics(
+    src: DatasetReader,
+    path: str,
+    indexes: Sequence[int],
+    config: StatisticsConfig,
+    options: dict[str, str] | None = None,
+) -> list[tuple[Statistics | None, Histogram | None]]:
+    """Compute statistics and optionally histograms of raster bands.
+
+    Statistics embedded in the dataset are reused. Otherwise, in `exact` mode, the dataset is read block by block,
+    with blocks distributed across a thread pool in which each thread holds its own dataset handle. In
+    `approximate` mode, each band is read once at a resolution of at most `overview_size` pixels on the longest side,
+    which GDAL serves from the lowest adequate overview. Memory use is bounded by a block (or the decimated band),
+    regardless of the size of the raster.
+
+    Args:
+        src (DatasetReader): opened dataset
+        path (str): path used to open `src`, for reopening the dataset in worker threads
+        indexes (Sequence[int]): 1-based band indexes
+        config (StatisticsConfig): statistics config
+        options (dict[str, str] | None, optional): GDAL configuration options for reopening the dataset. Defaults to None.
+
+    Returns:
+        list[tuple[Statistics | None, Histogram | None]]: statistics and histogram of each band
+    """
+    if any(np.issubdtype(np.dtype(src.dtypes[band - 1]), np.complexfloating) for band in indexes):
+        logger.warning(f"Statistics are not computed for complex raster: {path}")
+        return [(None, None) for _ in indexes]
+    statistics = [embedded_statistics(src, band) for band in indexes]
+    if config.mode == "approximate":
+        results = [
+            _approximate_statistics(src, band, stats, config)
+            for band, stats in zip(indexes, statistics, strict=True)
+        ]
+    else:
+        windows = [window for _, window in src.block_windows(1)]
+        results = _exact_statistics(path, options or {}, indexes, windows, statistics, config)
+    return [
+        (stats, _to_histogram(stats, buckets, config.bins) if stats is not None else None)
+        for stats, buckets in results
+    ]
+
+
+def _to_histogram(
+    statistics: Statistics, buckets: np.ndarray | None, bins: int
+) -> Histogram | None:
+    if buckets is None:
+        return None
+    return Histogram.create(
+        count=bins,
+        min=cast(float, statistics.minimum),
+        max=cast(float, statistics.maximum),
+        buckets=buckets.tolist(),
+    )
+
+
+@dataclass(frozen=True)
+class RasterHeader:
+    """Header information of a raster tile"""
+
+    location: str
+    """Tile location"""
+    path: str
+    """GDAL path the tile was opened with"""
+    crs: Any
+    """Tile crs"""
+    transform: Affine
+    """Tile geotransform"""
+    width: int
+    height: int
+    dtypes: tuple[str, ...]
+    nodata: float | None
+    footprint: Geometry | None = None
+    """Valid data region in the tile's crs, if requested"""
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Bounds as (left, bottom, right, top)"""
+        left, top = self.transform * (0, 0)
+        right, bottom = self.transform * (self.width, self.height)
+        return (min(left, right), min(bottom, top), max(left, right), max(bottom, top))
+
+
+def read_raster_header(
+    location: str,
+    path: str,
+    options: dict[str, str] | None = None,
+    footprint_config: RasterFootprintConfig | None = None,
+    fast_header: bool = False,
+) -> RasterHeader:
+    """Read the header of a raster tile, and optionally its valid data footprint.
+
+    Args:
+        location (str): tile location
+        path (str): GDAL path of the tile
+        options (dict[str, str] | None, optional): GDAL configuration options. Defaults to None.
+        footprint_config (RasterFootprintConfig | None, optional): footprint config. Defaults to None.
+        fast_header (bool, optional): whether to parse local GeoTIFF headers in pure python. Defaults to False.
+
+    Raises:
+        SourceAssetException: if the tile cannot be accessed
+
+    Returns:
+        RasterHeader: tile header
+    """
+    with_footprint = footprint_config is not None and footprint_config.method == "valid_data"
+    if fast_header and not options and not with_footprint:
+        header = read_geotiff_header(path)
+        if header is not None:
+            return RasterHeader(
+                location=location,
+                path=path,
+                crs=header.crs,
+                transform=header.transform,
+                width=header.width,
+                height=header.height,
+                dtypes=header.dtypes,
+                nodata=header.nodata,
+            )
+    try:
+        with rasterio.Env(**(options or {})), rasterio.open(path) as src:
+            return RasterHeader(
+                location=location,
+                path=path,
+                crs=src.crs,
+                transform=src.transform,
+                width=src.width,
+                height=src.height,
+                dtypes=tuple(src.dtypes),
+                nodata=src.nodata,
+                footprint=valid_data_footprint(src, footprint_config)
+                if footprint_config is not None and with_footprint
+                else None,
+            )
+    except rasterio.errors.RasterioIOError as e:
+        raise SourceAssetException(f"Unable to read raster asset: {location}. " + str(e)) from None
+
+
+def check_mosaic_grid(headers: Sequence[RasterHeader], tolerance: float = 1e-3) -> None:
+    """Check that tiles can be mosaicked without resampling.
+
+    Tiles must share a crs, band layout, nodata value and resolution, and their origins must be aligned
+    on the same grid within `tolerance` pixels.
+
+    Args:
+        headers (Sequence[RasterHeader]): tile headers
+        tolerance (float, optional): alignment tolerance in pixels. Defaults to 1e-3.
+
+    Raises:
+        StacConfigException: if tiles are not compatible
+    """
+    reference = headers[0]
+    res_x, res_y = reference.transform.a, reference.transform.e
+    if reference.transform.b != 0 or reference.transform.d != 0:
+        raise StacConfigException(f"Rotated rasters cannot be mosaicked: {reference.location}")
+    for header in headers[1:]:
+        reasons = []
+        if header.crs != reference.crs:
+            reasons.append("crs")
+        if header.dtypes != reference.dtypes:
+            reasons.append("band count or data types")
+        if header.nodata != reference.nodata:
+            reasons.append("nodata")
+        transform = header.transform
+        if not (
+            math.isclose(transform.a, res_x, rel_tol=1e-9)
+            and math.isclose(transform.e, res_y, rel_tol=1e-9)
+            and transform.b == 0
+            and transform.d == 0
+        ):
+            reasons.append("resolution")
+        else:
+            offset_x = (transform.c - reference.transform.c) / res_x
+            offset_y = (transform.f - reference.transform.f) / res_y
+            if max(abs(offset_x - round(offset_x)), abs(offset_y - round(offset_y))) > tolerance:
+                reasons.append("grid alignment")
+        if reasons:
+            raise StacConfigException(
+                f"Tile {header.location} does not match {reference.location}: {', '.join(reasons)} differ. Tiles of a mosaic must share the same grid."
+            )
+
+
+def check_shared_extent(headers: Sequence[RasterHeader], tolerance: float = 0.5) -> None:
+    """Check that rasters describe the same area on a shared grid, i.e. the band files of a scene.
+
+    Rasters must share a crs, and their extents must agree within `tolerance` of the coarsest pixel. Resolutions may
+    differ (i.e. 10 m and 20 m bands).
+
+    Args:
+        headers (Sequence[RasterHeader]): raster headers
+        tolerance (float, optional): extent tolerance in pixels of the coarsest raster. Defaults to 0.5.
+
+    Raises:
+        StacConfigException: if rasters do not share a grid
+    """
+    reference = headers[0]
+    for header in headers[1:]:
+        reasons = []
+        if header.crs != reference.crs:
+            reasons.append("crs")
+        else:
+            pixel = max(
+                abs(transform.a) + abs(transform.b) + abs(transform.d) + abs(transform.e)
+                for transform in (header.transform, reference.transform)
+            )
+            if any(
+                abs(bound - ref_bound) > tolerance * pixel
+                for bound, ref_bound in zip(header.bounds, reference.bounds, strict=True)
+            ):
+                reasons.append("extent")
+        if reasons:
+            raise StacConfigException(
+                f"Raster {header.location} does not match {reference.location}: {', '.join(reasons)} differ. Band files of an item must share the same grid."
+            )
+
+
+def write_vrt(
+    headers: Sequence[RasterHeader], path: str | Path, transform: Affine, width: int, height: int
+) -> None:
+    """Write a GDAL VRT mosaicking tiles that share a grid.
+
+    Args:
+        headers (Sequence[RasterHeader]): tile headers, checked with `check_mosaic_grid`
+        path (str | Path): output location
+        transform (Affine): geotransform of the mosaic
+        width (int): mosaic width
+        height (int): mosaic height
+    """
+    reference = headers[0]
+    root = ET.Element("VRTDataset", rasterXSize=str(width), rasterYSize=str(height))
+    ET.SubElement(root, "SRS", dataAxisToSRSAxisMapping="1,2").text = reference.crs.to_wkt()
+    ET.SubElement(root, "GeoTransform").text = ", ".join(
+        repr(value) for value in transform.to_gdal()
+    )
+    inverse = ~transform
+    for band, dtype in enumerate(reference.dtypes, start=1):
+        band_element = ET.SubElement(
+            root,
+            "VRTRasterBand",
+            dataType=rasterio.dtypes.typename_fwd[rasterio.dtypes.dtype_rev[dtype]],
+            band=str(band),
+        )
+        if reference.nodata is not None:
+            ET.SubElement(band_element, "NoDataValue").text = repr(reference.nodata)
+        for header in headers:
+            col, row = inverse * (header.transform.c, header.transform.f)
+            source = ET.SubElement(band_element, "ComplexSource")
+            source_path = (
+                header.path if header.path.startswith("/vsi") else str(Path(header.path).resolve())
+            )
+            ET.SubElement(source, "SourceFilename", relativeToVRT="0").text = source_path
+            ET.SubElement(source, "SourceBand").text = str(band)
+            size = {"xSize": str(header.width), "ySize": str(header.height)}
+            ET.SubElement(source, "SrcRect", {"xOff": "0", "yOff": "0", **size})
+            ET.SubElement(
+                source, "DstRect", {"xOff": str(round(col)), "yOff": str(round(row)), **size}
+            )
+            if reference.nodata is not None:
+                ET.SubElement(source, "NODATA").text = repr(reference.nodata)
+    ET.indent(root)
+    ET.ElementTree(root).write(path, encoding="utf-8")
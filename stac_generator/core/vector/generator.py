@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 import logging
+from typing import cast
 
 import pandas as pd
 import pystac
+from shapely import box
 
+from stac_generator.core.base.fetch import fetch_asset
 from stac_generator.core.base.generator import BaseVectorGenerator
+from stac_generator.core.base.record import ItemRecord, asset_dict
 from stac_generator.core.base.schema import ASSET_KEY
 from stac_generator.core.base.utils import (
+    ReadRequest,
     extract_epsg,
     get_timezone,
+    is_remote,
+    list_vector_layers,
     read_join_asset,
     read_vector_asset,
+    reproject_bounds,
 )
-from stac_generator.core.vector.schema import VectorConfig
+from stac_generator.core.vector.schema import ALL_LAYERS, VectorConfig
 from stac_generator.exceptions import StacConfigException
 
 logger = logging.getLogger(__name__)
@@ -22,18 +30,74 @@ logger = logging.getLogger(__name__)
 class VectorGenerator(BaseVectorGenerator[VectorConfig]):
     """ItemGenerator class that handles vector data with common vector formats - i.e (shp, zipped shp, gpkg, geojson)"""
 
-    def generate(self) -> pystac.Item:
-        """Create a STAC Item from a VectorConfig
+    def expand(self) -> list[VectorGenerator]:
+        """Expand a multi-layer config into one generator per layer.
+
+        Layers are listed from the datasource if `layer` is `*`, which reads its metadata only. Each generated
+        item has the id `{id}_{layer}` and describes a single layer. The layer generators read the same asset, so
+        `CollectionGenerator` hands them to one worker, which reads every layer in one pass over the datasource.
+
+        Returns:
+            list[VectorGenerator]: generator for each layer
+        """
+        if not self.config.is_multi_layer:
+            return [self]
+        layers = (
+            list_vector_layers(
+                self.source, self.config.headers, self.config.cookies, self.config.params
+            )
+            if self.config.layer == ALL_LAYERS
+            else self.config.layer
+        )
+        logger.debug(f"Expanding vector asset: {self.config.id} into layers: {layers}")
+        return [
+            type(self)(
+                self.config.model_copy(update={"id": f"{self.config.id}_{layer}", "layer": layer})
+            )
+            for layer in cast(list[str], layers)
+        ]
+
+    def read_requests(self) -> list[ReadRequest]:
+        if self.config.is_multi_layer:
+            return []
+        layer = cast(str | None, self.config.layer)
+        requests = []
+        if not self.config.requires_download:
+            requests.append(ReadRequest("vector", self.config.location, layer=layer))
+        if (join_config := self.config.join_config) is not None and not is_remote(join_config.file):
+            columns = {col["name"] for col in join_config.column_info}
+            columns.add(join_config.right_on)
+            if join_config.date_column:
+                columns.add(join_config.date_column)
+            requests.append(
+                ReadRequest(
+                    "csv",
+                    join_config.file,
+                    columns=frozenset(columns),
+                    date_columns=frozenset([join_config.date_column])
+                    if join_config.date_column
+                    else frozenset(),
+                    date_format=join_config.date_format,
+                )
+            )
+        return requests
+
+    def generate_record(self) -> ItemRecord:
+        """Create a STAC Item record from a VectorConfig
 
         Raises:
             StacConfigException: if the stac config fails a validation check
 
         Returns:
-            pystac.Item: generated STAC Item
+            ItemRecord: generated item record
         """
 
+        if self.config.is_multi_layer:
+            raise StacConfigException(
+                f"Config {self.config.id} describes multiple layers: {self.config.layer}. Use `expand` or StacGeneratorFactory to generate one item per layer."
+            )
         assets = {
-            ASSET_KEY: pystac.Asset(
+            ASSET_KEY: asset_dict(
                 href=str(self.config.location),
                 media_type=pystac.MediaType.GEOJSON
                 if self.config.location.endswith(".geojson")
@@ -47,7 +111,13 @@ class VectorGenerator(BaseVectorGenerator[VectorConfig]):
         # Only read relevant fields
         columns = [col["name"] if isinstance(col, dict) else col for col in self.config.column_info]
         # Throw exceptions if column_info contains invalid column
-        raw_df = read_vector_asset(self.config.location, layer=self.config.layer)
+        raw_df = read_vector_asset(
+            self.source,
+            layer=cast(str | None, self.config.layer),
+            headers=self.config.headers,
+            cookies=self.config.cookies,
+            params=self.config.params,
+        )
 
         if columns and not set(columns).issubset(set(raw_df.columns)):
             raise StacConfigException(
@@ -64,11 +134,13 @@ class VectorGenerator(BaseVectorGenerator[VectorConfig]):
         if self.config.join_config:
             join_config = self.config.join_config
             logger.info(f"Reading join asset for vector asset: {self.config.id}")
-            # Get timezone information
-            tzinfo = get_timezone(self.config.timezone, raw_df.to_crs(4326).geometry)
+            # Get timezone information from the WGS 84 bbox - avoid reprojecting the frame
+            tzinfo = get_timezone(
+                self.config.timezone, box(*reproject_bounds(raw_df.total_bounds, raw_df.crs))
+            )
             # Try reading join file and raise errors if columns not provided
             join_df = read_join_asset(
-                join_config.file,
+                fetch_asset(join_config.file),
                 join_config.right_on,
                 join_config.date_format,
                 join_config.date_column,
@@ -90,11 +162,12 @@ class VectorGenerator(BaseVectorGenerator[VectorConfig]):
             if join_config.date_column:
                 time_column = join_config.date_column
         # Make properties
-        return self.df_to_item(
+        return self.df_to_record(
             raw_df,
             assets,
             self.config,
             properties=self.config.to_properties(),
             epsg=epsg,
             time_column=time_column,
+            footprint_config=self.config.footprint,
         )
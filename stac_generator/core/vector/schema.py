@@ -4,18 +4,21 @@ from typing import Annotated, Any, Self
 
 from pydantic import BaseModel, BeforeValidator, field_validator, model_validator
 
-from stac_generator.core.base.schema import ColumnInfo, HasColumnInfo, SourceConfig
+from stac_generator.core.base.schema import ColumnInfo, HasColumnInfo, HasFootprint, SourceConfig
 from stac_generator.core.base.utils import is_string_convertible  # noqa: TCH001
 
+ALL_LAYERS = "*"
+"""Layer value that selects every layer of a multi-layer vector asset"""
 
-class VectorOwnConfig(HasColumnInfo):
+
+class VectorOwnConfig(HasColumnInfo, HasFootprint):
     """Config that defines the minimum information for parsing and reading vector asset.
     This config is produced for vector asset when the method `to_asset_config` is invoked,
     or when `StacGeneratorFactory.extract_item_config` is called on a vector STAC Item.
     """
 
-    layer: str | None = None
-    """Vector layer for multi-layer shapefile."""
+    layer: str | list[str] | None = None
+    """Vector layer for multi-layer shapefile. Use `*` or a list of layer names to generate one item per layer, with item ids derived as `{id}_{layer}`."""
 
     join_config: JoinConfig | None = None
     """Config for join asset if valid available."""
@@ -38,6 +41,11 @@ class VectorOwnConfig(HasColumnInfo):
 class VectorConfig(SourceConfig, VectorOwnConfig):
     """Extends SourceConfig to describe vector asset."""
 
+    @property
+    def is_multi_layer(self) -> bool:
+        """Whether the config describes multiple layers, each of which produces an item"""
+        return isinstance(self.layer, list) or self.layer == ALL_LAYERS
+
     def to_asset_config(self) -> dict[str, Any]:
         """Produce a dictionary that has the signature of `VectorOwnConfig`"""
         return VectorOwnConfig.model_construct(
@@ -36,3 +36,11 @@ class BandInfoException(StacConfigException):
 
 class JoinConfigException(StacConfigException):
     """Exception raised when information provided in join config is invalid"""
+
+
+class StacValidationException(StacException):
+    """Exception raised when generated STAC metadata does not conform to the STAC or extension schemas"""
+
+
+class StacApiException(StacException):
+    """Exception raised when generated STAC metadata cannot be pushed to a STAC API"""
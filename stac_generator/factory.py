@@ -10,13 +10,25 @@ from stac_generator.core.base import (
     CollectionGenerator,
     ItemGenerator,
     StacCollectionConfig,
+    ValidationConfig,
 )
 from stac_generator.core.base.schema import SourceConfig
 from stac_generator.core.base.utils import read_source_config
+from stac_generator.core.datacube import DatacubeGenerator
+from stac_generator.core.datacube.schema import DatacubeConfig, DatacubeOwnConfig
 from stac_generator.core.point import PointGenerator
 from stac_generator.core.point.schema import PointConfig, PointOwnConfig
-from stac_generator.core.raster import RasterGenerator
-from stac_generator.core.raster.schema import RasterConfig, RasterOwnConfig
+from stac_generator.core.raster import (
+    RasterGenerator,
+    RasterMosaicGenerator,
+    RasterMultiAssetGenerator,
+)
+from stac_generator.core.raster.schema import (
+    RasterConfig,
+    RasterMosaicConfig,
+    RasterMultiAssetConfig,
+    RasterOwnConfig,
+)
 from stac_generator.core.vector import VectorGenerator
 from stac_generator.core.vector.schema import VectorConfig, VectorOwnConfig
 
@@ -32,11 +44,19 @@ EXTENSION_MAP: dict[str, type[SourceConfig]] = {
     "geotiff": RasterConfig,
     "tiff": RasterConfig,
     "tif": RasterConfig,
+    "vrt": RasterConfig,
     "zip": VectorConfig,
     "geojson": VectorConfig,
     "json": VectorConfig,
     "gpkg": VectorConfig,  # Can also contain raster data. TODO: overhaul interface
     "shp": VectorConfig,
+    "nc": DatacubeConfig,
+    "nc4": DatacubeConfig,
+    "netcdf": DatacubeConfig,
+    "h5": DatacubeConfig,
+    "hdf5": DatacubeConfig,
+    "he5": DatacubeConfig,
+    "zarr": DatacubeConfig,
 }
 
 EXTENSION_CONFIG_MAP: dict[str, type[BaseModel]] = {
@@ -45,17 +65,28 @@ EXTENSION_CONFIG_MAP: dict[str, type[BaseModel]] = {
     "geotiff": RasterOwnConfig,
     "tiff": RasterOwnConfig,
     "tif": RasterOwnConfig,
+    "vrt": RasterOwnConfig,
     "zip": VectorOwnConfig,
     "geojson": VectorOwnConfig,
     "json": VectorOwnConfig,
     "gpkg": VectorOwnConfig,  # Can also contain raster data. TODO: overhaul interface
     "shp": VectorOwnConfig,
+    "nc": DatacubeOwnConfig,
+    "nc4": DatacubeOwnConfig,
+    "netcdf": DatacubeOwnConfig,
+    "h5": DatacubeOwnConfig,
+    "hdf5": DatacubeOwnConfig,
+    "he5": DatacubeOwnConfig,
+    "zarr": DatacubeOwnConfig,
 }
 
 CONFIG_GENERATOR_MAP: dict[type[SourceConfig], type[ItemGenerator]] = {
     VectorConfig: VectorGenerator,
     RasterConfig: RasterGenerator,
+    RasterMosaicConfig: RasterMosaicGenerator,
+    RasterMultiAssetConfig: RasterMultiAssetGenerator,
     PointConfig: PointGenerator,
+    DatacubeConfig: DatacubeGenerator,
 }
 
 BaseConfig_T = (
@@ -157,8 +188,14 @@ class StacGeneratorFactory:
                 raise ValueError("Missing id in a config item.")
             if "location" not in config_dict:
                 raise ValueError(f"Missing location in a config item: {config_dict['id']}")
-            ext = config_dict["location"].split(".")[-1]
+            if RasterMultiAssetConfig.describes_multi_asset(config_dict):
+                return RasterMultiAssetConfig(**config_dict)
+            location = config_dict["location"]
+            first = location[0] if isinstance(location, list) and location else location
+            ext = str(first).rstrip("/").split(".")[-1]
             config_handler = StacGeneratorFactory.get_extension_handler(ext)
+            if config_handler is RasterConfig and RasterMosaicConfig.describes_mosaic(location):
+                config_handler = RasterMosaicConfig
             return config_handler(**config_dict)
 
         def handle_str_config(config_str: str) -> list[SourceConfig]:
@@ -191,10 +228,10 @@ class StacGeneratorFactory:
 
         parsed_configs = handle_config(configs)
 
-        generators = []
+        generators: list[ItemGenerator] = []
         for config in parsed_configs:
             handler = StacGeneratorFactory.get_generator_handler(config)
-            generators.append(handler(config))
+            generators.extend(handler(config).expand())
         return generators
 
     @staticmethod
@@ -202,6 +239,7 @@ class StacGeneratorFactory:
         source_configs: Config_T,
         collection_config: StacCollectionConfig,
         pool: Executor | None = None,
+        validation: ValidationConfig | None = None,
     ) -> CollectionGenerator:
         """Get a CollectionGenerator instance based on source configs and
         collection config
@@ -221,9 +259,10 @@ class StacGeneratorFactory:
             source_configs (Config_T): extra metadata/generation parameters for the collection's items
             collection_config (StacCollectionConfig): collection metadata.
             pool (Executor | None, optional): optional threadpool/process pool for parallel processing.. Defaults to None.
+            validation (ValidationConfig | None, optional): validation of the items by the workers producing them. Defaults to None.
 
         Returns:
             CollectionGenerator: a collection generator instance, in which all items are derived from source _configs and general metadata derived from collection_config.
         """
         handlers = StacGeneratorFactory.get_item_generators(source_configs)
-        return CollectionGenerator(collection_config, handlers, pool)
+        return CollectionGenerator(collection_config, handlers, pool, validation)
@@ -0,0 +1,481 @@
+import asyncio
+import datetime as dt
+import gzip
+import json
+import threading
+import time
+from collections.abc import Iterator
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from stac_generator.core.base.api import (
+    AsyncStacApiClient,
+    backoff_delay,
+    push_collection,
+    read_failed_ids,
+    retry_after,
+)
+from stac_generator.core.base.schema import ApiConfig
+from stac_generator.core.base.sync import SyncManifest, item_hash
+from stac_generator.exceptions import StacApiException, StacConfigException
+
+
+class StacApiServer(ThreadingHTTPServer):
+    """Local stand-in for a STAC API implementing the Transactions extension"""
+
+    def __init__(self, bulk: bool) -> None:
+        super().__init__(("127.0.0.1", 0), StacApiHandler)
+        self.bulk = bulk
+        self.requests: list[dict[str, Any]] = []
+        self.collections: dict[str, dict[str, Any]] = {}
+        self.items: dict[str, dict[str, Any]] = {}
+        # Error statuses returned by a path before it is handled
+        self.faults: dict[str, list[int]] = {}
+        self.delay = 0.0
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StacApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StacApiServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def respond(self, status: int, body: dict[str, Any] | None = None) -> None:
+        content = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def fault(self) -> bool:
+        with self.server.lock:
+            faults = self.server.faults.get(self.path)
+            status = faults.pop(0) if faults else None
+        if status is None:
+            return False
+        content = b"{}"
+        self.send_response(status)
+        self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        return True
+
+    def record(self) -> Any:
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        content = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            content = gzip.decompress(content)
+        body = json.loads(content) if content else None
+        self.server.requests.append(
+            {
+                "method": self.command,
+                "path": self.path,
+                "headers": dict(self.headers),
+                "body": body,
+                "port": self.client_address[1],
+            }
+        )
+        return body
+
+    def do_GET(self) -> None:
+        self.record()
+        if self.fault():
+            return
+        path, _, query = self.path.partition("?")
+        parts = path.strip("/").split("/")
+        if self.path == "/":
+            self.respond(
+                200, {"links": [{"rel": "service-desc", "href": f"{self.server.url}/api"}]}
+            )
+        elif self.path == "/api":
+            paths = {"/collections/{collectionId}/items": {}}
+            if self.server.bulk:
+                paths["/collections/{collectionId}/bulk_items"] = {}
+            self.respond(200, {"paths": paths})
+        elif parts[:1] == ["collections"] and len(parts) == 2:
+            if parts[1] in self.server.collections:
+                self.respond(200, self.served(self.server.collections[parts[1]]))
+            else:
+                self.respond(404)
+        elif parts[2:] == ["items"] and parts[1] in self.server.collections:
+            self.respond(200, self.page(parse_qs(query)))
+        else:
+            self.respond(404)
+
+    def served(self, stac: dict[str, Any]) -> dict[str, Any]:
+        return {**stac, "links": [{"rel": "self", "href": f"{self.server.url}{self.path}"}]}
+
+    def page(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        limit = int(query["limit"][0])
+        start = int(query.get("token", ["0"])[0])
+        ids = sorted(self.server.items)[start : start + limit]
+        links = []
+        if start + limit < len(self.server.items):
+            href = f"{self.server.url}/collections/collection/items?limit={limit}&token={start + limit}"
+            links.append({"rel": "next", "href": href})
+        features = [self.served(self.server.items[id]) for id in ids]
+        return {"type": "FeatureCollection", "features": features, "links": links}
+
+    def do_POST(self) -> None:
+        body = self.record()
+        if self.fault():
+            return
+        parts = self.path.strip("/").split("/")
+        if parts == ["collections"]:
+            exists = body["id"] in self.server.collections
+            self.server.collections[body["id"]] = body
+            self.respond(409 if exists else 201)
+        elif parts[2:] == ["items"]:
+            exists = body["id"] in self.server.items
+            self.server.items[body["id"]] = body
+            self.respond(409 if exists else 201)
+        elif parts[2:] == ["bulk_items"] and self.server.bulk:
+            self.server.items.update(body["items"])
+            self.respond(200)
+        else:
+            self.respond(404)
+
+    def do_PUT(self) -> None:
+        body = self.record()
+        parts = self.path.strip("/").split("/")
+        if parts[:1] == ["collections"] and len(parts) == 2:
+            self.server.collections[body["id"]] = body
+        elif parts[2:3] == ["items"] and len(parts) == 4 and parts[3] in self.server.items:
+            self.server.items[body["id"]] = body
+        else:
+            self.respond(404)
+            return
+        self.respond(200)
+
+    def do_DELETE(self) -> None:
+        self.record()
+        parts = self.path.strip("/").split("/")
+        if parts[2:3] == ["items"] and self.server.items.pop(parts[-1], None) is not None:
+            self.respond(200)
+        else:
+            self.respond(404)
+
+
+def serve(bulk: bool) -> Iterator[StacApiServer]:
+    server = StacApiServer(bulk)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def bulk_server() -> Iterator[StacApiServer]:
+    yield from serve(bulk=True)
+
+
+@pytest.fixture
+def server() -> Iterator[StacApiServer]:
+    yield from serve(bulk=False)
+
+
+def make_items(count: int) -> list[dict[str, Any]]:
+    return [
+        {"type": "Feature", "id": f"item_{idx}", "collection": "collection"} for idx in range(count)
+    ]
+
+
+COLLECTION = {"type": "Collection", "id": "collection"}
+
+
+def test_write_items_given_bulk_endpoint_expects_batched_on_one_connection(
+    bulk_server: StacApiServer,
+) -> None:
+    async def push() -> None:
+        config = ApiConfig(batch_size=4, concurrency=1)
+        async with AsyncStacApiClient(bulk_server.url, config) as client:
+            await client.write_collection(COLLECTION)
+            assert (await client.write_items("collection", make_items(10))).sent == 10
+
+    asyncio.run(push())
+    bulk = [request for request in bulk_server.requests if request["path"].endswith("bulk_items")]
+    assert [len(request["body"]["items"]) for request in bulk] == [4, 4, 2]
+    assert all(request["body"]["method"] == "upsert" for request in bulk)
+    assert sorted(bulk_server.items) == sorted(item["id"] for item in make_items(10))
+    assert bulk_server.collections == {"collection": COLLECTION}
+    # Every request, including the bulk endpoint detection, reuses the same connection
+    assert len({request["port"] for request in bulk_server.requests}) == 1
+
+
+def test_write_items_given_no_bulk_endpoint_expects_per_item_upsert(server: StacApiServer) -> None:
+    async def push() -> None:
+        async with AsyncStacApiClient(server.url, ApiConfig(concurrency=1)) as client:
+            await client.write_collection(COLLECTION)
+            await client.write_collection(COLLECTION)
+            assert (await client.write_items("collection", make_items(3))).sent == 3
+            assert (await client.write_items("collection", make_items(3))).sent == 3
+
+    asyncio.run(push())
+    methods = [(request["method"], request["path"]) for request in server.requests]
+    assert ("PUT", "/collections/collection") in methods
+    assert ("PUT", "/collections/collection/items/item_0") in methods
+    assert not any(path.endswith("bulk_items") for _, path in methods)
+    assert sorted(server.items) == ["item_0", "item_1", "item_2"]
+    assert len({request["port"] for request in server.requests}) == 1
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_write_items_given_bulk_config_expects_detection_skipped(
+    bulk: bool, bulk_server: StacApiServer
+) -> None:
+    async def push() -> None:
+        async with AsyncStacApiClient(bulk_server.url, ApiConfig(bulk=bulk)) as client:
+            await client.write_items("collection", make_items(2))
+
+    asyncio.run(push())
+    paths = [request["path"] for request in bulk_server.requests]
+    assert "/" not in paths
+    assert any(path.endswith("bulk_items") for path in paths) == bulk
+
+
+def test_write_items_given_gzip_expects_compressed_bodies(bulk_server: StacApiServer) -> None:
+    async def push() -> None:
+        async with AsyncStacApiClient(bulk_server.url, ApiConfig(gzip=True)) as client:
+            await client.write_collection(COLLECTION)
+            await client.write_items("collection", make_items(3))
+
+    asyncio.run(push())
+    posts = [request for request in bulk_server.requests if request["method"] == "POST"]
+    assert posts
+    assert all(request["headers"]["Content-Encoding"] == "gzip" for request in posts)
+    assert sorted(bulk_server.items) == ["item_0", "item_1", "item_2"]
+
+
+def test_client_given_http2_without_h2_expects_raises() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(StacConfigException, match="h2"):
+            AsyncStacApiClient("http://127.0.0.1", ApiConfig(http2=True))
+        return
+    client = AsyncStacApiClient("http://127.0.0.1", ApiConfig(http2=True))
+    asyncio.run(client.aclose())
+
+
+@pytest.mark.parametrize("fixture", ["bulk_server", "server"])
+def test_push_collection_expects_collection_first_then_items_concurrently(
+    fixture: str, request: pytest.FixtureRequest
+) -> None:
+    api_server: StacApiServer = request.getfixturevalue(fixture)
+    api_server.delay = 0.05
+    config = ApiConfig(batch_size=2, concurrency=3)
+    summary = push_collection(api_server.url, COLLECTION, make_items(12), config)
+    assert summary.sent == 12
+    assert not summary.failed
+    assert sorted(api_server.items) == sorted(item["id"] for item in make_items(12))
+    writes = [request for request in api_server.requests if request["method"] != "GET"]
+    assert writes[0]["path"] == "/collections"
+    assert 1 < api_server.max_in_flight <= 3
+
+
+def test_async_client_given_retryable_responses_expects_retried(
+    bulk_server: StacApiServer,
+) -> None:
+    bulk_server.faults = {
+        "/collections": [503],
+        "/collections/collection/bulk_items": [429, 502],
+    }
+
+    async def push() -> None:
+        async with AsyncStacApiClient(bulk_server.url, ApiConfig(backoff=0.01)) as client:
+            await client.write_collection(COLLECTION)
+            summary = await client.write_items("collection", make_items(3))
+        assert summary.sent == 3
+
+    asyncio.run(push())
+    assert bulk_server.collections == {"collection": COLLECTION}
+    assert sorted(bulk_server.items) == ["item_0", "item_1", "item_2"]
+
+
+def test_push_collection_given_failed_items_expects_summary_to_repush(
+    server: StacApiServer, tmp_path: Path
+) -> None:
+    failed_path = tmp_path / "failed.json"
+    server.faults = {"/collections/collection/items": [500] * 3 + [400]}
+    config = ApiConfig(concurrency=1, max_retries=2, backoff=0.01, failed_path=str(failed_path))
+    with pytest.raises(StacApiException, match=r"2 items .*failed\.json"):
+        push_collection(server.url, COLLECTION, make_items(4), config)
+    failed = read_failed_ids(failed_path)
+    assert failed == ["item_0", "item_1"]
+    assert sorted(server.items) == ["item_2", "item_3"]
+    server.requests.clear()
+    summary = push_collection(
+        server.url, COLLECTION, make_items(4), config.model_copy(update={"item_ids": failed})
+    )
+    assert summary.sent == 2
+    item_posts = [r for r in server.requests if r["path"] == "/collections/collection/items"]
+    assert [request["body"]["id"] for request in item_posts] == failed
+
+
+def test_backoff_delay_expects_jittered_exponential_respecting_retry_after() -> None:
+    config = ApiConfig(backoff=1, max_backoff=10)
+    assert all(0 <= backoff_delay(2, config) <= 4 for _ in range(100))
+    assert all(backoff_delay(10, config) <= 10 for _ in range(100))
+    response = httpx.Response(429, headers={"Retry-After": "30"})
+    assert retry_after(response) == 30
+    assert backoff_delay(0, config, response) == 30
+    date = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=120)
+    response = httpx.Response(503, headers={"Retry-After": format_datetime(date, usegmt=True)})
+    assert 100 < backoff_delay(0, config, response) <= 120
+    assert retry_after(httpx.Response(503)) is None
+
+
+def make_item(idx: int, value: float = 0) -> dict[str, Any]:
+    return {
+        "type": "Feature",
+        "id": f"item_{idx}",
+        "collection": "collection",
+        "properties": {"value": value},
+        "links": [{"rel": "root", "href": "./collection.json"}],
+    }
+
+
+def item_writes(server: StacApiServer) -> list[tuple[str, str]]:
+    return [
+        (request["method"], request["path"].rsplit("/", 1)[-1])
+        for request in server.requests
+        if request["method"] != "GET" and request["path"].startswith("/collections/collection/")
+    ]
+
+
+def test_item_hash_expects_canonical_without_links() -> None:
+    item = make_item(0)
+    reordered = {key: item[key] for key in reversed(item)}
+    assert item_hash(item) == item_hash({**reordered, "links": []})
+    assert item_hash(item) != item_hash(make_item(0, value=1))
+
+
+def test_item_hash_given_api_returned_item_expects_same_hash() -> None:
+    item = {
+        "type": "Feature",
+        "stac_version": "1.1.0",
+        "stac_extensions": [],
+        "id": "item_0",
+        "geometry": {"type": "Point", "coordinates": [150.0, -34.0]},
+        "bbox": [150.0, -34.0, 150.0, -34.0],
+        "properties": {
+            "datetime": "2024-01-01T10:00:00Z",
+            "start_datetime": "2024-01-01T00:00:00.500000Z",
+            "value": 1,
+        },
+        "links": [{"rel": "root", "href": "../../collection.json"}],
+        "assets": {"data": {"href": "data.csv"}},
+    }
+    returned = {
+        "id": "item_0",
+        "collection": "collection",
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "stac_extensions": ["https://stac-extensions.github.io/timestamps/v1.1.0/schema.json"],
+        "bbox": [150.0, -34.0, 150.0, -34.0],
+        "geometry": {"coordinates": [150.0, -34.0], "type": "Point"},
+        "properties": {
+            "value": 1,
+            "start_datetime": "2024-01-01T10:00:00.500+10:00",
+            "datetime": "2024-01-01T10:00:00.000000+00:00",
+            "created": "2024-06-01T00:00:00Z",
+            "updated": "2024-06-02T00:00:00Z",
+        },
+        "links": [
+            {"rel": "self", "href": "https://api.example.com/collections/collection/items/item_0"},
+            {"rel": "parent", "href": "https://api.example.com/collections/collection"},
+        ],
+        "assets": {"data": {"href": "data.csv"}},
+    }
+    assert item_hash(item) == item_hash(returned)
+    changed = {
+        **returned,
+        "properties": {**returned["properties"], "datetime": "2024-01-01T11:00:00Z"},
+    }
+    assert item_hash(item) != item_hash(changed)
+
+
+@pytest.mark.parametrize("mode", ["manifest", "remote"])
+def test_push_collection_given_sync_expects_only_changes_sent(
+    mode: str, server: StacApiServer, tmp_path: Path
+) -> None:
+    config = ApiConfig(sync=mode, manifest_path=str(tmp_path / "manifest.json"), page_size=2)
+    items = [make_item(idx) for idx in range(5)]
+    summary = push_collection(server.url, COLLECTION, items, config)
+    assert summary.sent == 5
+    assert sorted(server.items) == [item["id"] for item in items]
+
+    server.requests.clear()
+    summary = push_collection(server.url, COLLECTION, items, config)
+    assert (summary.sent, summary.unchanged) == (0, 5)
+    assert [request["method"] for request in server.requests if request["method"] != "GET"] == []
+
+    server.requests.clear()
+    items[1] = make_item(1, value=1)
+    items.append(make_item(5))
+    summary = push_collection(server.url, COLLECTION, items, config)
+    assert (summary.sent, summary.unchanged) == (2, 4)
+    assert item_writes(server) == [("PUT", "item_1"), ("POST", "items")]
+    assert server.items["item_1"]["properties"] == {"value": 1}
+    assert server.items["item_5"] == items[5]
+
+
+@pytest.mark.parametrize("mode", ["manifest", "remote"])
+def test_push_collection_given_sync_and_delete_expects_removed_items_deleted(
+    mode: str, server: StacApiServer, tmp_path: Path
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    config = ApiConfig(sync=mode, manifest_path=str(manifest_path))
+    push_collection(server.url, COLLECTION, [make_item(idx) for idx in range(4)], config)
+    summary = push_collection(server.url, COLLECTION, [make_item(0), make_item(1)], config)
+    # Removed items are kept unless deletes are requested
+    assert summary.deleted == 0
+    assert len(server.items) == 4
+
+    server.requests.clear()
+    config = config.model_copy(update={"delete": True})
+    summary = push_collection(server.url, COLLECTION, [make_item(0), make_item(1)], config)
+    assert (summary.sent, summary.unchanged, summary.deleted) == (0, 2, 2)
+    assert sorted(item_writes(server)) == [("DELETE", "item_2"), ("DELETE", "item_3")]
+    assert sorted(server.items) == ["item_0", "item_1"]
+    if mode == "manifest":
+        assert sorted(SyncManifest.read(manifest_path).items) == ["item_0", "item_1"]
+
+
+def test_push_collection_given_failed_sync_expects_failed_items_resent(
+    server: StacApiServer, tmp_path: Path
+) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    server.faults = {"/collections/collection/items": [400]}
+    config = ApiConfig(
+        sync="manifest", manifest_path=str(manifest_path), concurrency=1, max_retries=0
+    )
+    with pytest.raises(StacApiException):
+        push_collection(server.url, COLLECTION, [make_item(0), make_item(1)], config)
+    assert sorted(SyncManifest.read(manifest_path).items) == ["item_1"]
+    server.requests.clear()
+    summary = push_collection(server.url, COLLECTION, [make_item(0), make_item(1)], config)
+    assert (summary.sent, summary.unchanged) == (1, 1)
+    assert item_writes(server) == [("POST", "items")]
@@ -0,0 +1,166 @@
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_httpx
+
+from stac_generator.core.base import fetch
+from stac_generator.core.base.fetch import AssetCache, AssetFetcher
+from stac_generator.core.point.generator import PointGenerator
+from stac_generator.exceptions import SourceAssetException
+from tests.utils import compare_items
+
+URL = "https://host.org/data/asset.csv"
+POINT_CONFIG = "tests/files/integration_tests/point/config/point_config.json"
+POINT_GENERATED = "tests/files/integration_tests/point/generated"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> AssetCache:
+    return AssetCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def fetcher(cache: AssetCache) -> AssetFetcher:
+    return AssetFetcher(cache)
+
+
+def test_fetch_given_cached_asset_expects_revalidated_not_downloaded(
+    fetcher: AssetFetcher, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=URL, content=b"a,b\n1,2\n", headers={"ETag": '"v1"'})
+    httpx_mock.add_response(url=URL, status_code=304, match_headers={"If-None-Match": '"v1"'})
+    first = fetcher.fetch(URL)
+    second = fetcher.fetch(URL)
+    assert first == second
+    assert first.read_bytes() == b"a,b\n1,2\n"
+    assert first.suffix == ".csv"
+
+
+def test_fetch_given_changed_asset_expects_new_content(
+    fetcher: AssetFetcher, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=URL, content=b"v1", headers={"Last-Modified": "Mon, 01 Jan 2024"})
+    httpx_mock.add_response(
+        url=URL, content=b"v2", match_headers={"If-Modified-Since": "Mon, 01 Jan 2024"}
+    )
+    assert fetcher.fetch(URL).read_bytes() == b"v1"
+    assert fetcher.fetch(URL).read_bytes() == b"v2"
+
+
+def test_fetch_given_request_fields_expects_replayed(
+    fetcher: AssetFetcher, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(
+        url=URL + "?token=abc",
+        method="POST",
+        match_headers={"X-Api-Key": "secret", "Cookie": "session=1"},
+        match_json={"layer": "rain"},
+        content=b"data",
+    )
+    path = fetcher.fetch(
+        URL,
+        method="POST",
+        params={"token": "abc"},
+        headers={"X-Api-Key": "secret"},
+        cookies={"session": "1"},
+        json={"layer": "rain"},
+    )
+    assert path.read_bytes() == b"data"
+
+
+def test_fetch_given_same_content_expects_single_blob(
+    fetcher: AssetFetcher, cache: AssetCache, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=URL, content=b"data")
+    httpx_mock.add_response(url="https://mirror.org/asset.csv", content=b"data")
+    assert fetcher.fetch(URL) == fetcher.fetch("https://mirror.org/asset.csv")
+    assert len(list(cache.blobs.iterdir())) == 1
+
+
+def test_fetch_given_cache_full_expects_least_recently_used_evicted(
+    tmp_path: Path, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    fetcher = AssetFetcher(AssetCache(tmp_path, max_size=25))
+    for idx in range(3):
+        httpx_mock.add_response(url=f"https://host.org/{idx}.csv", content=str(idx).encode() * 10)
+    first = fetcher.fetch("https://host.org/0.csv")
+    second = fetcher.fetch("https://host.org/1.csv")
+    # Use first after second so that second becomes the least recently used
+    os.utime(second, (1, 1))
+    os.utime(first, (2, 2))
+    third = fetcher.fetch("https://host.org/2.csv")
+    assert third.exists()
+    assert first.exists()
+    assert not second.exists()
+    assert fetcher.cache.size() <= 25
+
+
+def test_fetch_given_error_status_expects_raises(
+    fetcher: AssetFetcher, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=URL, status_code=401)
+    with pytest.raises(SourceAssetException):
+        fetcher.fetch(URL)
+
+
+def test_fetch_given_unreachable_host_expects_cached_copy(
+    fetcher: AssetFetcher, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=URL, content=b"data", headers={"ETag": '"v1"'})
+    httpx_mock.add_exception(httpx.ConnectError("offline"), url=URL)
+    assert fetcher.fetch(URL) == fetcher.fetch(URL)
+
+
+class InterruptedStream(httpx.SyncByteStream):
+    def __iter__(self) -> Iterator[bytes]:
+        yield b"partial"
+        raise httpx.ReadError("connection reset")
+
+
+def test_fetch_given_interrupted_download_expects_no_leftover_file(
+    fetcher: AssetFetcher, cache: AssetCache, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=URL, stream=InterruptedStream())
+    with pytest.raises(SourceAssetException):
+        fetcher.fetch(URL)
+    assert not list(cache.tmp.iterdir())
+    assert not list(cache.blobs.iterdir())
+
+
+def test_point_generator_given_remote_location_expects_downloaded_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    monkeypatch.setattr(fetch, "_FETCHERS", {})
+    monkeypatch.setenv(fetch.CACHE_DIR_ENV, str(tmp_path))
+    with Path(POINT_CONFIG).open() as file:
+        config = json.load(file)[0]
+    local = Path(config["location"])
+    url = f"https://host.org/{local.name}"
+    httpx_mock.add_response(
+        url=url,
+        method="POST",
+        match_json={"station": config["id"]},
+        content=local.read_bytes(),
+        headers={"ETag": '"v1"'},
+    )
+    httpx_mock.add_response(
+        url=url, method="POST", status_code=304, match_headers={"If-None-Match": '"v1"'}
+    )
+    remote_config = {
+        **config,
+        "location": url,
+        "method": "POST",
+        "json_body": {"station": config["id"]},
+    }
+    with (Path(POINT_GENERATED) / config["id"] / f"{config['id']}.json").open() as file:
+        expected = json.load(file)
+    for _ in range(2):
+        actual = PointGenerator(remote_config).generate().to_dict()
+        assert actual["assets"]["data"]["href"] == url
+        actual["assets"]["data"]["href"] = expected["assets"]["data"]["href"]
+        actual["properties"]["stac_generator"] = expected["properties"]["stac_generator"]
+        compare_items(expected, actual)
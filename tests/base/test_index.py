@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pandas as pd
+import pystac
+import pytest
+import shapely
+from shapely.geometry import shape
+
+from stac_generator.core.base import CollectionIndex, StacCollectionConfig
+from stac_generator.factory import StacGeneratorFactory
+
+COMPOSITE_CONFIG = "tests/files/integration_tests/composite/config/composite_config.json"
+
+
+@pytest.fixture(scope="module")
+def collection() -> pystac.Collection:
+    generator = StacGeneratorFactory.get_collection_generator(
+        COMPOSITE_CONFIG, StacCollectionConfig(id="collection")
+    )
+    return generator()
+
+
+@pytest.fixture(scope="module")
+def collection_index(collection: pystac.Collection) -> CollectionIndex:
+    return CollectionIndex.from_collection(collection)
+
+
+def linear_scan(
+    collection: pystac.Collection,
+    geometry: shapely.Geometry | None,
+    start: str | None,
+    end: str | None,
+) -> list[str]:
+    result = []
+    for item in collection.get_items(recursive=True):
+        if geometry is not None and not shape(item.geometry).intersects(geometry):
+            continue
+        item_start = pd.Timestamp(item.properties["start_datetime"])
+        item_end = pd.Timestamp(item.properties["end_datetime"])
+        if end is not None and item_start > pd.Timestamp(end, tz="UTC"):
+            continue
+        if start is not None and item_end < pd.Timestamp(start, tz="UTC"):
+            continue
+        result.append(item.id)
+    return sorted(result)
+
+
+@pytest.mark.parametrize(
+    "geometry, start, end",
+    [
+        (None, None, None),
+        (shapely.box(138.4, -35.1, 138.8, -34.7), None, None),
+        (shapely.box(138.4, -35.1, 138.8, -34.7), "2023-01-01", "2023-01-31"),
+        (None, "2016-01-01", "2017-01-01"),
+        (None, "2023-06-01", None),
+        (None, None, "2020-01-01"),
+        (shapely.Point(0, 0), None, None),
+        (shapely.box(100, -50, 160, 0), "2030-01-01", None),
+    ],
+)
+def test_query_given_window_expects_same_as_linear_scan(
+    collection: pystac.Collection,
+    collection_index: CollectionIndex,
+    geometry: shapely.Geometry | None,
+    start: str | None,
+    end: str | None,
+) -> None:
+    expected = linear_scan(collection, geometry, start, end)
+    actual = sorted(item.id for item in collection_index.query(geometry, start, end))
+    assert actual == expected
+
+
+def test_query_given_geojson_expects_same_as_shapely(collection_index: CollectionIndex) -> None:
+    geometry = shapely.box(138.4, -35.1, 138.8, -34.7)
+    expected = collection_index.query(geometry)
+    assert collection_index.query(shapely.geometry.mapping(geometry)) == expected
+    assert len(expected) > 0
+
+
+def test_from_file_expects_same_items(
+    collection: pystac.Collection, collection_index: CollectionIndex, tmp_path: Path
+) -> None:
+    collection = collection.clone()
+    collection.normalize_hrefs(tmp_path.as_posix())
+    collection.save(pystac.CatalogType.SELF_CONTAINED)
+    index = CollectionIndex.from_file(tmp_path / "collection.json")
+    assert len(index) == len(collection_index)
+    assert sorted(item.id for item in index.query()) == sorted(
+        item.id for item in collection_index.query()
+    )
@@ -0,0 +1,178 @@
+import datetime as dt
+import json
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pystac
+import pytest
+import shapely
+from shapely.geometry import mapping, shape
+
+from stac_generator.core.base.generator import (
+    CollectionGenerator,
+    ItemGenerator,
+    run_generator_group,
+)
+from stac_generator.core.base.record import ItemPayload, ItemRecord, geometry_dict
+from stac_generator.core.base.schema import StacCollectionConfig
+from stac_generator.core.base.utils import read_source_config
+from stac_generator.core.point.generator import PointGenerator
+from stac_generator.core.point.schema import PointConfig
+from stac_generator.core.raster.generator import RasterGenerator
+from stac_generator.factory import StacGeneratorFactory
+
+POINT_CONFIG = "tests/files/integration_tests/point/config/point_config.json"
+RASTER_CONFIG = "tests/files/integration_tests/raster/config/raster_config.json"
+
+
+@pytest.fixture(scope="module")
+def point_record() -> ItemRecord:
+    return PointGenerator(read_source_config(POINT_CONFIG)[0]).generate_record()
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        PointGenerator(read_source_config(POINT_CONFIG)[0]),
+        RasterGenerator(read_source_config(RASTER_CONFIG)[0]),
+    ],
+    ids=["point", "raster"],
+)
+def test_to_dict_expects_same_as_pystac(generator: ItemGenerator) -> None:
+    record = generator.generate_record()
+    item = record.to_item()
+    assert isinstance(item, pystac.Item)
+    expected = item.to_dict(include_self_link=False, transform_hrefs=False)
+    actual = record.to_dict()
+    # Same keys in the same order
+    assert json.dumps(actual) == json.dumps(expected)
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        shapely.Point(1, 2),
+        shapely.Point(1, 2, 3),
+        shapely.box(0, 0, 1, 1),
+        shapely.Point(0, 0).buffer(2).difference(shapely.Point(0, 0).buffer(1)),
+        shapely.MultiPolygon([shapely.box(0, 0, 1, 1), shapely.box(2, 2, 3, 3)]),
+        shapely.MultiPoint([(0, 0), (1, 1)]),
+        shapely.LineString([(0, 0), (1, 1)]),
+        shapely.GeometryCollection([shapely.Point(0, 1), shapely.box(0, 0, 1, 1)]),
+    ],
+    ids=lambda geometry: f"{geometry.geom_type}{'Z' if geometry.has_z else ''}",
+)
+def test_geometry_dict_expects_same_as_mapping(geometry: shapely.Geometry) -> None:
+    assert geometry_dict(geometry) == json.loads(json.dumps(mapping(geometry)))
+
+
+def test_from_item_expects_same_dict(point_record: ItemRecord) -> None:
+    item = point_record.to_item()
+    item.collection_id = "collection"
+    record = ItemRecord.from_item(item)
+    assert record.to_dict() == {**point_record.to_dict(), "collection": "collection"}
+
+
+def test_record_expects_slots_and_picklable(point_record: ItemRecord) -> None:
+    assert not hasattr(point_record, "__dict__")
+    assert pickle.loads(pickle.dumps(point_record)).to_dict() == point_record.to_dict()
+
+
+class ItemOnlyGenerator(ItemGenerator[PointConfig]):
+    def generate_record(self) -> ItemRecord:
+        return ItemRecord.from_item(PointGenerator(self.config).generate())
+
+
+class IncompleteGenerator(ItemGenerator[PointConfig]):
+    pass
+
+
+def test_generator_given_record_from_item_expects_same_collection() -> None:
+    configs = read_source_config(POINT_CONFIG)
+    expected = StacGeneratorFactory.get_collection_generator(
+        configs, StacCollectionConfig(id="collection")
+    )()
+    actual = CollectionGenerator(
+        StacCollectionConfig(id="collection"), [ItemOnlyGenerator(config) for config in configs]
+    )()
+    assert actual.to_dict() == expected.to_dict()
+
+
+def test_generator_given_no_generate_record_expects_raises() -> None:
+    with pytest.raises(TypeError, match="IncompleteGenerator"):
+        IncompleteGenerator(read_source_config(POINT_CONFIG)[0])  # type: ignore[abstract]
+
+
+def test_payload_expects_item_and_extent_scalars(point_record: ItemRecord) -> None:
+    payload = ItemPayload.from_record(point_record)
+    item = payload.to_item()
+    assert payload.id == point_record.id
+    assert payload.to_dict() == point_record.to_dict()
+    assert payload.datetime == item.datetime
+    assert payload.bounds == shape(item.geometry).bounds
+    assert pickle.loads(pickle.dumps(payload)) == payload
+
+
+def test_payload_given_nan_expects_kept(point_record: ItemRecord) -> None:
+    record = ItemRecord.from_item(point_record.to_item())
+    record.assets["data"]["raster:bands"] = [{"nodata": float("nan")}]
+    nodata = ItemPayload.from_record(record).to_dict()["assets"]["data"]["raster:bands"][0]
+    assert math.isnan(nodata["nodata"])
+
+
+def test_payload_extent_expects_same_as_item_extent() -> None:
+    configs = [*read_source_config(POINT_CONFIG), *read_source_config(RASTER_CONFIG)[:2]]
+    payloads = run_generator_group(StacGeneratorFactory.get_item_generators(configs))
+    items = [payload.to_item() for payload in payloads]
+    extent = CollectionGenerator.payload_extent(payloads)
+    assert extent.spatial.to_dict() == CollectionGenerator.spatial_extent(items).to_dict()
+    assert extent.temporal.to_dict() == CollectionGenerator.temporal_extent(items).to_dict()
+
+
+@pytest.fixture(scope="module")
+def point_payloads() -> list[ItemPayload]:
+    return run_generator_group(
+        StacGeneratorFactory.get_item_generators(read_source_config(POINT_CONFIG))
+    )
+
+
+@pytest.mark.parametrize("open_end", ["start", "end", "both"])
+def test_widen_extent_given_open_interval_expects_kept_open(
+    open_end: str, point_payloads: list[ItemPayload]
+) -> None:
+    items_extent = CollectionGenerator.payload_extent(point_payloads)
+    start, end = items_extent.temporal.intervals[0]
+    interval = [
+        None if open_end in ("start", "both") else start - dt.timedelta(days=1),
+        None if open_end in ("end", "both") else end + dt.timedelta(days=1),
+    ]
+    extent = pystac.Extent(items_extent.spatial, pystac.TemporalExtent([interval]))
+    widened = CollectionGenerator.widen_extent(extent, point_payloads)
+    assert widened.temporal.intervals[0] == interval
+
+
+def test_widen_extent_given_3d_bbox_expects_merged_on_xy(
+    point_payloads: list[ItemPayload],
+) -> None:
+    items_extent = CollectionGenerator.payload_extent(point_payloads)
+    minx, miny, maxx, maxy = items_extent.spatial.bboxes[0]
+    existing = [minx - 1, miny - 1, -5.0, maxx - 1, maxy - 1, 5.0]
+    extent = pystac.Extent(pystac.SpatialExtent([existing]), items_extent.temporal)
+    widened = CollectionGenerator.widen_extent(extent, point_payloads)
+    assert widened.spatial.bboxes[0] == [minx - 1, miny - 1, -5.0, maxx, maxy, 5.0]
+
+
+def test_generator_given_process_pool_expects_same_collection() -> None:
+    configs = read_source_config(POINT_CONFIG)
+    expected = StacGeneratorFactory.get_collection_generator(
+        configs, StacCollectionConfig(id="collection")
+    )()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        actual = StacGeneratorFactory.get_collection_generator(
+            configs, StacCollectionConfig(id="collection"), pool=pool
+        )()
+    assert actual.to_dict() == expected.to_dict()
+    assert [item.to_dict() for item in actual.get_items()] == [
+        item.to_dict() for item in expected.get_items()
+    ]
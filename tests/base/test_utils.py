@@ -3,23 +3,33 @@ import json
 
 import geopandas as gpd
 import httpx
+import numpy as np
 import pandas as pd
+import pyproj
 import pystac
 import pytest
 import pytest_httpx
+import rasterio
 import shapely
 from shapely import Geometry, LineString, MultiLineString, MultiPoint, MultiPolygon, Point, Polygon
 
 from stac_generator.core.base.generator import BaseVectorGenerator, CollectionGenerator
+from stac_generator.core.base.schema import FootprintConfig
 from stac_generator.core.base.utils import (
     _read_csv,
     force_write_to_stac_api,
+    gdal_remote_options,
+    get_crs_info,
     href_is_stac_api_endpoint,
     localise_timezone,
     parse_href,
     read_source_config,
     read_vector_asset,
+    reproject_bounds,
+    simplify_to_budget,
+    vsi_path,
 )
+from stac_generator.core.point.schema import PointConfig
 from stac_generator.exceptions import SourceAssetException, StacConfigException, TimezoneException
 
 VALID_CSV_CONFIG_FILE = "tests/files/unit_tests/configs/csv_config.csv"
@@ -376,6 +386,79 @@ def test_geometry(df: gpd.GeoDataFrame, geom: Geometry) -> None:
     assert actual == geom
 
 
+def test_reproject_bounds_given_projected_crs_expects_enclosing_bbox() -> None:
+    # 12 points along the top edge of an MGA zone 54 extent - bbox fallback
+    df = gpd.GeoDataFrame(
+        crs="EPSG:28354",
+        data={
+            "geometry": [Point(200_000 + 20_000 * i, 6_200_000) for i in range(12)]
+            + [Point(420_000, 6_000_000)]
+        },
+    )
+    minx, miny, maxx, maxy = reproject_bounds(df.total_bounds, df.crs)
+    exp_minx, exp_miny, exp_maxx, exp_maxy = df.to_crs(4326).total_bounds
+    assert minx <= exp_minx and miny <= exp_miny
+    assert maxx >= exp_maxx and maxy >= exp_maxy
+
+
+def test_df_to_item_given_projected_crs_expects_frame_not_reprojected() -> None:
+    df = gpd.GeoDataFrame(
+        crs="EPSG:28354",
+        data={"geometry": [Point(280_000 + 1_000 * i, 6_130_000) for i in range(12)]},
+    )
+    config = PointConfig(
+        id="item",
+        location="data.csv",
+        X="x",
+        Y="y",
+        epsg=28354,
+        collection_date=datetime.date(2020, 1, 1),
+        collection_time=datetime.time(0, 0),
+        timezone="utc",
+    )
+    item = BaseVectorGenerator.df_to_item(df, {}, config, {}, epsg=28354)
+    assert df.crs.to_epsg() == 28354
+    assert shapely.geometry.shape(item.geometry) == shapely.box(*item.bbox)
+    np.testing.assert_array_almost_equal(item.bbox, df.to_crs(4326).total_bounds, decimal=6)
+
+
+SOIL_SUBGROUP = "tests/files/integration_tests/vector/data/soil_subgroup.zip"
+
+
+@pytest.mark.parametrize("method", ["convex_hull", "concave_hull", "simplify", "coverage"], ids=str)
+@pytest.mark.parametrize("max_vertices", [50, 500])
+def test_footprint_given_method_expects_within_vertex_budget(
+    method: str, max_vertices: int
+) -> None:
+    df = read_vector_asset(SOIL_SUBGROUP)
+    config = FootprintConfig(method=method, max_vertices=max_vertices, grid_size=1e-7)
+    footprint = BaseVectorGenerator.footprint(df, config)
+    assert footprint is not None
+    assert shapely.get_num_coordinates(footprint) <= max_vertices
+    if method == "convex_hull":
+        assert footprint.buffer(1e-9).contains(df.union_all())
+
+
+def test_footprint_given_bbox_method_expects_none() -> None:
+    df = read_vector_asset(SOIL_SUBGROUP)
+    assert BaseVectorGenerator.footprint(df, FootprintConfig(method="bbox")) is None
+
+
+@pytest.mark.parametrize("df, geom", GEOMETRY_TEST_SET.values(), ids=GEOMETRY_TEST_SET.keys())
+def test_footprint_given_default_method_expects_geometry(
+    df: gpd.GeoDataFrame, geom: Geometry
+) -> None:
+    footprint = BaseVectorGenerator.footprint(df)
+    assert footprint == geom or (footprint is None and geom == shapely.box(*df.total_bounds))
+
+
+def test_simplify_to_budget_given_many_points_expects_simplified_hull() -> None:
+    circle = shapely.MultiPoint(shapely.Point(0, 0).buffer(1, quad_segs=256).exterior.coords)
+    simplified = simplify_to_budget(circle, 20)
+    assert shapely.get_num_coordinates(simplified) <= 20
+    assert isinstance(simplified, Polygon)
+
+
 def test_read_non_existent_vector_expects_throw() -> None:
     with pytest.raises(SourceAssetException):
         read_vector_asset("non_existent.geojson")
@@ -470,3 +553,63 @@ def test_localise_timezone_valid(
 def test_localise_timezone_invalid() -> None:
     with pytest.raises(TimezoneException):
         localise_timezone(pd.Timestamp("2020-01-01"), "Invalid")
+
+
+@pytest.mark.parametrize(
+    "location, params, expected",
+    [
+        ("tests/files/data.tif", None, "tests/files/data.tif"),
+        ("https://host.org/data.tif", None, "/vsicurl/https://host.org/data.tif"),
+        ("http://host.org/soil.zip", None, "/vsizip//vsicurl/http://host.org/soil.zip"),
+        (
+            "https://host.org/data.tif",
+            {"token": "abc"},
+            "/vsicurl/https://host.org/data.tif?token=abc",
+        ),
+    ],
+)
+def test_vsi_path(location: str, params: dict[str, str] | None, expected: str) -> None:
+    assert vsi_path(location, params) == expected
+
+
+def test_gdal_remote_options_given_local_path_expects_empty() -> None:
+    assert gdal_remote_options("tests/files/data.tif", headers={"X-Api-Key": "abc"}) == {}
+
+
+def test_gdal_remote_options_given_remote_path_expects_headers_and_cookies() -> None:
+    options = gdal_remote_options(
+        "https://host.org/soil.shp",
+        headers={"X-Api-Key": "abc", "Accept": "*/*"},
+        cookies={"session": "1", "user": "2"},
+    )
+    assert options["GDAL_DISABLE_READDIR_ON_OPEN"] == "EMPTY_DIR"
+    assert options["CPL_VSIL_CURL_ALLOWED_EXTENSIONS"] == ".shp,.shx,.dbf,.prj,.cpg"
+    assert options["GDAL_HTTP_HEADERS"] == "x-api-key: abc\r\naccept: */*"
+    assert options["GDAL_HTTP_COOKIE"] == "session=1; user=2"
+
+
+def test_gdal_remote_options_given_no_extension_expects_all_extensions_allowed() -> None:
+    assert "CPL_VSIL_CURL_ALLOWED_EXTENSIONS" not in gdal_remote_options(
+        "https://host.org/api/raster"
+    )
+
+
+def test_gdal_remote_options_given_zarr_store_expects_all_extensions_allowed() -> None:
+    assert "CPL_VSIL_CURL_ALLOWED_EXTENSIONS" not in gdal_remote_options(
+        "https://host.org/climate.zarr"
+    )
+
+
+def test_get_crs_info_given_same_crs_expects_cached() -> None:
+    first = get_crs_info(pyproj.CRS.from_epsg(28354))
+    second = get_crs_info(pyproj.CRS.from_epsg(28354))
+    assert first is second
+    assert first.epsg == 28354
+    assert get_crs_info(rasterio.crs.CRS.from_epsg(28354)).epsg == 28354
+
+
+def test_get_crs_info_to_wgs84_expects_same_as_geopandas() -> None:
+    crs = pyproj.CRS.from_epsg(28354)
+    geometry = shapely.Polygon([(280000, 6130000), (290000, 6130000), (285000, 6140000)])
+    expected = gpd.GeoSeries([geometry], crs=crs).to_crs(epsg=4326).iloc[0]
+    assert get_crs_info(crs).to_wgs84(geometry).equals_exact(expected, 1e-12)
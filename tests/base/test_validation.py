@@ -0,0 +1,172 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_httpx
+
+from stac_generator.core.base.schema import StacCollectionConfig, ValidationConfig
+from stac_generator.core.base.validation import (
+    SchemaStore,
+    StacValidator,
+    ValidationSampler,
+    get_validator,
+    validate_items,
+)
+from stac_generator.exceptions import StacValidationException
+from stac_generator.factory import StacGeneratorFactory
+
+PROJECTION = "https://stac-extensions.github.io/projection/v2.0.0/schema.json"
+DEFINITIONS = "https://stac-extensions.github.io/projection/v2.0.0/definitions.json"
+POINT_CONFIG = "tests/files/integration_tests/point/config/point_config.json"
+PROJECTION_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "$id": PROJECTION,
+    "type": "object",
+    "properties": {"properties": {"$ref": "definitions.json#/definitions/fields"}},
+}
+
+
+def write_schema(schema_dir: Path, uri: str, schema: dict[str, Any]) -> None:
+    store = SchemaStore(schema_dir)
+    path = store.path(uri)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(schema))
+
+
+def definitions(code_pattern: str) -> dict[str, Any]:
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "definitions": {
+            "fields": {
+                "type": "object",
+                "required": ["proj:code"],
+                "properties": {"proj:code": {"type": "string", "pattern": code_pattern}},
+            }
+        },
+    }
+
+
+def make_item(item_id: str, code: str = "EPSG:4326", **properties: Any) -> dict[str, Any]:
+    return {
+        "type": "Feature",
+        "stac_version": "1.1.0",
+        "stac_extensions": [PROJECTION],
+        "id": item_id,
+        "geometry": {"type": "Point", "coordinates": [138.6, -34.9]},
+        "bbox": [138.6, -34.9, 138.6, -34.9],
+        "properties": {"datetime": "2023-01-01T00:00:00Z", "proj:code": code, **properties},
+        "links": [],
+        "assets": {},
+    }
+
+
+@pytest.fixture
+def schema_dir(tmp_path: Path) -> Path:
+    schema_dir = tmp_path / "schemas"
+    write_schema(schema_dir, PROJECTION, PROJECTION_SCHEMA)
+    write_schema(schema_dir, DEFINITIONS, definitions("^EPSG:"))
+    return schema_dir
+
+
+@pytest.fixture
+def validator(schema_dir: Path) -> StacValidator:
+    return StacValidator(SchemaStore(schema_dir, offline=True))
+
+
+def test_given_cached_extension_schema_expects_validated_offline(validator: StacValidator) -> None:
+    validator.validate(make_item("valid"))
+    with pytest.raises(StacValidationException, match="projection"):
+        validator.validate(make_item("invalid", code="IAU:30100"))
+
+
+def test_given_invalid_core_fields_expects_raises_offline(validator: StacValidator) -> None:
+    item = make_item("no_datetime")
+    item["properties"].pop("datetime")
+    with pytest.raises(StacValidationException, match=r"item\.json"):
+        validator.validate(item)
+
+
+def test_given_missing_schema_expects_warns_or_raises_if_strict(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    store = SchemaStore(tmp_path / "empty", offline=True)
+    with caplog.at_level(logging.WARNING):
+        StacValidator(store).validate(make_item("item"))
+        StacValidator(store).validate(make_item("item", code="IAU:30100"))
+    assert PROJECTION in caplog.text
+    with pytest.raises(StacValidationException, match="unavailable"):
+        StacValidator(store, strict=True).validate(make_item("item"))
+
+
+def test_given_missing_schema_expects_downloaded_to_schema_dir(
+    tmp_path: Path, httpx_mock: pytest_httpx.HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=PROJECTION, json=PROJECTION_SCHEMA)
+    httpx_mock.add_response(url=DEFINITIONS, json=definitions("^EPSG:"))
+    store = SchemaStore(tmp_path / "schemas")
+    validator = StacValidator(store)
+    validator.validate(make_item("first"))
+    validator.validate(make_item("second"))
+    with pytest.raises(StacValidationException):
+        validator.validate(make_item("invalid", code="IAU:30100"))
+    # Downloaded once and cached for offline runs
+    assert len(httpx_mock.get_requests()) == 2
+    offline = StacValidator(SchemaStore(tmp_path / "schemas", offline=True), strict=True)
+    offline.validate(make_item("offline"))
+
+
+def test_get_validator_expects_shared_per_config(
+    schema_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = ValidationConfig(schema_dir=schema_dir.as_posix(), offline=True)
+    assert get_validator(config) is get_validator(config.model_copy())
+    monkeypatch.setenv("STAC_GENERATOR_SCHEMA_DIR", schema_dir.as_posix())
+    monkeypatch.setenv("STAC_GENERATOR_OFFLINE", "1")
+    assert get_validator(ValidationConfig()) is get_validator(config)
+
+
+def test_sampler_expects_sampled_and_structurally_unique_items() -> None:
+    items = [make_item(f"item_{idx}") for idx in range(200)]
+    items.append(make_item("extra_property", rain=1.0))
+    sampler = ValidationSampler(0.0)
+    selected = [item["id"] for item in items if sampler.select(item)]
+    assert selected == ["item_0", "extra_property"]
+    sampler = ValidationSampler(0.25)
+    selected = [item["id"] for item in items if sampler.select(item)]
+    assert 25 < len(selected) < 75
+    # Deterministic across workers and runs
+    sampler = ValidationSampler(0.25)
+    assert selected == [item["id"] for item in items if sampler.select(item)]
+
+
+def test_validate_items_given_run_expects_structures_shared_between_tasks(schema_dir: Path) -> None:
+    config = ValidationConfig(schema_dir=schema_dir.as_posix(), offline=True, sample=0)
+    assert validate_items([make_item("a"), make_item("b")], config, "run") == 1
+    assert validate_items([make_item("c")], config, "run") == 0
+    assert validate_items([make_item("c")], config, "next_run") == 1
+
+
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_collection_generator_expects_items_validated_by_workers(
+    schema_dir: Path, num_workers: int
+) -> None:
+    collection_config = StacCollectionConfig(id="collection")
+    pool = ThreadPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+    valid = ValidationConfig(schema_dir=schema_dir.as_posix(), offline=True, strict=True)
+    generator = StacGeneratorFactory.get_collection_generator(
+        POINT_CONFIG, collection_config, pool, valid
+    )
+    assert len(list(generator().get_items())) > 0
+
+    write_schema(schema_dir, DEFINITIONS, definitions("^IAU:"))
+    invalid = ValidationConfig(schema_dir=schema_dir.as_posix(), offline=True, sample=0.5)
+    generator = StacGeneratorFactory.get_collection_generator(
+        POINT_CONFIG, collection_config, pool, invalid
+    )
+    with pytest.raises(StacValidationException, match="projection"):
+        generator()
+    if pool is not None:
+        pool.shutdown()
@@ -0,0 +1,426 @@
+import datetime as dt
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pystac
+import pytest
+import shapely
+from pystac.utils import datetime_to_str
+from shapely.geometry import shape
+
+from stac_generator.core.base.generator import StacSerialiser
+from stac_generator.core.base.schema import COMPRESSION, StacCollectionConfig, WriterConfig
+from stac_generator.core.base.writer import (
+    INDEX_FILE,
+    CatalogWriter,
+    geoparquet_record,
+    geoparquet_schema,
+)
+from stac_generator.exceptions import StacConfigException
+from stac_generator.factory import StacGeneratorFactory
+
+POINT_CONFIG = "tests/files/integration_tests/point/config/point_config.json"
+COMPOSITE_CONFIG = "tests/files/integration_tests/composite/config/composite_config.json"
+
+
+def make_collection(href: Path) -> pystac.Collection:
+    generator = StacGeneratorFactory.get_collection_generator(
+        POINT_CONFIG, StacCollectionConfig(id="collection")
+    )
+    collection = generator()
+    collection.normalize_hrefs(href.as_posix())
+    return collection
+
+
+def item_dicts(collection: pystac.Collection) -> list[dict]:
+    return [
+        item.to_dict(include_self_link=False, transform_hrefs=False)
+        for item in collection.get_items()
+    ]
+
+
+def read_tree(root: Path) -> dict[str, str]:
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.mark.parametrize(
+    "config",
+    [WriterConfig(), WriterConfig(max_workers=4, batch_size=2), WriterConfig(fsync=False)],
+)
+@pytest.mark.parametrize(
+    "catalog_type", [pystac.CatalogType.ABSOLUTE_PUBLISHED, pystac.CatalogType.SELF_CONTAINED]
+)
+def test_write_expects_same_files_as_pystac(
+    config: WriterConfig, catalog_type: pystac.CatalogType, tmp_path: Path
+) -> None:
+    expected = make_collection(tmp_path / "expected")
+    expected.catalog_type = catalog_type
+    expected.save()
+    actual = make_collection(tmp_path / "actual")
+    actual.catalog_type = catalog_type
+    CatalogWriter(config).write(actual)
+
+    expected_tree = read_tree(tmp_path / "expected")
+    actual_tree = read_tree(tmp_path / "actual")
+    assert expected_tree.keys() == actual_tree.keys()
+    assert len(actual_tree) == len(list(actual.get_items())) + 1
+    for name, content in expected_tree.items():
+        assert actual_tree[name] == content.replace("/expected/", "/actual/")
+
+
+@pytest.mark.parametrize(
+    "catalog_type", [pystac.CatalogType.ABSOLUTE_PUBLISHED, pystac.CatalogType.SELF_CONTAINED]
+)
+def test_serialise_expects_same_files_as_pystac(
+    catalog_type: pystac.CatalogType, tmp_path: Path
+) -> None:
+    expected = make_collection(tmp_path / "expected")
+    expected.catalog_type = catalog_type
+    expected.save()
+    generator = StacGeneratorFactory.get_collection_generator(
+        POINT_CONFIG, StacCollectionConfig(id="collection")
+    )
+    serialiser = StacSerialiser(generator, (tmp_path / "actual").as_posix())
+    serialiser.collection.catalog_type = catalog_type
+    serialiser()
+
+    actual_tree = read_tree(tmp_path / "actual")
+    assert actual_tree.pop(INDEX_FILE)
+    assert actual_tree == {
+        name: content.replace("/expected/", "/actual/")
+        for name, content in read_tree(tmp_path / "expected").items()
+    }
+
+
+def test_write_given_existing_files_expects_replaced(tmp_path: Path) -> None:
+    collection = make_collection(tmp_path)
+    item = next(iter(collection.get_items()))
+    path = Path(item.get_self_href() or "")
+    path.parent.mkdir(parents=True)
+    path.write_text("stale")
+    CatalogWriter().write(collection)
+    assert pystac.Item.from_file(path.as_posix()).id == item.id
+
+
+def test_write_given_failure_expects_no_partial_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    collection = make_collection(tmp_path)
+    writer = CatalogWriter(WriterConfig(batch_size=1000))
+    calls = {"count": 0}
+    json_dumps = writer.stac_io.json_dumps
+
+    def failing_dumps(document: dict, *args: object, **kwargs: object) -> str:
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise OSError("Disk full")
+        return json_dumps(document)
+
+    monkeypatch.setattr(writer.stac_io, "json_dumps", failing_dumps)
+    with pytest.raises(OSError, match="Disk full"):
+        writer.write(collection)
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+def test_write_given_item_dicts_expects_bounded_batches_built_by_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    collection = make_collection(tmp_path)
+    items = item_dicts(collection)
+    assert len(items) > 3
+    writer = CatalogWriter(WriterConfig(max_workers=1, batch_size=1))
+    consumed: list[int] = []
+    consumed_at_write: list[int] = []
+    builders: set[threading.Thread] = set()
+    item_document, write_batch = writer.item_document, writer.write_batch
+
+    def generate() -> Iterator[dict]:
+        for item in items:
+            consumed.append(1)
+            yield item
+
+    def recorded_item_document(*args: Any) -> tuple[Path, dict]:
+        builders.add(threading.current_thread())
+        return item_document(*args)
+
+    def recorded_write_batch(documents: Any) -> None:
+        consumed_at_write.append(len(consumed))
+        write_batch(documents)
+
+    monkeypatch.setattr(writer, "item_document", recorded_item_document)
+    monkeypatch.setattr(writer, "write_batch", recorded_write_batch)
+    writer.write(collection, generate())
+    # The one worker writes a batch while at most the next batch is pulled from the items
+    assert all(count <= idx + 2 for idx, count in enumerate(consumed_at_write[: len(items)]))
+    assert threading.main_thread() not in builders
+    assert sorted(path.name for path in tmp_path.rglob("*.json")) == sorted(
+        ["collection.json", *(f"{item['id']}.json" for item in items)]
+    )
+
+
+def test_write_given_unnormalised_collection_expects_raises() -> None:
+    generator = StacGeneratorFactory.get_collection_generator(
+        POINT_CONFIG, StacCollectionConfig(id="collection")
+    )
+    with pytest.raises(ValueError, match="Normalise hrefs"):
+        CatalogWriter().write(generator())
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_write_ndjson_expects_one_item_per_line_without_links(
+    compression: COMPRESSION | None, tmp_path: Path
+) -> None:
+    collection = make_collection(tmp_path)
+    path = CatalogWriter(WriterConfig(format="ndjson", compression=compression)).write_ndjson(
+        collection, item_dicts(collection), tmp_path
+    )
+    assert path.name == ("items.ndjson.gz" if compression else "items.ndjson")
+    content = gzip.decompress(path.read_bytes()) if compression else path.read_bytes()
+    lines = content.decode().splitlines()
+    expected = {item.id: item for item in collection.get_items()}
+    assert len(lines) == len(expected)
+    for line in lines:
+        document = json.loads(line)
+        item = expected[document["id"]]
+        assert document["collection"] == "collection"
+        assert document["links"] == []
+        assert document["properties"] == item.to_dict()["properties"]
+        assert document["geometry"] == item.to_dict()["geometry"]
+    with (tmp_path / "collection.json").open() as file:
+        collection_dict = json.load(file)
+    assert collection_dict["id"] == "collection"
+    assert collection_dict["links"] == []
+    assert sorted(child.name for child in tmp_path.iterdir()) == ["collection.json", path.name]
+
+
+def test_write_ndjson_given_zstd_expects_compressed(tmp_path: Path) -> None:
+    collection = make_collection(tmp_path)
+    writer = CatalogWriter(WriterConfig(format="ndjson", compression="zstd"))
+    try:
+        import zstandard
+    except ImportError:
+        with pytest.raises(StacConfigException, match="zstandard"):
+            writer.write_ndjson(collection, item_dicts(collection), tmp_path)
+        assert not list(tmp_path.iterdir())
+        return
+    path = writer.write_ndjson(collection, item_dicts(collection), tmp_path)
+    assert path.name == "items.ndjson.zst"
+    with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as stream:
+        lines = stream.read().decode().splitlines()
+    assert len(lines) == len(list(collection.get_items()))
+
+
+def test_geoparquet_record_expects_flattened_item(tmp_path: Path) -> None:
+    item = next(iter(make_collection(tmp_path).get_items()))
+    record = geoparquet_record(item.to_dict(include_self_link=False, transform_hrefs=False))
+    assert "properties" not in record
+    assert record["id"] == item.id
+    assert record["datetime"] == item.datetime
+    assert record["datetime"].utcoffset() == dt.timedelta(0)
+    assert record["stac_generator"] == item.properties["stac_generator"]
+    assert shapely.from_wkb(record["geometry"]).equals(shape(item.geometry))
+    assert list(record["bbox"].values()) == item.bbox
+    assert list(record["bbox"]) == ["xmin", "ymin", "xmax", "ymax"]
+
+
+def test_write_geoparquet_expects_stac_geoparquet(tmp_path: Path) -> None:
+    collection = make_collection(tmp_path)
+    writer = CatalogWriter(WriterConfig(format="geoparquet", row_group_size=4))
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        with pytest.raises(StacConfigException, match="pyarrow"):
+            writer.write_geoparquet(collection, item_dicts(collection), tmp_path)
+        return
+    path = writer.write_geoparquet(collection, item_dicts(collection), tmp_path)
+    items = {item.id: item for item in collection.get_items()}
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == len(items)
+    assert parquet.metadata.num_row_groups == -(-len(items) // 4)
+    metadata = parquet.schema_arrow.metadata
+    geo = json.loads(metadata[b"geo"])
+    assert geo["columns"]["geometry"]["encoding"] == "WKB"
+    assert geo["columns"]["geometry"]["geometry_types"] == sorted(
+        {item.geometry["type"] for item in items.values()}
+    )
+    assert "collection" in json.loads(metadata[b"stac-geoparquet"])["collections"]
+    table = parquet.read()
+    assert table.schema.field("datetime").type == pa.timestamp("us", tz="UTC")
+    assert table.schema.field("geometry").type == pa.binary()
+    assert pa.types.is_struct(table.schema.field("bbox").type)
+    assert pa.types.is_struct(table.schema.field("stac_generator").type)
+    for row in table.to_pylist():
+        item = items[row["id"]]
+        assert row["datetime"] == item.datetime
+        assert shapely.from_wkb(row["geometry"]).equals(shape(item.geometry))
+        assert row["proj:code"] == item.properties["proj:code"]
+    assert (tmp_path / "collection.json").exists()
+
+
+@pytest.mark.parametrize("row_group_size", [1, 2, 100])
+def test_write_geoparquet_given_items_with_different_fields_expects_unified_schema(
+    row_group_size: int, tmp_path: Path
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    collection = StacGeneratorFactory.get_collection_generator(
+        COMPOSITE_CONFIG, StacCollectionConfig(id="collection")
+    )()
+    items = item_dicts(collection)
+    rows = [geoparquet_record({**item, "links": []}) for item in items]
+    fields = {key for row in rows for key in row}
+    # Items have different properties, e.g. only raster items have a grid
+    assert any("proj:shape" not in row for row in rows)
+    writer = CatalogWriter(WriterConfig(format="geoparquet", row_group_size=row_group_size))
+    path = writer.write_geoparquet(collection, iter(items), tmp_path)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == -(-len(items) // row_group_size)
+    table = parquet.read()
+    assert fields <= set(table.schema.names)
+    for row, actual in zip(rows, table.to_pylist(), strict=True):
+        assert actual["id"] == row["id"]
+        assert actual["proj:shape"] == row.get("proj:shape")
+        assert actual["proj:transform"] == row.get("proj:transform")
+
+
+def test_write_geoparquet_given_schema_expects_schema_used(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    collection = make_collection(tmp_path)
+    items = item_dicts(collection)
+    items[-1]["properties"]["title"] = "Last item"
+    rows = [geoparquet_record(item) for item in items]
+    schema = geoparquet_schema(rows)
+    writer = CatalogWriter(WriterConfig(format="geoparquet", row_group_size=4))
+    path = writer.write_geoparquet(collection, iter(items), tmp_path, schema=schema)
+    table = pq.read_table(path)
+    assert table.schema.field("title").type == pa.string()
+    assert table.column("title").to_pylist() == [None] * (len(items) - 1) + ["Last item"]
+    # Fields missing from a given schema are not dropped silently
+    with pytest.raises(StacConfigException, match="title"):
+        writer.write_geoparquet(
+            collection, items, tmp_path, schema=schema.remove(schema.get_field_index("title"))
+        )
+
+
+def point_configs() -> list[dict]:
+    with Path(POINT_CONFIG).open() as file:
+        return json.load(file)
+
+
+def serialise(configs: list[dict], dst: Path, mode: str = "overwrite") -> StacSerialiser:
+    generator = StacGeneratorFactory.get_collection_generator(
+        configs, StacCollectionConfig(id="collection")
+    )
+    serialiser = StacSerialiser(generator, dst.as_posix(), writer=WriterConfig(mode=mode))
+    serialiser()
+    return serialiser
+
+
+def modified_times(root: Path) -> dict[str, int]:
+    return {path.name: path.stat().st_mtime_ns for path in root.rglob("*.json")}
+
+
+@pytest.mark.parametrize("mode", ["append", "update"])
+def test_serialise_given_new_configs_expects_only_new_items_generated(
+    mode: str, tmp_path: Path
+) -> None:
+    configs = point_configs()
+    serialise(configs, tmp_path / "expected")
+    serialise(configs[:6], tmp_path / "actual")
+    before = modified_times(tmp_path / "actual")
+    serialiser = serialise(configs, tmp_path / "actual", mode)
+
+    assert sorted(payload.id for payload in serialiser.payloads) == sorted(
+        config["id"] for config in configs[6:]
+    )
+    # Existing items are neither read nor rewritten
+    after = modified_times(tmp_path / "actual")
+    assert all(
+        after[name] == modified
+        for name, modified in before.items()
+        if name != "collection.json" and name != INDEX_FILE
+    )
+    assert read_tree(tmp_path / "expected") == {
+        name: content.replace("/actual/", "/expected/")
+        for name, content in read_tree(tmp_path / "actual").items()
+    }
+
+
+def test_serialise_given_changed_config_expects_updated_in_place(tmp_path: Path) -> None:
+    configs = point_configs()
+    serialise(configs, tmp_path)
+    before = modified_times(tmp_path)
+    changed = [*configs[:3], {**configs[3], "title": "Changed title"}, *configs[4:]]
+
+    serialise(changed, tmp_path, "append")
+    item_path = tmp_path / configs[3]["id"] / f"{configs[3]['id']}.json"
+    assert "title" not in json.loads(item_path.read_text())["properties"]
+
+    serialise(changed, tmp_path, "update")
+    after = modified_times(tmp_path)
+    updated = {name for name, modified in before.items() if after[name] != modified}
+    assert updated == {f"{configs[3]['id']}.json", "collection.json", INDEX_FILE}
+    assert json.loads(item_path.read_text())["properties"]["title"] == "Changed title"
+    collection = pystac.Collection.from_file((tmp_path / "collection.json").as_posix())
+    assert [Path(link.href).stem for link in collection.get_item_links()] == [
+        config["id"] for config in configs
+    ]
+
+
+@pytest.mark.parametrize("mode", ["append", "update"])
+def test_serialise_given_open_interval_and_3d_bbox_expects_kept(mode: str, tmp_path: Path) -> None:
+    configs = point_configs()
+    serialise(configs[:6], tmp_path)
+    path = tmp_path / "collection.json"
+    document = json.loads(path.read_text())
+    minx, miny, maxx, maxy = document["extent"]["spatial"]["bbox"][0]
+    document["extent"]["spatial"]["bbox"] = [[minx, miny, -10.0, maxx, maxy, 10.0]]
+    document["extent"]["temporal"]["interval"] = [[None, "2000-01-01T00:00:00Z"]]
+    path.write_text(json.dumps(document))
+
+    serialise(configs, tmp_path, mode)
+    expected = serialise(configs, tmp_path / "expected").collection.extent
+    extent = json.loads(path.read_text())["extent"]
+    exp_minx, exp_miny, exp_maxx, exp_maxy = expected.spatial.bboxes[0]
+    assert extent["spatial"]["bbox"] == [[exp_minx, exp_miny, -10.0, exp_maxx, exp_maxy, 10.0]]
+    assert extent["temporal"]["interval"] == [
+        [None, datetime_to_str(expected.temporal.intervals[0][1])]
+    ]
+
+
+def test_serialise_given_collection_without_index_expects_indexed_from_links(
+    tmp_path: Path,
+) -> None:
+    configs = point_configs()
+    serialise(configs[:6], tmp_path)
+    (tmp_path / INDEX_FILE).unlink()
+    serialiser = serialise(configs, tmp_path, "append")
+    assert len(serialiser.payloads) == 4
+    index = json.loads((tmp_path / INDEX_FILE).read_text())["items"]
+    assert sorted(index) == sorted(config["id"] for config in configs)
+    assert [index[config["id"]] for config in configs[:6]] == [None] * 6
+    # Items of unknown configs are regenerated once by an update
+    serialiser = serialise(configs, tmp_path, "update")
+    assert len(serialiser.payloads) == 6
+    serialiser = serialise(configs, tmp_path, "update")
+    assert not serialiser.payloads
+
+
+def test_serialise_given_append_to_ndjson_expects_raises(tmp_path: Path) -> None:
+    serialise(point_configs()[:2], tmp_path)
+    generator = StacGeneratorFactory.get_collection_generator(
+        point_configs(), StacCollectionConfig(id="collection")
+    )
+    with pytest.raises(StacConfigException, match="local json destination"):
+        StacSerialiser(
+            generator, tmp_path.as_posix(), writer=WriterConfig(format="ndjson", mode="append")
+        )
@@ -1,3 +1,4 @@
+import gzip
 import json
 from pathlib import Path
 
@@ -67,3 +68,22 @@ def test_given_invalid_num_workers_expect_raises(num_workers: int) -> None:
             license=None,
             num_workers=num_workers,
         )
+
+
+def test_serialise_given_ndjson_format_expects_single_items_file(tmp_path: Path) -> None:
+    dst = tmp_path / "generated"
+    serialise_handler(
+        id="my_collection",
+        src="tests/files/integration_tests/composite/config/composite_config.json",
+        dst=dst.as_posix(),
+        format="ndjson",
+        compression="gzip",
+    )
+    assert sorted(path.name for path in dst.iterdir()) == ["collection.json", "items.ndjson.gz"]
+    with gzip.open(dst / "items.ndjson.gz", "rt") as file:
+        items = [json.loads(line) for line in file]
+    with Path(
+        "tests/files/integration_tests/composite/config/composite_config.json"
+    ).open() as file:
+        assert len(items) == len(json.load(file))
+    assert {item["collection"] for item in items} == {"my_collection"}
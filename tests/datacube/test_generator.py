@@ -0,0 +1,179 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pystac
+import pytest
+import rasterio
+import rasterio.shutil
+from rasterio.transform import from_origin
+
+from stac_generator.core.datacube.generator import DatacubeGenerator
+from stac_generator.core.datacube.utils import DimensionInfo, decode_cf_time
+from stac_generator.exceptions import StacConfigException
+from stac_generator.factory import StacGeneratorFactory
+
+BASE_CONFIG: dict[str, Any] = {
+    "id": "climate",
+    "collection_date": "2020-01-01",
+    "collection_time": "00:00:00",
+    "timezone": "utc",
+}
+
+
+def write_zarr_array(
+    root: Path, name: str, data: np.ndarray, dims: list[str], **attrs: Any
+) -> None:
+    """Write an uncompressed single chunk Zarr v2 array with xarray's dimension names"""
+    array = root / name
+    array.mkdir()
+    metadata = {
+        "zarr_format": 2,
+        "shape": list(data.shape),
+        "chunks": list(data.shape),
+        "dtype": data.dtype.str,
+        "compressor": None,
+        "fill_value": attrs.pop("fill_value", None),
+        "order": "C",
+        "filters": None,
+    }
+    (array / ".zarray").write_text(json.dumps(metadata))
+    (array / ".zattrs").write_text(json.dumps({"_ARRAY_DIMENSIONS": dims, **attrs}))
+    (array / ".".join(["0"] * data.ndim)).write_bytes(data.tobytes())
+
+
+@pytest.fixture
+def zarr_store(tmp_path: Path) -> Path:
+    """Monthly rainfall and temperature on a 0.1 degree grid"""
+    root = tmp_path / "climate.zarr"
+    root.mkdir()
+    (root / ".zgroup").write_text(json.dumps({"zarr_format": 2}))
+    write_zarr_array(
+        root, "time", np.array([0, 31, 60], dtype="<i8"), ["time"], units="days since 2020-01-01"
+    )
+    write_zarr_array(root, "lat", np.linspace(-30.05, -30.95, 10), ["lat"], units="degrees_north")
+    write_zarr_array(root, "lon", np.linspace(140.05, 141.95, 20), ["lon"], units="degrees_east")
+    data = np.random.default_rng(0).random((3, 10, 20)).astype("<f4")
+    write_zarr_array(
+        root,
+        "rain",
+        data,
+        ["time", "lat", "lon"],
+        units="mm",
+        long_name="Rainfall",
+        fill_value=-9999.0,
+    )
+    write_zarr_array(root, "tmax", data, ["time", "lat", "lon"], units="degC")
+    return root
+
+
+@pytest.fixture
+def netcdf_file(tmp_path: Path) -> Path:
+    """Hourly rainfall written by GDAL's netCDF driver"""
+    path = tmp_path / "rain.nc"
+    profile = {
+        "driver": "GTiff",
+        "width": 20,
+        "height": 10,
+        "count": 4,
+        "dtype": "float32",
+        "crs": "EPSG:4326",
+        "transform": from_origin(140, -30, 0.1, 0.1),
+        "nodata": -9999,
+    }
+    with rasterio.MemoryFile() as memfile:
+        with memfile.open(**profile) as dst:
+            dst.write(np.ones((4, 10, 20), dtype="float32"))
+            dst.update_tags(
+                NETCDF_DIM_EXTRA="{time}",
+                NETCDF_DIM_time_DEF="{4,6}",
+                NETCDF_DIM_time_VALUES="{6,12,18,24}",
+                **{"time#units": "hours since 2020-01-01 00:00:00"},
+            )
+            for band in range(1, 5):
+                dst.update_tags(band, NETCDF_VARNAME="rain", NETCDF_DIM_time=str(band - 1))
+        with memfile.open() as src:
+            rasterio.shutil.copy(src, path, driver="netCDF")
+    return path
+
+
+def test_zarr_expects_variables_as_bands_and_time_range(zarr_store: Path) -> None:
+    item = DatacubeGenerator({**BASE_CONFIG, "location": zarr_store.as_posix()}).generate()
+    np.testing.assert_array_almost_equal(item.bbox, [140, -31, 142, -30])
+    assert item.properties["start_datetime"] == "2020-01-01T00:00:00Z"
+    assert item.properties["end_datetime"] == "2020-03-01T00:00:00Z"
+    assert item.properties["proj:shape"] == [10, 20]
+    asset = item.assets["data"].to_dict()
+    assert asset["type"] == pystac.MediaType.ZARR
+    assert [band["name"] for band in asset["eo:bands"]] == ["rain", "tmax"]
+    assert asset["raster:bands"][0] == {"nodata": -9999.0, "data_type": "float32", "unit": "mm"}
+    assert item.properties["cube:dimensions"]["time"] == {
+        "type": "temporal",
+        "extent": ["2020-01-01T00:00:00+00:00", "2020-03-01T00:00:00+00:00"],
+    }
+    assert item.properties["cube:variables"]["rain"] == {
+        "dimensions": ["time", "y", "x"],
+        "type": "data",
+        "description": "Rainfall",
+        "unit": "mm",
+    }
+
+
+def test_netcdf_expects_time_range_from_coordinate(netcdf_file: Path) -> None:
+    item = DatacubeGenerator({**BASE_CONFIG, "location": netcdf_file.as_posix()}).generate()
+    np.testing.assert_array_almost_equal(item.bbox, [140, -31, 142, -30])
+    assert item.properties["start_datetime"] == "2020-01-01T06:00:00Z"
+    assert item.properties["end_datetime"] == "2020-01-02T00:00:00Z"
+    assert item.properties["proj:code"] == "EPSG:4326"
+    assert item.assets["data"].media_type == pystac.MediaType.NETCDF
+    assert [band["name"] for band in item.assets["data"].to_dict()["eo:bands"]] == ["rain"]
+
+
+def test_given_variables_expects_selected_bands(zarr_store: Path) -> None:
+    config = {**BASE_CONFIG, "location": zarr_store.as_posix(), "variables": ["tmax"]}
+    item = DatacubeGenerator(config).generate()
+    assert list(item.properties["cube:variables"]) == ["tmax"]
+    assert item.properties["stac_generator"] == {"variables": ["tmax"]}
+
+
+def test_given_missing_variable_expects_raises(zarr_store: Path) -> None:
+    config = {**BASE_CONFIG, "location": zarr_store.as_posix(), "variables": ["lat", "wind"]}
+    with pytest.raises(StacConfigException, match="lat"):
+        DatacubeGenerator(config).generate()
+
+
+def test_factory_given_multidimensional_extensions_expects_datacube_generator(
+    zarr_store: Path, netcdf_file: Path
+) -> None:
+    generators = StacGeneratorFactory.get_item_generators(
+        [
+            {**BASE_CONFIG, "location": zarr_store.as_posix() + "/"},
+            {**BASE_CONFIG, "location": netcdf_file.as_posix()},
+        ]
+    )
+    assert all(isinstance(generator, DatacubeGenerator) for generator in generators)
+
+
+@pytest.mark.parametrize(
+    "dimension, expected",
+    [
+        (
+            DimensionInfo((0, 1.5), "days since 2000-01-01"),
+            ("2000-01-01T00:00:00+00:00", "2000-01-02T12:00:00+00:00"),
+        ),
+        (
+            DimensionInfo((3600,), "seconds since 1970-01-01 00:00:00+10:00"),
+            ("1969-12-31T15:00:00+00:00", "1969-12-31T15:00:00+00:00"),
+        ),
+        (DimensionInfo((0,), "days since 2000-01-01", "360_day"), None),
+        (DimensionInfo((0,), "level"), None),
+    ],
+)
+def test_decode_cf_time(dimension: DimensionInfo, expected: tuple[str, str] | None) -> None:
+    decoded = decode_cf_time(dimension)
+    if expected is None:
+        assert decoded is None
+    else:
+        assert decoded == tuple(pd.Timestamp(value) for value in expected)
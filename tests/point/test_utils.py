@@ -167,7 +167,9 @@ def test_df_to_item(
     )
     assert item.id == source_config.id
     assert item.datetime is not None
-    assert item.assets == {ASSET_KEY: asset}
+    assert {key: value.to_dict() for key, value in item.assets.items()} == {
+        ASSET_KEY: asset.to_dict()
+    }
     assert item.geometry == geometry
     assert "proj:code" in item.properties
     assert "proj:wkt2" in item.properties
@@ -1,16 +1,24 @@
 import datetime
 import json
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pytest
+import rasterio
+import shapely
+from rasterio.enums import Resampling
 
 from stac_generator.core.base.generator import CollectionGenerator
 from stac_generator.core.base.schema import StacCollectionConfig
 from stac_generator.core.base.utils import read_source_config
 from stac_generator.core.raster.generator import RasterGenerator
 from stac_generator.core.raster.schema import BandInfo, RasterConfig
+from stac_generator.core.raster.utils import BandStatistics
 from stac_generator.exceptions import SourceAssetException
-from tests.utils import compare_extent, compare_items
+from tests.utils import compare_extent, compare_items, serve_directory
 
 CONFIG_JSON = Path("tests/files/integration_tests/raster/config/raster_config.json")
 
@@ -127,3 +135,223 @@ def test_given_invalid_path_type_expects_raises() -> None:
             collection_time=ts.time(),
             band_info=[BandInfo(name="Invalid_Band")],
         )
+
+
+@pytest.fixture(scope="module")
+def file_server() -> Iterator[tuple[str, Any]]:
+    with serve_directory("tests/files") as server:
+        yield server
+
+
+@pytest.mark.parametrize("item_idx", range(len(JSON_CONFIGS)), ids=ITEM_IDS)
+def test_generator_given_remote_item_expects_same_as_local(
+    item_idx: int, raster_generators: list[RasterGenerator], file_server: tuple[str, Any]
+) -> None:
+    base_url, requests = file_server
+    config = JSON_CONFIGS[item_idx]
+    remote_config = {
+        **config,
+        "location": config["location"].replace("tests/files", base_url),
+        "headers": {"X-Api-Key": "secret"},
+    }
+    expected = raster_generators[item_idx].generate().to_dict()
+    actual = RasterGenerator(remote_config).generate().to_dict()
+    assert actual["bbox"] == expected["bbox"]
+    assert actual["geometry"] == expected["geometry"]
+    assert actual["properties"]["proj:transform"] == expected["properties"]["proj:transform"]
+    assert actual["assets"]["data"]["href"] == remote_config["location"]
+    served = [request for request in requests if request[1].endswith(Path(config["location"]).name)]
+    assert served
+    assert all(
+        {key.lower(): value for key, value in headers.items()}.get("x-api-key") == "secret"
+        for _, _, headers in served
+    )
+    # No directory listing or sidecar probing
+    assert all(path.endswith(".tif") for _, path, _ in requests)
+
+
+def expected_statistics(location: str) -> list[dict[str, float]]:
+    with rasterio.open(location) as src:
+        data = src.read(masked=True)
+    result = []
+    for band in data:
+        values = band.compressed().astype(np.float64)
+        result.append(
+            {
+                "minimum": values.min(),
+                "maximum": values.max(),
+                "mean": values.mean(),
+                "stddev": values.std(),
+                "valid_percent": 100 * values.size / band.size,
+            }
+        )
+    return result
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_generator_given_exact_statistics_expects_same_as_full_read(max_workers: int) -> None:
+    config = {
+        **JSON_CONFIGS[0],
+        "statistics": {"mode": "exact", "histogram": True, "bins": 16, "max_workers": max_workers},
+    }
+    item = RasterGenerator(config).generate().to_dict()
+    bands = item["assets"]["data"]["raster:bands"]
+    for band, expected in zip(bands, expected_statistics(config["location"]), strict=True):
+        for key, value in expected.items():
+            assert band["statistics"][key] == pytest.approx(value)
+        assert band["histogram"]["count"] == 16
+        assert band["histogram"]["min"] == expected["minimum"]
+        with rasterio.open(config["location"]) as src:
+            total = src.width * src.height
+        assert sum(band["histogram"]["buckets"]) == round(expected["valid_percent"] * total / 100)
+
+
+def test_generator_given_approximate_statistics_expects_close_to_exact() -> None:
+    config = {**JSON_CONFIGS[0], "statistics": {"mode": "approximate", "overview_size": 100}}
+    item = RasterGenerator(config).generate().to_dict()
+    bands = item["assets"]["data"]["raster:bands"]
+    for band, expected in zip(bands, expected_statistics(config["location"]), strict=True):
+        assert band["statistics"]["mean"] == pytest.approx(expected["mean"], rel=0.05)
+        # Overviews are resampled - extremes and spread are only bounded by the exact values
+        assert expected["minimum"] <= band["statistics"]["minimum"]
+        assert band["statistics"]["maximum"] <= expected["maximum"]
+        assert 0 < band["statistics"]["stddev"] <= expected["stddev"]
+        assert "histogram" not in band
+
+
+@pytest.mark.parametrize("mode", ["exact", "approximate"])
+def test_generator_given_embedded_statistics_expects_reused(mode: str, tmp_path: Path) -> None:
+    location = tmp_path / "raster.tif"
+    shutil.copy(JSON_CONFIGS[0]["location"], location)
+    with rasterio.open(location, "r+") as dst:
+        for band in range(1, dst.count + 1):
+            dst.update_tags(
+                band,
+                STATISTICS_MINIMUM=band,
+                STATISTICS_MAXIMUM=100,
+                STATISTICS_MEAN=50,
+                STATISTICS_STDDEV=10,
+            )
+    config = {**JSON_CONFIGS[0], "location": str(location), "statistics": {"mode": mode}}
+    item = RasterGenerator(config).generate().to_dict()
+    for idx, band in enumerate(item["assets"]["data"]["raster:bands"]):
+        assert band["statistics"] == {"minimum": idx + 1, "maximum": 100, "mean": 50, "stddev": 10}
+
+
+def test_band_statistics_merge_expects_same_as_single_pass() -> None:
+    values = np.random.default_rng(0).normal(10, 3, 1000)
+    merged = BandStatistics()
+    for chunk in np.array_split(values, 7):
+        merged = merged.merge(BandStatistics.from_values(chunk, chunk.size))
+    statistics = merged.to_statistics()
+    assert statistics is not None
+    assert statistics.mean == pytest.approx(values.mean())
+    assert statistics.stddev == pytest.approx(values.std())
+    assert statistics.valid_percent == 100
+
+
+@pytest.fixture
+def sparse_raster(tmp_path: Path) -> str:
+    """Raster in which only the lower left triangle holds valid data"""
+    location = tmp_path / "sparse.tif"
+    size = 400
+    data = np.tril(np.full((size, size), 100, dtype=np.uint8))
+    transform = rasterio.transform.from_origin(300000, 6200000, 10, 10)
+    with rasterio.open(
+        location,
+        "w",
+        driver="GTiff",
+        width=size,
+        height=size,
+        count=1,
+        dtype="uint8",
+        crs="EPSG:28354",
+        transform=transform,
+        nodata=0,
+        tiled=True,
+    ) as dst:
+        dst.write(data, 1)
+        dst.build_overviews([2, 4, 8])
+    return location.as_posix()
+
+
+@pytest.mark.parametrize("max_vertices", [5, 50])
+def test_generator_given_valid_data_footprint_expects_valid_region(
+    sparse_raster: str, max_vertices: int
+) -> None:
+    config = {
+        "id": "sparse",
+        "location": sparse_raster,
+        "collection_date": "2021-02-21",
+        "collection_time": "10:00:00",
+        "band_info": [{"name": "band"}],
+    }
+    bbox_item = RasterGenerator(config).generate()
+    footprint_item = RasterGenerator(
+        {
+            **config,
+            "footprint": {
+                "method": "valid_data",
+                "max_vertices": max_vertices,
+                "overview_size": 64,
+            },
+        }
+    ).generate()
+    bbox_geometry = shapely.geometry.shape(bbox_item.geometry)
+    footprint = shapely.geometry.shape(footprint_item.geometry)
+    assert shapely.get_num_coordinates(footprint) <= max_vertices
+    assert footprint.area / bbox_geometry.area == pytest.approx(0.5, abs=0.1)
+    # Lower left corner is valid, upper right corner is nodata
+    minx, miny, maxx, maxy = bbox_geometry.bounds
+    assert footprint.buffer(1e-3).contains(shapely.Point(minx, miny))
+    assert not footprint.contains(shapely.Point(maxx, maxy))
+    # The bbox describes the dataset, widened only if the footprint cannot be clipped to it within budget
+    assert shapely.box(*footprint_item.bbox).covers(footprint)
+    expected = shapely.box(*bbox_item.bbox).union(footprint).bounds
+    assert footprint_item.bbox == pytest.approx(list(expected), abs=1e-5)
+
+
+def test_generator_given_thumbnail_expects_rgb_thumbnail_asset(tmp_path: Path) -> None:
+    location = tmp_path / "thumbnails" / "L2A_PVI.png"
+    config = {**JSON_CONFIGS[0], "thumbnail": {"location": location.as_posix(), "size": 64}}
+    item = RasterGenerator(config).generate()
+    asset = item.assets["thumbnail"]
+    assert asset.href == location.as_posix()
+    assert asset.roles == ["thumbnail"]
+    assert asset.media_type == "image/png"
+    with rasterio.open(location) as thumbnail, rasterio.open(config["location"]) as src:
+        assert thumbnail.count == 4
+        assert max(thumbnail.shape) <= 64
+        image = thumbnail.read()
+        data = src.read(out_shape=(3, *thumbnail.shape), resampling=Resampling.average)
+    # Channels follow the red, green and blue bands and are stretched to the full range
+    for channel, band in zip(image[:3], data, strict=True):
+        assert np.corrcoef(channel.ravel(), band.ravel())[0, 1] > 0.95
+        assert channel.max() == 255
+    assert (image[3][(data == 0).all(axis=0)] == 0).all()
+
+
+def test_generator_given_webp_thumbnail_expects_transparent_nodata(
+    sparse_raster: str, tmp_path: Path
+) -> None:
+    location = tmp_path / "sparse.webp"
+    config = {
+        "id": "sparse",
+        "location": sparse_raster,
+        "collection_date": "2021-02-21",
+        "collection_time": "10:00:00",
+        "band_info": [{"name": "band"}],
+        "thumbnail": {"location": location.as_posix(), "size": 50},
+    }
+    item = RasterGenerator(config).generate()
+    assert item.assets["thumbnail"].media_type == "image/webp"
+    with rasterio.open(location) as thumbnail:
+        assert thumbnail.shape == (50, 50)
+        alpha = thumbnail.read(4)
+    assert alpha[-1, 0] == 255
+    assert alpha[0, -1] == 0
+
+
+def test_given_thumbnail_with_unsupported_format_expects_raises() -> None:
+    with pytest.raises(ValueError, match="png or webp"):
+        RasterConfig(**JSON_CONFIGS[0], thumbnail={"location": "thumbnail.jpg"})
@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import rasterio
+import shapely
+from rasterio.windows import Window
+
+from stac_generator.core.base.utils import read_source_config, reproject_bounds
+from stac_generator.core.raster.generator import RasterGenerator, RasterMosaicGenerator
+from stac_generator.core.raster.schema import RasterMosaicConfig
+from stac_generator.exceptions import StacConfigException
+from stac_generator.factory import StacGeneratorFactory
+
+CONFIG = read_source_config("tests/files/integration_tests/raster/config/raster_config.json")[0]
+
+
+def write_tile(src: rasterio.DatasetReader, window: Window, path: Path, **kwargs: object) -> None:
+    profile = {
+        **src.profile,
+        "width": window.width,
+        "height": window.height,
+        "transform": src.window_transform(window),
+        **kwargs,
+    }
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(src.read(window=window))
+
+
+@pytest.fixture
+def tile_dir(tmp_path: Path) -> Path:
+    """Source raster split into 2x2 tiles"""
+    with rasterio.open(CONFIG["location"]) as src:
+        half_x, half_y = src.width // 2, src.height // 2
+        for row, (row_off, height) in enumerate([(0, half_y), (half_y, src.height - half_y)]):
+            for col, (col_off, width) in enumerate([(0, half_x), (half_x, src.width - half_x)]):
+                window = Window(col_off, row_off, width, height)
+                write_tile(src, window, tmp_path / f"tile_{row}_{col}.tif")
+    return tmp_path
+
+
+def mosaic_config(location: str | list[str], **kwargs: object) -> dict[str, object]:
+    return {**CONFIG, "id": "mosaic", "location": location, **kwargs}
+
+
+def test_mosaic_given_glob_expects_same_extent_as_source(tile_dir: Path) -> None:
+    vrt = tile_dir / "mosaic.vrt"
+    config = mosaic_config((tile_dir / "*.tif").as_posix(), vrt=vrt.as_posix())
+    item = RasterMosaicGenerator(config).generate()
+    source_item = RasterGenerator(CONFIG).generate()
+    np.testing.assert_array_almost_equal(item.bbox, source_item.bbox, decimal=2)
+    assert item.properties["proj:shape"] == source_item.properties["proj:shape"]
+    np.testing.assert_array_almost_equal(
+        item.properties["proj:transform"], source_item.properties["proj:transform"]
+    )
+    assert sorted(item.assets) == ["data", "tile_0", "tile_1", "tile_2", "tile_3"]
+    assert item.assets["data"].href == vrt.as_posix()
+    with rasterio.open(vrt) as mosaic, rasterio.open(CONFIG["location"]) as src:
+        np.testing.assert_array_equal(mosaic.read(), src.read())
+
+
+def test_mosaic_given_statistics_expects_computed_from_vrt(tile_dir: Path) -> None:
+    config = mosaic_config(
+        (tile_dir / "*.tif").as_posix(),
+        vrt=(tile_dir / "mosaic.vrt").as_posix(),
+        statistics={"mode": "exact"},
+    )
+    item = RasterMosaicGenerator(config).generate().to_dict()
+    source = RasterGenerator({**CONFIG, "statistics": {"mode": "exact"}}).generate().to_dict()
+    for band, expected in zip(
+        item["assets"]["data"]["raster:bands"],
+        source["assets"]["data"]["raster:bands"],
+        strict=True,
+    ):
+        assert band["statistics"] == pytest.approx(expected["statistics"])
+
+
+def test_mosaic_given_valid_data_footprint_expects_union_of_tiles(tile_dir: Path) -> None:
+    tiles = sorted(path.as_posix() for path in tile_dir.glob("*.tif"))[:3]
+    config = mosaic_config(tiles, footprint={"method": "valid_data"})
+    item = RasterMosaicGenerator(config).generate()
+    geometry = shapely.geometry.shape(item.geometry)
+    # Three of four quadrants
+    assert geometry.area / shapely.box(*item.bbox).area == pytest.approx(0.75, abs=0.05)
+    assert "data" not in item.assets
+
+
+def test_mosaic_given_simplified_footprint_expects_bbox_from_tile_bounds(tile_dir: Path) -> None:
+    tiles = sorted(path.as_posix() for path in tile_dir.glob("*.tif"))[:3]
+    config = mosaic_config(tiles, footprint={"method": "valid_data", "max_vertices": 5})
+    item = RasterMosaicGenerator(config).generate()
+    with rasterio.open(CONFIG["location"]) as src:
+        expected = reproject_bounds(src.bounds, src.crs)
+    assert item.bbox == pytest.approx(list(expected))
+    assert shapely.box(*item.bbox).covers(shapely.geometry.shape(item.geometry))
+
+
+def test_mosaic_expects_shared_fields_on_item(tile_dir: Path) -> None:
+    item = RasterMosaicGenerator(mosaic_config((tile_dir / "*.tif").as_posix())).generate()
+    source = RasterGenerator(CONFIG).generate().to_dict()
+    assert item.properties["proj:wkt2"] == source["properties"]["proj:wkt2"]
+    assert item.properties["eo:bands"] == source["assets"]["data"]["eo:bands"]
+    assert item.properties["raster:bands"] == source["assets"]["data"]["raster:bands"]
+    for key, asset in item.to_dict()["assets"].items():
+        assert set(asset) == {"href", "type", "title", "roles", "proj:shape", "proj:transform"}, key
+
+
+def test_factory_given_glob_or_list_location_expects_mosaic_generator(tile_dir: Path) -> None:
+    tiles = sorted(path.as_posix() for path in tile_dir.glob("*.tif"))
+    generators = StacGeneratorFactory.get_item_generators(
+        [mosaic_config((tile_dir / "*.tif").as_posix()), mosaic_config(tiles), CONFIG]
+    )
+    assert [type(generator) for generator in generators] == [
+        RasterMosaicGenerator,
+        RasterMosaicGenerator,
+        RasterGenerator,
+    ]
+    assert isinstance(generators[0].config, RasterMosaicConfig)
+    assert generators[0].config.tiles == tiles
+
+
+def test_mosaic_given_different_crs_expects_raises(tile_dir: Path) -> None:
+    with rasterio.open(CONFIG["location"]) as src:
+        write_tile(src, Window(0, 0, 10, 10), tile_dir / "tile_z.tif", crs="EPSG:32634")
+    with pytest.raises(StacConfigException, match="crs"):
+        RasterMosaicGenerator(mosaic_config((tile_dir / "*.tif").as_posix())).generate()
+
+
+def test_mosaic_given_misaligned_tile_expects_raises(tile_dir: Path) -> None:
+    with rasterio.open(CONFIG["location"]) as src:
+        transform = src.window_transform(Window(0, 0, 10, 10))
+        write_tile(
+            src,
+            Window(0, 0, 10, 10),
+            tile_dir / "tile_z.tif",
+            transform=transform * transform.translation(0.5, 0),
+        )
+    with pytest.raises(StacConfigException, match="grid alignment"):
+        RasterMosaicGenerator(mosaic_config((tile_dir / "*.tif").as_posix())).generate()
+
+
+def test_mosaic_given_no_matching_tile_expects_raises(tmp_path: Path) -> None:
+    with pytest.raises(StacConfigException):
+        RasterMosaicGenerator(mosaic_config((tmp_path / "*.tif").as_posix())).generate()
+
+
+def test_mosaic_given_thumbnail_expects_thumbnail_from_vrt(tile_dir: Path) -> None:
+    thumbnail = tile_dir / "mosaic.png"
+    config = mosaic_config(
+        (tile_dir / "*.tif").as_posix(),
+        vrt=(tile_dir / "mosaic.vrt").as_posix(),
+        thumbnail={"location": thumbnail.as_posix(), "size": 100},
+    )
+    item = RasterMosaicGenerator(config).generate()
+    assert item.assets["thumbnail"].href == thumbnail.as_posix()
+    with rasterio.open(thumbnail) as src:
+        assert src.shape == (85, 85)
@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import rasterio
+import shapely
+from rasterio.enums import Resampling
+
+from stac_generator.core.base.utils import read_source_config, reproject_bounds
+from stac_generator.core.raster.generator import RasterGenerator, RasterMultiAssetGenerator
+from stac_generator.core.raster.schema import RasterMultiAssetConfig
+from stac_generator.exceptions import StacConfigException
+from stac_generator.factory import StacGeneratorFactory
+
+CONFIG = read_source_config("tests/files/integration_tests/raster/config/raster_config.json")[0]
+
+
+def write_band(path: Path, band: int, scale: int = 1, shift: float = 0) -> str:
+    """Write a band of the source raster to its own file, optionally at a coarser resolution"""
+    with rasterio.open(CONFIG["location"]) as src:
+        height, width = src.height // scale, src.width // scale
+        transform = src.transform * src.transform.scale(src.width / width, src.height / height)
+        profile = {
+            **src.profile,
+            "count": 1,
+            "width": width,
+            "height": height,
+            "transform": transform * transform.translation(shift, 0),
+        }
+        data = src.read(band, out_shape=(height, width), resampling=Resampling.average)
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(data, 1)
+    return path.as_posix()
+
+
+@pytest.fixture
+def band_files(tmp_path: Path) -> list[str]:
+    return [write_band(tmp_path / f"band_{band}.tif", band) for band in range(1, 4)]
+
+
+def multi_asset_config(locations: list[str], **kwargs: Any) -> dict[str, Any]:
+    return {
+        **CONFIG,
+        "location": str(Path(locations[0]).parent),
+        "band_info": [
+            {**band, "location": location}
+            for band, location in zip(CONFIG["band_info"], locations, strict=True)
+        ],
+        **kwargs,
+    }
+
+
+def test_multi_asset_expects_asset_per_band(band_files: list[str]) -> None:
+    item = RasterMultiAssetGenerator(multi_asset_config(band_files)).generate()
+    source = RasterGenerator(CONFIG).generate()
+    np.testing.assert_allclose(item.bbox, source.bbox, atol=0.02)
+    assert item.properties["proj:shape"] == source.properties["proj:shape"]
+    assert list(item.assets) == ["b04", "b03", "b02"]
+    for key, location, band in zip(item.assets, band_files, CONFIG["band_info"], strict=True):
+        asset = item.assets[key].to_dict()
+        assert asset["href"] == location
+        assert asset["title"] == band["description"]
+        assert asset["proj:shape"] == [343, 343]
+        assert [eo_band["common_name"] for eo_band in asset["eo:bands"]] == [band["common_name"]]
+        assert asset["raster:bands"] == [{"nodata": 0.0, "data_type": "uint8"}]
+
+
+def test_multi_asset_given_different_resolutions_expects_shape_per_asset(
+    tmp_path: Path, band_files: list[str]
+) -> None:
+    band_files[2] = write_band(tmp_path / "band_3_coarse.tif", 3, scale=2)
+    item = RasterMultiAssetGenerator(multi_asset_config(band_files)).generate()
+    assert "proj:shape" not in item.properties
+    assert item.properties["proj:code"] == "EPSG:32633"
+    assert item.assets["b04"].to_dict()["proj:shape"] == [343, 343]
+    assert item.assets["b02"].to_dict()["proj:shape"] == [171, 171]
+
+
+def test_multi_asset_given_statistics_expects_same_as_single_file(band_files: list[str]) -> None:
+    statistics = {"mode": "exact"}
+    item = RasterMultiAssetGenerator(
+        multi_asset_config(band_files, statistics=statistics)
+    ).generate()
+    source = RasterGenerator({**CONFIG, "statistics": statistics}).generate().to_dict()
+    for key, expected in zip(item.assets, source["assets"]["data"]["raster:bands"], strict=True):
+        actual = item.assets[key].to_dict()["raster:bands"][0]
+        assert actual["statistics"] == pytest.approx(expected["statistics"])
+
+
+def test_multi_asset_given_shared_file_expects_single_asset() -> None:
+    config = multi_asset_config([CONFIG["location"]] * 3)
+    item = RasterMultiAssetGenerator(config).generate()
+    assert list(item.assets) == ["L2A_PVI"]
+    assert len(item.assets["L2A_PVI"].to_dict()["eo:bands"]) == 3
+
+
+def test_multi_asset_given_shifted_band_expects_raises(
+    tmp_path: Path, band_files: list[str]
+) -> None:
+    band_files[1] = write_band(tmp_path / "band_2_shifted.tif", 2, shift=10)
+    with pytest.raises(StacConfigException, match="extent"):
+        RasterMultiAssetGenerator(multi_asset_config(band_files)).generate()
+
+
+def test_multi_asset_given_valid_data_footprint_expects_bbox_from_shared_extent(
+    band_files: list[str],
+) -> None:
+    config = multi_asset_config(band_files, footprint={"method": "valid_data", "max_vertices": 5})
+    item = RasterMultiAssetGenerator(config).generate()
+    with rasterio.open(CONFIG["location"]) as src:
+        expected = reproject_bounds(src.bounds, src.crs)
+    assert item.bbox == pytest.approx(list(expected))
+    assert shapely.box(*item.bbox).covers(shapely.geometry.shape(item.geometry))
+
+
+def test_multi_asset_given_no_valid_data_expects_shared_extent(tmp_path: Path) -> None:
+    band_files = []
+    for band in range(1, 4):
+        location = write_band(tmp_path / f"band_{band}.tif", band)
+        with rasterio.open(location, "r+") as dst:
+            dst.write(np.full(dst.shape, dst.nodata, dtype=dst.dtypes[0]), 1)
+        band_files.append(location)
+    config = multi_asset_config(band_files, footprint={"method": "valid_data"})
+    item = RasterMultiAssetGenerator(config).generate()
+    with rasterio.open(CONFIG["location"]) as src:
+        expected = reproject_bounds(src.bounds, src.crs)
+    assert item.bbox == pytest.approx(list(expected))
+
+
+def test_factory_given_band_locations_expects_multi_asset_generator(
+    band_files: list[str],
+) -> None:
+    generators = StacGeneratorFactory.get_item_generators(multi_asset_config(band_files))
+    assert isinstance(generators[0], RasterMultiAssetGenerator)
+    assert isinstance(generators[0].config, RasterMultiAssetConfig)
@@ -0,0 +1,148 @@
+import math
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.control import GroundControlPoint
+from rasterio.transform import Affine, from_origin
+
+from stac_generator.core.base.utils import read_source_config
+from stac_generator.core.raster.generator import RasterGenerator
+from stac_generator.core.raster.tiff import read_geotiff_header
+
+CONFIG = read_source_config("tests/files/integration_tests/raster/config/raster_config.json")[0]
+TRANSFORM = from_origin(300000, 6000000, 10, 10)
+
+
+def write_tiff(path: Path, dtype: str = "uint8", count: int = 1, **profile: Any) -> Path:
+    profile = {
+        "driver": "GTiff",
+        "width": 7,
+        "height": 5,
+        "count": count,
+        "dtype": dtype,
+        "crs": "EPSG:32755",
+        "transform": TRANSFORM,
+        **profile,
+    }
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(np.ones((count, 5, 7), dtype=dtype))
+    return path
+
+
+def assert_parity(path: Path) -> None:
+    header = read_geotiff_header(path)
+    assert header is not None
+    with rasterio.open(path) as src:
+        assert header.crs == src.crs
+        assert header.transform.almost_equals(src.transform)
+        assert (header.width, header.height) == (src.width, src.height)
+        assert header.dtypes == src.dtypes
+        assert header.bounds == pytest.approx(tuple(src.bounds))
+        if src.nodata is not None and math.isnan(src.nodata):
+            assert header.nodata is not None
+            assert math.isnan(header.nodata)
+        else:
+            assert header.nodata == src.nodata
+
+
+@pytest.mark.parametrize(
+    "crs", ["EPSG:4326", "EPSG:4283", "EPSG:3857", "EPSG:3577", "EPSG:7855", "EPSG:2229"]
+)
+def test_parity_given_epsg_crs(tmp_path: Path, crs: str) -> None:
+    assert_parity(write_tiff(tmp_path / "raster.tif", crs=crs))
+
+
+@pytest.mark.parametrize(
+    "dtype, nodata",
+    [
+        ("uint8", None),
+        ("uint8", 255),
+        ("int8", -1),
+        ("uint16", 0),
+        ("int16", -9999),
+        ("uint32", 0),
+        ("int32", -9999),
+        ("int64", -1),
+        ("uint64", None),
+        ("float32", -3.4e38),
+        ("float32", math.nan),
+        ("float64", -9999.5),
+    ],
+)
+def test_parity_given_dtype_and_nodata(tmp_path: Path, dtype: str, nodata: float | None) -> None:
+    assert_parity(write_tiff(tmp_path / "raster.tif", dtype, count=3, nodata=nodata))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"BIGTIFF": "YES"},
+        {"ENDIANNESS": "BIG"},
+        {"TILED": "YES", "BLOCKXSIZE": 16, "BLOCKYSIZE": 16, "COMPRESS": "DEFLATE"},
+        {"INTERLEAVE": "BAND", "COMPRESS": "LZW"},
+        {"transform": Affine.rotation(15) * TRANSFORM},
+    ],
+)
+def test_parity_given_layout(tmp_path: Path, options: dict[str, Any]) -> None:
+    assert_parity(write_tiff(tmp_path / "raster.tif", "int16", count=4, **options))
+
+
+def test_parity_given_sample_asset() -> None:
+    assert_parity(Path(CONFIG["location"]))
+
+
+def test_fallback_given_custom_crs(tmp_path: Path) -> None:
+    path = write_tiff(tmp_path / "raster.tif", crs="+proj=tmerc +lon_0=147 +ellps=GRS80 +units=m")
+    assert read_geotiff_header(path) is None
+
+
+def test_fallback_given_pixel_is_point(tmp_path: Path) -> None:
+    path = write_tiff(tmp_path / "raster.tif")
+    with rasterio.open(path, "r+") as dst:
+        dst.update_tags(AREA_OR_POINT="Point")
+    assert read_geotiff_header(path) is None
+
+
+def test_fallback_given_ground_control_points(tmp_path: Path) -> None:
+    gcps = [
+        GroundControlPoint(row, col, 300000 + col * 10, 6000000 - row * 10)
+        for row, col in [(0, 0), (0, 7), (5, 0)]
+    ]
+    path = write_tiff(tmp_path / "raster.tif", transform=None, gcps=gcps)
+    assert read_geotiff_header(path) is None
+
+
+def test_fallback_given_complex_dtype(tmp_path: Path) -> None:
+    assert read_geotiff_header(write_tiff(tmp_path / "raster.tif", "complex64")) is None
+
+
+def test_fallback_given_pam_sidecar(tmp_path: Path) -> None:
+    path = write_tiff(tmp_path / "raster.tif")
+    Path(f"{path}.aux.xml").write_text("<PAMDataset></PAMDataset>")
+    assert read_geotiff_header(path) is None
+
+
+def test_fallback_given_not_a_tiff(tmp_path: Path) -> None:
+    path = tmp_path / "raster.tif"
+    path.write_text("not a tiff")
+    assert read_geotiff_header(path) is None
+    (tmp_path / "empty.tif").touch()
+    assert read_geotiff_header(tmp_path / "empty.tif") is None
+
+
+def test_raster_generator_given_fast_header_expects_same_item_without_gdal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    location = shutil.copy(CONFIG["location"], tmp_path / "raster.tif")
+    expected = RasterGenerator({**CONFIG, "location": location, "fast_header": False}).generate()
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("rasterio.open should not be called")
+
+    monkeypatch.setattr(rasterio, "open", fail)
+    actual = RasterGenerator({**CONFIG, "location": location}).generate()
+    assert actual.to_dict() == expected.to_dict()
@@ -18,6 +18,7 @@ from stac_generator.core.point.schema import PointConfig, PointOwnConfig
 from stac_generator.core.raster.schema import RasterOwnConfig
 from stac_generator.core.vector import VectorGenerator
 from stac_generator.core.vector.schema import VectorConfig, VectorOwnConfig
+from stac_generator.exceptions import StacConfigException
 from stac_generator.factory import StacGeneratorFactory
 from tests.utils import compare_extent, compare_items
 
@@ -517,3 +518,160 @@ def test_given_non_stac_generated_item_get_href_raises(
 ) -> None:
     with pytest.raises(KeyError):
         StacGeneratorFactory.get_item_asset_href(non_compliant_stac_item)
+
+
+SHARED_POINT_CONFIGS = [
+    {
+        "id": f"adelaide_airport_{column}",
+        "location": "tests/files/integration_tests/point/data/adelaide_airport.csv",
+        "collection_date": "2023-01-01",
+        "collection_time": "09:00:00",
+        "X": "longitude",
+        "Y": "latitude",
+        "T": "YYYY-MM-DD",
+        "epsg": 7843,
+        "column_info": [{"name": column}],
+    }
+    for column in ("daily_rain", "max_temp", "min_temp")
+]
+SHARED_VECTOR_CONFIGS = [
+    {
+        "id": f"werribee_{idx}",
+        "location": "tests/files/unit_tests/vectors/Werribee.geojson",
+        "collection_date": "2025-01-01",
+        "collection_time": "00:00:00",
+        "column_info": [{"name": "Suburb_Name"}],
+    }
+    for idx in range(3)
+]
+
+
+@pytest.fixture
+def read_counter(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    from stac_generator.core.base import utils
+
+    counter = {"csv": 0, "vector": 0}
+    read_csv, read_file = pd.read_csv, utils.gpd.read_file
+
+    def counted_read_csv(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        counter["csv"] += 1
+        return read_csv(*args, **kwargs)
+
+    def counted_read_file(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        counter["vector"] += 1
+        return read_file(*args, **kwargs)
+
+    monkeypatch.setattr(utils.pd, "read_csv", counted_read_csv)
+    monkeypatch.setattr(utils.gpd, "read_file", counted_read_file)
+    return counter
+
+
+def test_given_shared_location_expects_single_read(read_counter: dict[str, int]) -> None:
+    configs = SHARED_POINT_CONFIGS + SHARED_VECTOR_CONFIGS
+    expected = [
+        generator.generate().to_dict()
+        for generator in StacGeneratorFactory.get_item_generators(configs)
+    ]
+    assert read_counter == {"csv": 3, "vector": 3}
+    read_counter.update(csv=0, vector=0)
+    generator = StacGeneratorFactory.get_collection_generator(configs, collection_config)
+    assert generator.plan_groups() == [[0, 1, 2], [3, 4, 5]]
+    collection = generator()
+    assert read_counter == {"csv": 1, "vector": 1}
+    actual = [item.to_dict() for item in collection.get_items()]
+    assert [item["id"] for item in actual] == [config["id"] for config in configs]
+    for exp, act in zip(expected, actual):
+        for key in ("id", "bbox", "geometry", "properties", "assets"):
+            assert exp[key] == act[key]
+
+
+def test_given_multi_layer_expects_datasource_read_in_one_pass(
+    read_counter: dict[str, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from stac_generator.core.base import utils
+
+    calls = {"list_layers": 0, "read_vector_layers": 0}
+    list_layers, read_vector_layers = utils.pyogrio.list_layers, utils.read_vector_layers
+
+    def counted_list_layers(*args: Any, **kwargs: Any) -> Any:
+        calls["list_layers"] += 1
+        return list_layers(*args, **kwargs)
+
+    def counted_read_vector_layers(*args: Any, **kwargs: Any) -> Any:
+        calls["read_vector_layers"] += 1
+        return read_vector_layers(*args, **kwargs)
+
+    monkeypatch.setattr(utils.pyogrio, "list_layers", counted_list_layers)
+    monkeypatch.setattr(utils, "read_vector_layers", counted_read_vector_layers)
+    config = {
+        "id": "SA2",
+        "location": "tests/files/unit_tests/vectors/SA2.zip",
+        "collection_date": "2025-01-01",
+        "collection_time": "00:00:00",
+        "layer": "*",
+    }
+    generator = StacGeneratorFactory.get_collection_generator(config, collection_config)
+    assert generator.plan_groups() == [[0, 1]]
+    collection = generator()
+    assert [item.id for item in collection.get_items()] == ["SA2_Sunbury", "SA2_Werribee"]
+    # Layers are listed once, then read in a single pass by one worker
+    assert calls == {"list_layers": 1, "read_vector_layers": 1}
+    assert read_counter["vector"] == 2
+
+
+def test_given_shared_location_with_different_date_columns_expects_own_dtypes(
+    read_counter: dict[str, int], tmp_path: Path
+) -> None:
+    from stac_generator.core.base.utils import ReadPlan, read_point_asset, shared_reads
+
+    path = tmp_path / "dates.csv"
+    path.write_text(
+        "x,y,start,end\n138.5,-34.9,2023-01-01,2023-01-02\n138.6,-34.8,2023-01-03,2023-01-04\n"
+    )
+    configs = [
+        {
+            "id": date_col,
+            "location": path.as_posix(),
+            "collection_date": "2025-01-01",
+            "collection_time": "00:00:00",
+            "X": "x",
+            "Y": "y",
+            "T": date_col,
+            "column_info": [{"name": other}],
+        }
+        for date_col, other in (("start", "end"), ("end", "start"))
+    ]
+    generators = StacGeneratorFactory.get_item_generators(configs)
+
+    def read(config: PointConfig) -> pd.DataFrame:
+        return read_point_asset(
+            config.location,
+            config.X,
+            config.Y,
+            config.epsg,
+            T_coord=config.T,
+            columns=config.column_info,
+        )
+
+    expected = [read(generator.config) for generator in generators]
+    read_counter.update(csv=0)
+    with shared_reads(
+        ReadPlan(req for generator in generators for req in generator.read_requests())
+    ):
+        actual = [read(generator.config) for generator in generators]
+    assert read_counter["csv"] == 1
+    for exp, act in zip(expected, actual, strict=True):
+        pd.testing.assert_frame_equal(exp, act)
+    # Each config only gets its own date column parsed
+    assert actual[0]["end"].dtype == object
+    assert actual[1]["start"].dtype == object
+
+
+def test_given_shared_location_with_invalid_column_expects_raises() -> None:
+    configs = [
+        *SHARED_POINT_CONFIGS,
+        {**SHARED_POINT_CONFIGS[0], "id": "invalid", "column_info": [{"name": "invalid"}]},
+    ]
+    generator = StacGeneratorFactory.get_collection_generator(configs, collection_config)
+    with pytest.raises(StacConfigException):
+        generator()
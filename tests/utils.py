@@ -1,3 +1,9 @@
+import functools
+import http.server
+import io
+import multiprocessing
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -34,3 +40,65 @@ def compare_extent(exp: dict[str, Any], ref: dict[str, Any]) -> None:
     np.testing.assert_array_almost_equal(
         exp["extent"]["spatial"]["bbox"], ref["extent"]["spatial"]["bbox"]
     )
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler with single range support, as required by GDAL's /vsicurl/"""
+
+    requests: Any = []
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def send_head(self) -> Any:
+        self.requests.append((self.command, self.path, dict(self.headers)))
+        header = self.headers.get("Range")
+        if header is None:
+            return super().send_head()
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self.send_error(404)
+            return None
+        size = path.stat().st_size
+        start_str, end_str = header.removeprefix("bytes=").split("-")
+        start = int(start_str)
+        end = min(int(end_str) if end_str else size - 1, size - 1)
+        with path.open("rb") as file:
+            file.seek(start)
+            data = file.read(end - start + 1)
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return io.BytesIO(data)
+
+
+def _serve(directory: str, requests: Any, port: Any) -> None:
+    RangeRequestHandler.requests = requests
+    handler = functools.partial(RangeRequestHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    port.put(server.server_address[1])
+    server.serve_forever()
+
+
+@contextmanager
+def serve_directory(directory: str | Path) -> Iterator[tuple[str, Any]]:
+    """Serve directory over http on localhost from a child process.
+
+    GDAL drivers may hold the GIL while reading, so the server cannot share the test's interpreter.
+    Yields the base url and the list of (method, path, headers) received by the server.
+    """
+    with multiprocessing.Manager() as manager:
+        requests = manager.list()
+        port = manager.Queue()
+        process = multiprocessing.Process(
+            target=_serve, args=(str(directory), requests, port), daemon=True
+        )
+        process.start()
+        try:
+            yield f"http://127.0.0.1:{port.get(timeout=10)}", requests
+        finally:
+            process.terminate()
+            process.join()
@@ -1,16 +1,20 @@
 import datetime
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
+import shapely
 
 from stac_generator.core.base.generator import CollectionGenerator
 from stac_generator.core.base.schema import StacCollectionConfig
-from stac_generator.core.base.utils import read_source_config
+from stac_generator.core.base.utils import read_source_config, read_vector_asset
 from stac_generator.core.vector.generator import VectorGenerator
 from stac_generator.core.vector.schema import JoinConfig, VectorConfig
 from stac_generator.exceptions import SourceAssetException, StacConfigException
-from tests.utils import compare_extent, compare_items
+from stac_generator.factory import StacGeneratorFactory
+from tests.utils import compare_extent, compare_items, serve_directory
 
 CONFIG_JSON = Path("tests/files/integration_tests/vector/config/vector_config.json")
 
@@ -44,6 +48,58 @@ def test_generator_given_item_expects_matched_generated_item(
     compare_items(expected, actual)
 
 
+@pytest.fixture(scope="module")
+def file_server() -> Iterator[tuple[str, Any]]:
+    with serve_directory("tests/files") as server:
+        yield server
+
+
+@pytest.mark.parametrize("item_idx", range(len(CONFIGS)), ids=ITEM_IDS)
+def test_generator_given_remote_item_expects_same_as_local(
+    item_idx: int, vector_generators: list[VectorGenerator], file_server: tuple[str, Any]
+) -> None:
+    base_url, requests = file_server
+    config = CONFIGS[item_idx]
+    remote_config = {
+        **config,
+        "location": config["location"].replace("tests/files", base_url),
+        "cookies": {"session": "secret"},
+    }
+    expected = vector_generators[item_idx].generate().to_dict()
+    actual = VectorGenerator(remote_config).generate().to_dict()
+    assert actual["bbox"] == expected["bbox"]
+    assert actual["geometry"] == expected["geometry"]
+    assert actual["assets"]["data"]["href"] == remote_config["location"]
+    name = Path(config["location"]).name
+    served = [request for request in requests if request[1].endswith(name)]
+    assert served
+    assert all("session=secret" in headers.get("Cookie", "") for _, _, headers in served)
+    # No directory listing or sidecar probing
+    locations = {Path(config["location"]).name for config in CONFIGS}
+    assert all(Path(path).name in locations for _, path, _ in requests)
+
+
+def test_generator_given_remote_item_with_params_expects_params_sent(
+    vector_generators: list[VectorGenerator], file_server: tuple[str, Any]
+) -> None:
+    base_url, requests = file_server
+    config = CONFIGS[0]
+    remote_config = {
+        **config,
+        "location": config["location"].replace("tests/files", base_url),
+        "params": {"token": "secret"},
+    }
+    expected = vector_generators[0].generate().to_dict()
+    start = len(requests)
+    actual = VectorGenerator(remote_config).generate().to_dict()
+    assert actual["bbox"] == expected["bbox"]
+    assert actual["assets"]["data"]["href"] == remote_config["location"]
+    name = Path(config["location"]).name
+    served = [path for _, path, _ in requests[start:] if name in path]
+    assert served
+    assert all(path.endswith(f"{name}?token=secret") for path in served)
+
+
 def test_collection_generator(collection_generator: CollectionGenerator) -> None:
     actual = collection_generator().to_dict()
     expected_path = GENERATED_DIR / "collection.json"
@@ -126,3 +182,51 @@ def test_given_duplicated_id_expects_raises() -> None:
     with pytest.raises(StacConfigException):
         generators = [VectorGenerator(cfg) for cfg in config]
         CollectionGenerator(StacCollectionConfig(id="Collecton"), generators)
+
+
+@pytest.mark.parametrize("method", ["bbox", "convex_hull", "concave_hull", "simplify", "coverage"])
+def test_given_footprint_method_expects_geometry_within_bbox(method: str) -> None:
+    config = VectorConfig.model_validate(
+        {
+            "id": "lga",
+            "location": "tests/files/integration_tests/vector/data/lga.gpkg",
+            "collection_date": "2025-01-01",
+            "collection_time": "00:00:00",
+            "footprint": {"method": method, "max_vertices": 100},
+        }
+    )
+    item = VectorGenerator(config).generate()
+    geometry = shapely.geometry.shape(item.geometry)
+    assert shapely.get_num_coordinates(geometry) <= 100
+    assert shapely.box(*item.bbox).buffer(1e-9).contains(geometry)
+    assert item.properties["stac_generator"]["footprint"] == {"method": method, "max_vertices": 100}
+    assert StacGeneratorFactory.extract_item_config(item).footprint == config.footprint
+
+
+@pytest.mark.parametrize("method", ["convex_hull", "concave_hull", "simplify", "coverage"])
+@pytest.mark.parametrize(
+    "location",
+    [
+        "tests/files/integration_tests/vector/data/lga.gpkg",
+        "tests/files/integration_tests/vector/data/soil_subgroup.zip",
+    ],
+)
+def test_given_simplified_footprint_expects_bbox_and_footprint_cover_data(
+    method: str, location: str
+) -> None:
+    config = VectorConfig.model_validate(
+        {
+            "id": "item",
+            "location": location,
+            "collection_date": "2025-01-01",
+            "collection_time": "00:00:00",
+            "footprint": {"method": method, "max_vertices": 20},
+        }
+    )
+    item = VectorGenerator(config).generate()
+    df = read_vector_asset(location).to_crs(4326)
+    minx, miny, maxx, maxy = df.total_bounds
+    assert item.bbox[0] <= minx and item.bbox[1] <= miny
+    assert item.bbox[2] >= maxx and item.bbox[3] >= maxy
+    footprint = shapely.geometry.shape(item.geometry).buffer(1e-6)
+    assert shapely.covers(footprint, df.geometry.to_numpy()).all()
@@ -9,6 +9,7 @@ import pytest
 from stac_generator.core.base.utils import read_source_config
 from stac_generator.core.vector.generator import VectorGenerator
 from stac_generator.exceptions import StacConfigException
+from stac_generator.factory import StacGeneratorFactory
 
 CONFIG_PATH = Path("tests/files/unit_tests/vectors/configs")
 
@@ -105,6 +106,38 @@ def test_given_layers_info_expects_multiple_layers() -> None:
     assert items[1].id == "Werribee"
 
 
+@pytest.mark.parametrize("layer", ["*", ["Sunbury", "Werribee"]], ids=["all", "list"])
+def test_given_multi_layer_expects_one_item_per_layer(layer: str | list[str]) -> None:
+    config = {
+        "id": "SA2",
+        "location": "tests/files/unit_tests/vectors/SA2.zip",
+        "collection_date": "2025-01-01",
+        "collection_time": "00:00:00",
+        "layer": layer,
+    }
+    generators = StacGeneratorFactory.get_item_generators(config)
+    items = [generator.generate() for generator in generators]
+    assert [item.id for item in items] == ["SA2_Sunbury", "SA2_Werribee"]
+    for actual, expected in zip(items, load_items("with_layer.json")):
+        assert actual.properties["stac_generator"]["layer"] == expected.id
+        assert actual.geometry == expected.geometry
+        assert actual.bbox == expected.bbox
+
+
+def test_given_multi_layer_not_expanded_expects_throw() -> None:
+    generator = VectorGenerator(
+        {
+            "id": "SA2",
+            "location": "tests/files/unit_tests/vectors/SA2.zip",
+            "collection_date": "2025-01-01",
+            "collection_time": "00:00:00",
+            "layer": "*",
+        }
+    )
+    with pytest.raises(StacConfigException):
+        generator.generate()
+
+
 def test_given_join_file_invalid_config_left_on_undescribed_expects_throw() -> None:
     with pytest.raises(ValueError):
         load_item("join_invalid_config_left_on_undescribed.json")